@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+
+@pytest.mark.parametrize("cls_name", ["LogicalFunction", "PhysicalComponent", "State"])
+def test_get_all_contents_by_type(benchmark, api, se, cls_name):
+    res = benchmark(se.get_all_contents_by_type, getattr(api, cls_name))
+
+    assert len(res) > 0
+
+
+def test_get_p_v_value(benchmark, api, se):
+    elements = [element for element in se.get_logical_architecture().get_all_contents_by_type(api.LogicalComponent) if len(api.PVMT.get_p_v_names(element)) > 0]
+    names = api.PVMT.get_p_v_names(elements[0])
+
+    def get_values():
+        return [api.PVMT.get_p_v_value(element, name) for element in elements for name in names]
+    res = benchmark(get_values)
+
+    assert len(res) == len(elements) * len(names)
+
+
+def test_requirement_traceability(benchmark, api, se):
+    functions = se.get_all_contents_by_type(api.LogicalFunction)
+    requirements = se.get_all_contents_by_type(api.Requirement)
+
+    def get_traceability():
+        incoming = [api.RequirementAddOn.get_incoming_requirements(function) for function in functions]
+        outgoing = [requirement.get_outgoing_linked_elems() for requirement in requirements]
+        return incoming, outgoing
+    incoming, outgoing = benchmark(get_traceability)
+
+    assert sum(len(requirements) for requirements in incoming) > 0
+    assert sum(len(elements) for elements in outgoing) > 0
+
+
+def test_build_traceability_matrix(benchmark, api, se):
+    matrix = benchmark(api.RequirementAddOn.build_traceability_matrix, se, (api.LogicalFunction, api.PhysicalFunction))
+
+    assert len(matrix.get_untraced_elements()) > 0
+
+
+def test_get_requirement_modules(benchmark, api, se):
+    functions = se.get_all_contents_by_type(api.LogicalFunction)
+
+    def get_modules():
+        return [api.RequirementAddOn.get_requirement_modules(function) for function in functions]
+    res = benchmark(get_modules)
+
+    assert all(len(modules) > 0 for modules in res)
+
+
+def test_extract_table(benchmark, api, se):
+    elements = se.get_all_contents_by_type(api.LogicalComponent) + se.get_all_contents_by_type(api.PhysicalComponent)
+    keys = [element.get_java_object().eContainer() for element in elements]
+
+    def rollup():
+        table = api.PVMT.extract_table(elements, ["PV1", "PV2"])
+        return api.PVMT.rollup(table["PV2"], keys), api.PVMT.get_statistics(table["PV2"])
+    res = benchmark(rollup)
+
+    assert res[1]["count"] > 0
+
+
+def test_set_p_v_values(benchmark, api, modified_model):
+    # the first round creates the property values, the next ones update them
+    functions = modified_model.get_system_engineering().get_all_contents_by_type(api.LogicalFunction)
+    values = dict((function, {"Progress": index % 100, "Status": "In progress"}) for index, function in enumerate(functions))
+    res = benchmark(api.PVMT.set_p_v_values, values, "Tracker", modified_model)
+
+    assert res["created"] + res["updated"] == 2 * len(values) and res["elements"] == len(values)
+
+
+def test_get_attributes_table(benchmark, api, se):
+    requirements = [requirement for requirement in se.get_all_contents_by_type(api.Requirement) if not isinstance(requirement, api.Folder)]
+    res = benchmark(api.Requirement.get_attributes_table, requirements, ["Priority", "Cost"])
+
+    assert len(res["Cost"]) == len(requirements)
+
+
+def test_export_reqif(benchmark, api, se, tmp_path):
+    module = se.get_all_contents_by_type(api.CapellaModule)[0]
+    path = str(tmp_path / "module.reqif")
+    benchmark(module.export_reqif, path)
+
+    assert os.path.getsize(path) > 0
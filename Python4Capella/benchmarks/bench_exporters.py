@@ -0,0 +1,71 @@
+import glob
+import os
+import sys
+
+import pytest
+
+from conftest import IFE_AIRD, SAMPLE_SCRIPTS
+from headless import run_script
+
+# the exporters open the IFE sample, the whole script is measured: reading the model, collecting the data and writing the xlsx file
+EXPORTERS = sorted(glob.glob(os.path.join(SAMPLE_SCRIPTS, "Export_*xlsx*.py")))
+
+
+@pytest.fixture
+def export(runtime, ife_workspace):
+    pytest.importorskip("openpyxl")
+
+    def run(script):
+        run_script(script, model_path = IFE_AIRD, workspace = ife_workspace)
+    yield run
+    # run_script() installs its own runtime
+    runtime.install()
+
+
+@pytest.mark.parametrize("script", EXPORTERS, ids = os.path.basename)
+def test_exporter(benchmark, export, script):
+    try:
+        export(script)
+    except NotImplementedError as e:
+        pytest.skip(str(e))
+
+    benchmark(export, script)
+
+
+@pytest.fixture(scope = "module")
+def xlsx_export(runtime):
+    pytest.importorskip("openpyxl")
+    runtime.include("workspace://Python4Capella/utilities/XlsxExport.py")
+    return sys.modules["__main__"]
+
+
+def write_framed_workbook(xlsx, path, rows):
+    # the exporters before XlsxExport: cells written one by one, then styled by walking the whole sheet
+    from openpyxl import Workbook
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.append(["Name", "Id", "Index"])
+    for row in rows:
+        worksheet.append(row)
+    for cell in worksheet[1]:
+        cell.font = xlsx.HEADER_FONT
+    for row in worksheet.iter_rows():
+        for cell in row:
+            cell.alignment = xlsx.TOP_WRAPPED_ALIGNMENT
+            cell.border = xlsx.FRAMED_BORDER
+    workbook.save(path)
+
+
+def write_framed_export(xlsx, path, rows):
+    export = xlsx.XlsxExport()
+    export.add_sheet("Sheet", [xlsx.XlsxColumn(header, **xlsx.FRAMED) for header in ["Name", "Id", "Index"]], rows)
+    export.save(path)
+
+
+@pytest.mark.parametrize("write", [write_framed_workbook, write_framed_export], ids = ["workbook", "write_only"])
+def test_xlsx_rows(benchmark, xlsx_export, tmp_path, write):
+    path = str(tmp_path / "rows.xlsx")
+    benchmark.pedantic(write, args = (xlsx_export, path, (("element " + str(index), "id-" + str(index), index) for index in range(100000))),
+                       setup = None, rounds = 1)
+
+    assert os.path.getsize(path) > 0
@@ -0,0 +1,41 @@
+import pytest
+
+from simulator.parsers.sismic_parser import SismicParser
+from simulator.sms.sismic_sm import SismicSM
+
+
+@pytest.fixture(scope = "module")
+def sessions(se):
+    return SismicParser().sessions(se)
+
+
+def test_sismic_parser_sessions(benchmark, se):
+    res = benchmark(SismicParser().sessions, se)
+
+    assert len(res) > 0
+
+
+def test_sismic_sm_build_steps(benchmark, sessions):
+    def build_steps():
+        return [SismicSM().build_steps(session) for session in sessions]
+    res = benchmark(build_steps)
+
+    assert all(len(steps["steps"]) > 0 for steps in res)
+
+
+def test_render_states(benchmark, model):
+    # render_states() shows the diagrams in a PySimpleGUI window and renders them with a PlantUML server
+    tkinter = pytest.importorskip("tkinter")
+    try:
+        tkinter.Tk().destroy()
+    except tkinter.TclError as e:
+        pytest.skip("no display: " + str(e))
+    from simulator.simulator import Simulator
+    simulator = Simulator(model, config = {"state_type": "sismic", "parser_type": "sismic"})
+    simulator.capella.build_command_interface([steps["name"] for steps in simulator.state_machine.states])
+    states = simulator.state_machine.next_step()
+
+    try:
+        benchmark(simulator.capella.render_states, states = states)
+    finally:
+        simulator.capella.command_interface.window.close()
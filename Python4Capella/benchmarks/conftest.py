@@ -0,0 +1,136 @@
+'''
+Benchmarks of the hot paths of the simplified API, of the xlsx exporters and of the simulator, run with
+pytest-benchmark without Capella (see headless) on a synthetic model (see headless.generator):
+
+    cd Python4Capella
+    python -m pytest benchmarks/bench_*.py [--baseline FILE] [--update-baseline] [--regression-threshold 0.2] [--model-elements 20000]
+
+The median time of each benchmark is compared with the one stored in the baseline JSON file, and the benchmark
+fails if it is slower by more than the threshold. Benchmarks missing from the baseline are added to it,
+--update-baseline replaces the stored medians. The timings only make sense on the machine that wrote the baseline,
+so the baseline is not part of the repository: it is stored in the cache folder of headless.cache by default
+(~/.cache/python4capella/benchmarks-baseline.json, or in the folder given by the PYTHON4CAPELLA_CACHE environment variable).
+'''
+import json
+import os
+import platform
+import shutil
+import sys
+
+import pytest
+
+BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+PYTHON4CAPELLA = os.path.dirname(BENCHMARKS)
+SAMPLE_SCRIPTS = os.path.join(PYTHON4CAPELLA, "sample_scripts")
+IFE_PROJECT = "In-Flight Entertainment System"
+IFE_AIRD = "/" + IFE_PROJECT + "/" + IFE_PROJECT + ".aird"
+
+# headless is imported from Python4Capella and the simulator package from the sample scripts, as in its tests
+for path in [PYTHON4CAPELLA, SAMPLE_SCRIPTS]:
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from headless import install, load_simplified_api
+from headless.cache import get_cache_folder
+from headless.ease import WORKSPACE
+from headless.generator import ModelGenerator, get_sizes
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("baseline", "benchmark baseline")
+    group.addoption("--baseline", default = os.path.join(get_cache_folder(), "benchmarks-baseline.json"), help = "the JSON file storing the baseline medians")
+    group.addoption("--update-baseline", action = "store_true", help = "stores the medians of this run in the baseline")
+    group.addoption("--regression-threshold", type = float, default = 0.2, help = "the relative slowdown of a median failing a benchmark (0.2 by default)")
+    group.addoption("--model-elements", type = int, default = 20000, help = "the approximate number of elements of the synthetic model")
+
+
+class Baseline(object):
+    """The median time of each benchmark, read from and written to a JSON file"""
+    def __init__(self, path, update, threshold):
+        self.path = path
+        self.update = update
+        self.threshold = threshold
+        self.medians = {}
+        if os.path.exists(path):
+            with open(path) as baseline_file:
+                self.medians = json.load(baseline_file)["medians"]
+        self.changed = False
+    def check(self, name, median):
+        """Records the given median, returns an error message if it is a regression"""
+        previous = self.medians.get(name)
+        if previous is None or self.update:
+            self.medians[name] = median
+            self.changed = True
+        elif median > previous * (1 + self.threshold):
+            return "%s: median %.6fs is %.0f%% slower than the baseline %.6fs (threshold %.0f%%)" % (
+                name, median, 100 * (median / previous - 1), previous, 100 * self.threshold)
+        return None
+    def save(self):
+        if not self.changed:
+            return
+        folder = os.path.dirname(self.path)
+        if folder and not os.path.isdir(folder):
+            os.makedirs(folder)
+        with open(self.path, "w") as baseline_file:
+            json.dump({"machine": platform.platform(), "python": platform.python_version(), "medians": self.medians}, baseline_file, indent = 2, sort_keys = True)
+    @pytest.hookimpl(hookwrapper = True)
+    def pytest_runtest_call(self, item):
+        outcome = yield
+        benchmark = item.funcargs.get("benchmark")
+        if outcome.excinfo is None and benchmark is not None and benchmark.stats is not None:
+            message = self.check(item.nodeid.split("/")[-1], benchmark.stats.stats.median)
+            if message is not None:
+                pytest.fail(message, pytrace = False)
+    def pytest_sessionfinish(self, session):
+        self.save()
+
+
+def pytest_configure(config):
+    # the options are only added when the benchmarks are given on the command line
+    if config.getoption("baseline", None) is not None:
+        options = config.option
+        config.pluginmanager.register(Baseline(options.baseline, options.update_baseline, options.regression_threshold), "baseline")
+
+
+@pytest.fixture(scope = "session")
+def runtime():
+    return install()
+
+
+@pytest.fixture(scope = "session")
+def api(runtime):
+    return load_simplified_api(runtime, ("capella", "requirement", "pvmt"))
+
+
+def open_generated_model(pytestconfig, runtime, api):
+    """Opens a new synthetic model of the size given on the command line"""
+    resource = ModelGenerator(**get_sizes(pytestconfig.getoption("model_elements"))).generate()
+    runtime.open_resource(resource)
+    res = api.CapellaModel()
+    res.open(api.SystemEngineering(runtime.getEngineering(runtime.current_session)))
+    return res
+
+
+@pytest.fixture(scope = "session")
+def model(pytestconfig, runtime, api):
+    return open_generated_model(pytestconfig, runtime, api)
+
+
+@pytest.fixture
+def modified_model(pytestconfig, runtime, api):
+    """A model of its own for the benchmarks modifying it, so they don't change the model of the other benchmarks"""
+    return open_generated_model(pytestconfig, runtime, api)
+
+
+@pytest.fixture(scope = "session")
+def se(model):
+    return model.get_system_engineering()
+
+
+@pytest.fixture(scope = "session")
+def ife_workspace(tmp_path_factory):
+    """A workspace with a copy of the IFE sample, the exported files are written in it"""
+    workspace = tmp_path_factory.mktemp("workspace")
+    os.mkdir(str(workspace / IFE_PROJECT))
+    shutil.copy(os.path.join(WORKSPACE, IFE_PROJECT, IFE_PROJECT + ".capella"), str(workspace / IFE_PROJECT))
+    return str(workspace)
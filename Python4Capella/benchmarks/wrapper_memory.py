@@ -0,0 +1,82 @@
+'''
+This script measures the memory used by the simplified API wrappers, compared to the previous
+wrappers which stored their Java object in a per instance __dict__.
+
+It runs outside of Capella: the simplified API is loaded with a minimal replacement of the EASE
+include() and loadModule() functions, and wraps placeholder objects instead of Java objects.
+The wrappers are created with their constructors, as scripts do.
+
+To run it:
+    python Python4Capella/benchmarks/wrapper_memory.py [number of wrappers]
+'''
+import gc
+import os
+import sys
+import tracemalloc
+
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+
+WORKSPACE = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def include(uri):
+    """Executes the given workspace:// script in the __main__ namespace, as EASE does"""
+    path = os.path.join(WORKSPACE, uri[len("workspace://"):])
+    with open(path) as script:
+        code = compile(script.read(), path, "exec")
+    exec(code, sys.modules["__main__"].__dict__)
+
+
+class DictJavaObject(object):
+    """The previous wrapper layout: the Java object is stored in the instance __dict__"""
+    def __init__(self, java_object):
+        self.java_object = java_object
+
+
+class PlaceholderJavaObject(object):
+    """Stands for a Java object, answers the checks made by the wrapper constructors as a node physical component"""
+    __slots__ = ()
+    def isActor(self):
+        return False
+    def getNature(self):
+        return self
+    def getName(self):
+        return "NODE"
+
+
+def measure(factory, java_objects):
+    """Gets the number of bytes allocated to create one wrapper per given Java object"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    wrappers = [factory(java_object) for java_object in java_objects]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del wrappers
+    return after - before
+
+
+def main(count):
+    builtins.include = include
+    builtins.loadModule = lambda name: None
+    include("workspace://Python4Capella/simplified_api/capella.py")
+    main_module = sys.modules["__main__"]
+
+    java_objects = [PlaceholderJavaObject() for _ in range(count)]
+    previous = measure(DictJavaObject, java_objects)
+    res = 0
+    print("%-20s %14s %14s %8s" % ("class", "before B/obj", "after B/obj", "ratio"))
+    for cls_name in ["CapellaElement", "LogicalFunction", "ExchangeItem", "FunctionalExchange", "NodePC"]:
+        cls = getattr(main_module, cls_name)
+        slotted = measure(cls, java_objects)
+        print("%-20s %14.1f %14.1f %8.2f" % (cls_name, float(previous) / count, float(slotted) / count, float(slotted) / previous))
+        if slotted >= previous:
+            res = 1
+    return res
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000))
@@ -0,0 +1,17 @@
+'''
+Runs the simplified API without Capella: .capella files are read with a streaming XML parser and the
+EASE functions used by the Java API are replaced by pure Python functions.
+
+    from headless import install, load_simplified_api
+    runtime = install()
+    api = load_simplified_api(runtime)
+    model = api.CapellaModel()
+    model.open("/In-Flight Entertainment System/In-Flight Entertainment System.aird")
+
+A script written for EASE can also be run from the command line:
+
+    cd Python4Capella
+    python -m headless --model "/In-Flight Entertainment System/In-Flight Entertainment System.aird" sample_scripts/List_logical_functions_in_console.py
+'''
+from .ease import HeadlessRuntime, install, load_simplified_api, run_script
+from .xmi import XMIObject, XMIResource, load_resource
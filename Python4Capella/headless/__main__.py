@@ -0,0 +1,26 @@
+'''
+Runs an EASE script without Capella:
+
+    python -m headless [--workspace FOLDER] [--model AIRD_OR_CAPELLA_PATH] [--select ID] [--cache] SCRIPT [ARGUMENTS...]
+'''
+import argparse
+import sys
+
+from .ease import run_script
+
+
+def main(args = None):
+    parser = argparse.ArgumentParser(prog = "python -m headless", description = "Runs a Python4Capella script without Capella")
+    parser.add_argument("--workspace", help = "the folder used as Eclipse workspace, the folder containing Python4Capella by default")
+    parser.add_argument("--model", help = "the model opened and selected before running the script (workspace path of the .aird or .capella file)")
+    parser.add_argument("--select", help = "the id of the selected element, the SystemEngineering of the model by default")
+    parser.add_argument("--cache", action = "store_true", help = "read the model from its cache if it is unchanged, see headless.cache")
+    parser.add_argument("script", help = "the script to run")
+    parser.add_argument("arguments", nargs = argparse.REMAINDER, help = "the arguments of the script (argv)")
+    options = parser.parse_args(args)
+    run_script(options.script, options.arguments, options.model, options.select, options.workspace, options.cache)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
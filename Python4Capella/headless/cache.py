@@ -0,0 +1,539 @@
+'''
+A persistent cache of parsed .capella files.
+
+The elements of a parsed file are written in a binary file made of arrays of integers, in the order
+of a depth first traversal: the EClass, container, containing feature and end of the subtree of each
+element, and the position of its attribute values. All the strings (EClass names, feature names, ids,
+values) are interned in a single string table, and the ids are sorted for a binary search. Reopening
+an unchanged model maps the cache file in memory without reading the elements: an XMIObject is
+only created when it is reached from its container or looked up by id, and its attributes and
+children are read on first access.
+
+A cache file is valid while the size and modification time of the .capella file are unchanged.
+If they changed, the SHA-1 of the file content is compared to the one stored in the cache, so
+touching or copying a file doesn't invalidate its cache.
+
+    python -m headless.cache warm MODEL...
+    python -m headless.cache inspect MODEL...
+    python -m headless.cache evict [MODEL...]
+'''
+import argparse
+import array
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
+from .xmi import ID, XMIEList, XMIObject, XMIResource, load_resource
+
+MAGIC = b"P4CC"
+FORMAT_VERSION = 2
+# magic, format version, byte order, mtime (ns), size, SHA-1 of the model file, number of sections
+HEADER = struct.Struct("<4sHBxqq20sI")
+# offset and length of each section
+SECTION = struct.Struct("<qq")
+ALIGNMENT = 8
+# the sections of a cache file, in order
+STRINGS_OFFSETS = "strings_offsets"
+STRINGS = "strings"
+PACKAGES = "packages"
+E_CLASSES = "e_classes"
+OBJECTS = "objects"
+ATTRIBUTES = "attributes"
+TEXTS = "texts"
+IDS = "ids"
+SECTIONS = [STRINGS_OFFSETS, STRINGS, PACKAGES, E_CLASSES, OBJECTS, ATTRIBUTES, TEXTS, IDS]
+# EClass, container, containing feature, end of the subtree, first attribute and first text of an object
+OBJECT_SIZE = 6
+# the XMIObject slots read from the cache file on first access
+LAZY_SLOTS = ("attributes", "values", "contents")
+BYTE_ORDERS = {"little": 0, "big": 1}
+# the index of None in the string and object tables
+NONE = -1
+
+
+def get_cache_folder():
+    """Gets the folder of the cache files, set with the PYTHON4CAPELLA_CACHE environment variable"""
+    return os.environ.get("PYTHON4CAPELLA_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "python4capella"))
+
+
+def get_cache_path(model_path, cache_folder = None):
+    """Gets the path of the cache file of the given .capella file"""
+    if cache_folder is None:
+        cache_folder = get_cache_folder()
+    key = hashlib.sha1(os.path.abspath(model_path).encode("utf-8")).hexdigest()
+    return os.path.join(cache_folder, os.path.splitext(os.path.basename(model_path))[0].replace(" ", "_") + "-" + key[:16] + ".p4cc")
+
+
+def get_file_hash(path):
+    """Gets the SHA-1 of the content of the given file"""
+    digest = hashlib.sha1()
+    with open(path, "rb") as model_file:
+        for chunk in iter(lambda: model_file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def get_stat(path):
+    stat = os.stat(path)
+    return int(getattr(stat, "st_mtime_ns", stat.st_mtime * 1e9)), stat.st_size
+
+
+class StringTable(object):
+    """Interns the strings written in a cache file"""
+    def __init__(self):
+        self.indexes = {}
+        self.strings = []
+    def add(self, string):
+        if string is None:
+            return NONE
+        try:
+            return self.indexes[string]
+        except KeyError:
+            index = self.indexes[string] = len(self.strings)
+            self.strings.append(string)
+            return index
+    def to_sections(self):
+        offsets = array.array("q", [0])
+        data = []
+        position = 0
+        for string in self.strings:
+            encoded = string.encode("utf-8")
+            data.append(encoded)
+            position += len(encoded)
+            offsets.append(position)
+        return offsets.tobytes(), b"".join(data)
+
+
+def write_cache(resource, cache_path, model_path = None, model_hash = None):
+    """Writes the given freshly parsed resource in the given cache file"""
+    if model_path is None:
+        model_path = resource.path
+    if model_hash is None:
+        model_hash = get_file_hash(model_path)
+    mtime, size = get_stat(model_path)
+    strings = StringTable()
+    package_indexes = {}
+    packages = array.array("i")
+    e_class_indexes = {}
+    e_classes = array.array("i")
+    object_indexes = {}
+    objects = array.array("i")
+    attributes = array.array("i")
+    texts = array.array("i")
+    ids = []
+    for e_object in resource.get_all_contents():
+        e_class = e_object.eClass()
+        e_class_index = e_class_indexes.get(e_class)
+        if e_class_index is None:
+            package = e_class.getEPackage()
+            package_index = package_indexes.get(package)
+            if package_index is None:
+                package_index = package_indexes[package] = len(packages) // 2
+                packages.extend((strings.add(package.getNsURI()), strings.add(package.getName())))
+            e_class_index = e_class_indexes[e_class] = len(e_classes) // 2
+            e_classes.extend((package_index, strings.add(e_class.getName())))
+        index = object_indexes[e_object] = len(objects) // OBJECT_SIZE
+        container = e_object.eContainer()
+        # the end of the subtree is set once all the objects are written
+        objects.extend((e_class_index, NONE if container is None else object_indexes[container], strings.add(e_object.eContainingFeature()), index + 1,
+                        len(attributes) // 2, len(texts) // 2))
+        for feature, value in e_object.attributes.items():
+            attributes.extend((strings.add(feature), strings.add(value)))
+            if feature == ID:
+                ids.append((value.encode("utf-8"), index))
+        for feature, value in e_object.values.items():
+            if isinstance(value, XMIEList) and not value.containment:
+                for text in value:
+                    texts.extend((strings.add(feature), strings.add(text)))
+    # the containers come before their contents
+    for index in range(len(objects) // OBJECT_SIZE - 1, -1, -1):
+        container_index = objects[index * OBJECT_SIZE + 1]
+        if container_index != NONE:
+            objects[container_index * OBJECT_SIZE + 3] = max(objects[container_index * OBJECT_SIZE + 3], objects[index * OBJECT_SIZE + 3])
+    # the sort is stable: as when parsing, the last object with a duplicated id is found
+    ids.sort(key = lambda entry: entry[0])
+    ids_section = array.array("i")
+    for e_object_id, index in ids:
+        ids_section.extend((strings.add(e_object_id.decode("utf-8")), index))
+    # the packages declared in the file but not used by an element
+    for ns_uri, package in resource.packages.items():
+        if package not in package_indexes:
+            package_indexes[package] = len(packages) // 2
+            packages.extend((strings.add(ns_uri), strings.add(package.getName())))
+    offsets, data = strings.to_sections()
+    sections = [offsets, data, packages.tobytes(), e_classes.tobytes(), objects.tobytes(), attributes.tobytes(), texts.tobytes(), ids_section.tobytes()]
+    folder = os.path.dirname(cache_path)
+    if folder and not os.path.isdir(folder):
+        os.makedirs(folder)
+    descriptor, temporary_path = tempfile.mkstemp(dir = folder or ".", suffix = ".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as cache_file:
+            cache_file.write(HEADER.pack(MAGIC, FORMAT_VERSION, BYTE_ORDERS[sys.byteorder], mtime, size, model_hash, len(sections)))
+            position = HEADER.size + SECTION.size * len(sections)
+            for section in sections:
+                position += get_padding(position)
+                cache_file.write(SECTION.pack(position, len(section)))
+                position += len(section)
+            position = HEADER.size + SECTION.size * len(sections)
+            for section in sections:
+                padding = get_padding(position)
+                cache_file.write(b"\0" * padding)
+                cache_file.write(section)
+                position += padding + len(section)
+        os.replace(temporary_path, cache_path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+    return cache_path
+
+
+def get_padding(position):
+    return (ALIGNMENT - position % ALIGNMENT) % ALIGNMENT
+
+
+class CacheFile(object):
+    """A cache file mapped in memory"""
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self.file = open(cache_path, "rb")
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access = mmap.ACCESS_READ)
+        except BaseException:
+            self.file.close()
+            raise
+        self.view = memoryview(self.map)
+        magic, self.format_version, byte_order, self.mtime, self.size, self.model_hash, count = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or self.format_version != FORMAT_VERSION or byte_order != BYTE_ORDERS[sys.byteorder] or count != len(SECTIONS):
+            self.close()
+            raise ValueError("not a cache file of this version: " + cache_path)
+        self.sections = {}
+        for index, name in enumerate(SECTIONS):
+            self.sections[name] = SECTION.unpack_from(self.map, HEADER.size + SECTION.size * index)
+        self.strings_offsets = self.get_section(STRINGS_OFFSETS, "q")
+        self.strings_start = self.sections[STRINGS][0]
+        self.strings = [None] * (len(self.strings_offsets) - 1)
+    def get_section(self, name, typecode = None):
+        """Gets a section of the memory map, as an array of the given typecode if not None"""
+        start, length = self.sections[name]
+        section = self.view[start:start + length]
+        if typecode is not None:
+            section = section.cast(typecode)
+        return section
+    def get_bytes(self, index):
+        """Gets the UTF-8 bytes of the string with the given index"""
+        return bytes(self.view[self.strings_start + self.strings_offsets[index]:self.strings_start + self.strings_offsets[index + 1]])
+    def get_string(self, index):
+        """Gets the string with the given index, decoded from the memory map on first access"""
+        if index == NONE:
+            return None
+        string = self.strings[index]
+        if string is None:
+            # each string is decoded once and shared by all the objects using it
+            string = self.strings[index] = self.get_bytes(index).decode("utf-8")
+        return string
+    def is_valid(self, model_path, model_hash = None):
+        """Tells if this cache matches the current content of the given .capella file"""
+        mtime, size = get_stat(model_path)
+        if mtime == self.mtime and size == self.size:
+            return True
+        elif size != self.size:
+            return False
+        if model_hash is None:
+            model_hash = get_file_hash(model_path)
+        return model_hash == self.model_hash
+    def get_counts(self):
+        """Gets the number of strings, packages, EClasses, objects, attribute values and text values"""
+        return {
+            "strings": len(self.strings),
+            "packages": len(self.get_section(PACKAGES, "i")) // 2,
+            "e_classes": len(self.get_section(E_CLASSES, "i")) // 2,
+            "objects": len(self.get_section(OBJECTS, "i")) // OBJECT_SIZE,
+            "attributes": len(self.get_section(ATTRIBUTES, "i")) // 2,
+            "texts": len(self.get_section(TEXTS, "i")) // 2,
+            "ids": len(self.get_section(IDS, "i")) // 2,
+        }
+    def read_resource(self, model_path):
+        """Gets the resource of the given .capella file read from this cache, the cache file stays mapped while the resource is used"""
+        return CachedResource(model_path, self)
+    def close(self):
+        self.strings_offsets = None
+        self.view = None
+        self.map.close()
+        self.file.close()
+
+
+class CachedXMIObject(XMIObject):
+    """An XMIObject of a CachedResource, its attributes, values and children are read from the cache file on first access"""
+    __slots__ = ("reader", "index")
+    def __getattr__(self, name):
+        # only called while a slot is not set
+        if name in LAZY_SLOTS:
+            self.reader.read_object(self)
+            return XMIObject.__dict__[name].__get__(self)
+        return XMIObject.__getattr__(self, name)
+
+
+class CachedIds(MutableMapping):
+    """The objects of a CachedResource by id: the ids of the cache file are found with a binary search,
+    the ids set after loading are kept in a dict"""
+    def __init__(self, resource):
+        self.resource = resource
+        self.added = {}
+        self.removed = set()
+    def __getitem__(self, e_object_id):
+        try:
+            return self.added[e_object_id]
+        except KeyError:
+            pass
+        if e_object_id not in self.removed:
+            index = self.resource.find_id(e_object_id)
+            if index != NONE:
+                return self.resource.get_object(index)
+        raise KeyError(e_object_id)
+    def __setitem__(self, e_object_id, e_object):
+        self.added[e_object_id] = e_object
+        self.removed.discard(e_object_id)
+    def __delitem__(self, e_object_id):
+        cached = e_object_id not in self.removed and self.resource.find_id(e_object_id) != NONE
+        if self.added.pop(e_object_id, None) is None and not cached:
+            raise KeyError(e_object_id)
+        if cached:
+            self.removed.add(e_object_id)
+    def __iter__(self):
+        for e_object_id in self.resource.iter_ids():
+            if e_object_id not in self.added and e_object_id not in self.removed:
+                yield e_object_id
+        for e_object_id in self.added:
+            yield e_object_id
+    def __len__(self):
+        return sum(1 for e_object_id in self)
+
+
+class CachedResource(XMIResource):
+    """A resource read from a cache file. Only the roots are created when it is opened, other objects are created when they are reached"""
+    def __init__(self, path, cache_file):
+        XMIResource.__init__(self, path)
+        self.cache_file = cache_file
+        get_string = cache_file.get_string
+        packages = cache_file.get_section(PACKAGES, "i")
+        e_packages = []
+        for index in range(0, len(packages), 2):
+            e_packages.append(self.get_e_package(get_string(packages[index]), get_string(packages[index + 1])))
+        e_classes = cache_file.get_section(E_CLASSES, "i")
+        self.e_classes = []
+        for index in range(0, len(e_classes), 2):
+            self.e_classes.append(e_packages[e_classes[index]].getEClassifier(get_string(e_classes[index + 1])))
+        self.objects_section = cache_file.get_section(OBJECTS, "i")
+        self.attributes_section = cache_file.get_section(ATTRIBUTES, "i")
+        self.texts_section = cache_file.get_section(TEXTS, "i")
+        self.ids_section = cache_file.get_section(IDS, "i")
+        # the created objects by index
+        self.objects = [None] * (len(self.objects_section) // OBJECT_SIZE)
+        self.ids = CachedIds(self)
+        index = 0
+        while index < len(self.objects):
+            self.roots.append(self.get_object(index))
+            index = self.objects_section[index * OBJECT_SIZE + 3]
+    def get_object(self, index):
+        """Gets the object with the given index, created with its containers on first access"""
+        e_object = self.objects[index]
+        if e_object is None:
+            start = index * OBJECT_SIZE
+            container_index = self.objects_section[start + 1]
+            e_object = object.__new__(CachedXMIObject)
+            e_object.e_class = self.e_classes[self.objects_section[start]]
+            e_object.resource = self
+            e_object.container = None if container_index == NONE else self.get_object(container_index)
+            e_object.containing_feature = self.cache_file.get_string(self.objects_section[start + 2])
+            e_object.reader = self
+            e_object.index = index
+            self.objects[index] = e_object
+        return e_object
+    def read_object(self, e_object):
+        """Reads the attributes, texts and children of the given object"""
+        cache_file = self.cache_file
+        strings = cache_file.strings
+        get_string = cache_file.get_string
+        objects = self.objects_section
+        start = e_object.index * OBJECT_SIZE
+        if start + OBJECT_SIZE < len(objects):
+            attributes_end = objects[start + OBJECT_SIZE + 4]
+            texts_end = objects[start + OBJECT_SIZE + 5]
+        else:
+            attributes_end = len(self.attributes_section) // 2
+            texts_end = len(self.texts_section) // 2
+        # features and values are never None: a string not decoded yet is the only None of the string table
+        attributes = {}
+        pairs = self.attributes_section[2 * objects[start + 4]:2 * attributes_end].tolist()
+        for position in range(0, len(pairs), 2):
+            feature = strings[pairs[position]]
+            if feature is None:
+                feature = get_string(pairs[position])
+            value = strings[pairs[position + 1]]
+            if value is None:
+                value = get_string(pairs[position + 1])
+            attributes[feature] = value
+        e_object.attributes = attributes
+        e_object.values = {}
+        e_object.contents = []
+        pairs = self.texts_section[2 * objects[start + 5]:2 * texts_end].tolist()
+        for position in range(0, len(pairs), 2):
+            e_object.add_text(get_string(pairs[position]), get_string(pairs[position + 1]))
+        child = e_object.index + 1
+        end = objects[start + 3]
+        while child < end:
+            child_object = self.get_object(child)
+            e_object.add_child(child_object.containing_feature, child_object)
+            child = objects[child * OBJECT_SIZE + 3]
+    def find_id(self, e_object_id):
+        """Gets the index of the last object with the given id in the cache file, NONE if there is no such object"""
+        try:
+            key = e_object_id.encode("utf-8")
+        except AttributeError:
+            return NONE
+        ids = self.ids_section
+        get_bytes = self.cache_file.get_bytes
+        low = 0
+        high = len(ids) // 2
+        while low < high:
+            middle = (low + high) // 2
+            if key < get_bytes(ids[2 * middle]):
+                high = middle
+            else:
+                low = middle + 1
+        if low > 0 and get_bytes(ids[2 * (low - 1)]) == key:
+            return ids[2 * (low - 1) + 1]
+        return NONE
+    def iter_ids(self):
+        """Yields the ids of the cache file"""
+        get_string = self.cache_file.get_string
+        for position in range(0, len(self.ids_section), 2):
+            yield get_string(self.ids_section[position])
+    def get_created_count(self):
+        """Gets the number of objects created so far"""
+        return len(self.objects) - self.objects.count(None)
+
+
+def load_cached_resource(model_path, cache_folder = None):
+    """Reads the given .capella file from its cache if it is valid, parses it and writes the cache otherwise"""
+    cache_path = get_cache_path(model_path, cache_folder)
+    model_hash = None
+    if os.path.exists(cache_path):
+        try:
+            cache_file = CacheFile(cache_path)
+        except (ValueError, struct.error):
+            cache_file = None
+        if cache_file is not None:
+            resource = None
+            try:
+                stat = get_stat(model_path)
+                model_hash = get_file_hash(model_path) if stat != (cache_file.mtime, cache_file.size) else None
+                if cache_file.is_valid(model_path, model_hash):
+                    resource = cache_file.read_resource(model_path)
+            finally:
+                if resource is None:
+                    cache_file.close()
+            if resource is not None:
+                if model_hash is not None:
+                    # same content with another modification time: the hash is not computed again next time
+                    update_mtime(cache_path, stat[0])
+                return resource
+    resource = load_resource(model_path)
+    try:
+        write_cache(resource, cache_path, model_path, model_hash)
+    except (IOError, OSError):
+        # a read only cache folder doesn't prevent reading the model
+        pass
+    return resource
+
+
+def update_mtime(cache_path, mtime):
+    """Writes the given modification time of the model file in the header of the given cache file"""
+    with open(cache_path, "r+b") as cache_file:
+        header = list(HEADER.unpack(cache_file.read(HEADER.size)))
+        header[3] = mtime
+        cache_file.seek(0)
+        cache_file.write(HEADER.pack(*header))
+
+
+def warm(model_path, cache_folder = None):
+    """Parses the given .capella file and writes its cache, returns the path of the cache file"""
+    resource = load_resource(model_path)
+    return write_cache(resource, get_cache_path(model_path, cache_folder), model_path)
+
+
+def inspect(model_path, cache_folder = None):
+    """Gets a description of the cache of the given .capella file, None if there is no cache"""
+    cache_path = get_cache_path(model_path, cache_folder)
+    if not os.path.exists(cache_path):
+        return None
+    cache_file = CacheFile(cache_path)
+    try:
+        res = {
+            "model": os.path.abspath(model_path),
+            "cache": cache_path,
+            "cache_size": os.path.getsize(cache_path),
+            "model_size": cache_file.size,
+            "model_sha1": "".join("%02x" % byte for byte in bytearray(cache_file.model_hash)),
+            "valid": os.path.exists(model_path) and cache_file.is_valid(model_path),
+        }
+        res.update(cache_file.get_counts())
+        return res
+    finally:
+        cache_file.close()
+
+
+def evict(model_path = None, cache_folder = None):
+    """Removes the cache of the given .capella file, or all the cache files if no file is given. Returns the removed cache files"""
+    if model_path is not None:
+        cache_paths = [get_cache_path(model_path, cache_folder)]
+    else:
+        folder = cache_folder if cache_folder is not None else get_cache_folder()
+        cache_paths = [os.path.join(folder, name) for name in sorted(os.listdir(folder)) if name.endswith(".p4cc")] if os.path.isdir(folder) else []
+    res = []
+    for cache_path in cache_paths:
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+            res.append(cache_path)
+    return res
+
+
+def main(args = None):
+    parser = argparse.ArgumentParser(prog = "python -m headless.cache", description = "Manages the cache of parsed .capella files")
+    parser.add_argument("--cache-folder", help = "the folder of the cache files, " + get_cache_folder() + " by default")
+    commands = parser.add_subparsers(dest = "command")
+    commands.required = True
+    commands.add_parser("warm", help = "parse models and write their cache").add_argument("models", nargs = "+")
+    commands.add_parser("inspect", help = "describe the cache of models").add_argument("models", nargs = "+")
+    commands.add_parser("evict", help = "remove the cache of models, or all the cache files").add_argument("models", nargs = "*")
+    options = parser.parse_args(args)
+    if options.command == "warm":
+        for model_path in options.models:
+            print(warm(model_path, options.cache_folder))
+    elif options.command == "inspect":
+        for model_path in options.models:
+            description = inspect(model_path, options.cache_folder)
+            if description is None:
+                print(model_path + ": not cached")
+            else:
+                for key in sorted(description):
+                    print("%-12s %s" % (key, description[key]))
+    else:
+        removed = []
+        for model_path in options.models or [None]:
+            removed.extend(evict(model_path, options.cache_folder))
+        for cache_path in removed:
+            print("removed " + cache_path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
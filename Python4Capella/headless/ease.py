@@ -0,0 +1,320 @@
+'''
+Replaces the EASE modules loaded by the Java API (/Capella/Capella, /Capella/EMF, /Capella/Sirius,
+/Capella/Java, /System/UI and /System/Resources) with functions working on the XMIObjects of a
+.capella file, so the simplified API runs unchanged in a plain Python interpreter.
+
+Diagrams are stored in the .aird file which is not read: the diagram functions return empty lists.
+Only the Semantic Browser queries listed in SB_QUERIES or matching SB_QUERY_PREFIXES are available,
+other queries raise a NotImplementedError.
+Modifications are only kept in memory: rollbackTransaction() doesn't undo them and a session can't be saved.
+'''
+import os
+import runpy
+import sys
+
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+
+from . import metamodel
+from .xmi import XMIEList, XMIEnumLiteral, XMIResource, load_resource
+
+# the folder containing the Python4Capella project, used as the Eclipse workspace
+WORKSPACE = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+WORKSPACE_PREFIXES = ["workspace://", "workspace:/", "platform:/resource/"]
+DEFAULT_CAPELLA_VERSION = "5.0.0"
+# the functions of the EASE modules provided by HeadlessRuntime
+EASE_FUNCTIONS = [
+    "include", "loadModule", "getFile", "getProject", "refreshResource", "getSelection",
+    "loadSiriusSession", "getEngineering", "getSession", "startTransaction", "commitTransaction", "rollbackTransaction",
+    "createProgressMonitor", "getRepresentationDescriptors", "getAllDiagrams", "getDiagrams", "getRepresentingDiagrams",
+    "getContextualElementForDiagrams", "exportImage",
+    "getCapellaVersion", "getLabel", "isSystem", "getLibraries", "callQuery", "getSBQuery", "getAvailableSBQueries",
+    "eAllContents", "getEClassifier", "create", "getEnumLiteral", "eInverse",
+    "iteratorHasNext", "iteratorNext",
+]
+
+
+def get_connected_component(end):
+    """Gets the component at the given end of a component exchange: the type of a part or the owner of a port"""
+    if end is None:
+        return None
+    elif end.eClass().getName() == "Part":
+        return end.getAbstractType()
+    return end.eContainer()
+
+
+def get_categories(e_object):
+    return metamodel.filter_type(metamodel.get_inverse(e_object, "exchanges") + metamodel.get_inverse(e_object, "links"), "Category")
+
+
+def get_single(value):
+    return [] if value is None else [value]
+
+
+# Semantic Browser queries computed by a dedicated function
+SB_QUERIES = {
+    "Source": lambda e_object: get_single(e_object.getSource()),
+    "Target": lambda e_object: get_single(e_object.getTarget()),
+    "Type": lambda e_object: get_single(e_object.getAbstractType()),
+    "Categories": get_categories,
+    "Connected Components": lambda e_object: [component for component in [get_connected_component(e_object.getSource()), get_connected_component(e_object.getTarget())] if component is not None],
+}
+
+# Semantic Browser queries computed from the derived feature matching the first word of their name
+SB_QUERY_PREFIXES = {
+    "Allocated": metamodel.derive_allocated,
+    "Allocating": metamodel.derive_allocating,
+    "Realized": metamodel.derive_realized,
+    "Realizing": metamodel.derive_realizing,
+    "Involved": metamodel.derive_involved,
+    "Involving": metamodel.derive_involving,
+}
+
+
+class HeadlessPath(object):
+    """A path of the workspace, as returned by IResource.getLocation() or URI"""
+    def __init__(self, path, workspace):
+        self.path = path
+        self.workspace = workspace
+    def toString(self):
+        return self.path.replace("\\", "/")
+    def toPlatformString(self, decode):
+        relative_path = os.path.relpath(self.path, self.workspace)
+        if relative_path.startswith(".."):
+            return self.toString()
+        return "/" + relative_path.replace("\\", "/")
+    def __str__(self):
+        return self.toString()
+
+
+class HeadlessFolder(object):
+    """A project or a folder of the workspace"""
+    def __init__(self, path, workspace):
+        self.path = path
+        self.workspace = workspace
+    def getName(self):
+        return os.path.basename(self.path)
+    def getFolder(self, name):
+        return HeadlessFolder(os.path.join(self.path, name), self.workspace)
+    def exists(self):
+        return os.path.isdir(self.path)
+    def create(self, force, local, monitor):
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+    def getLocation(self):
+        return HeadlessPath(self.path, self.workspace)
+
+
+class HeadlessSelection(object):
+    """The selection of the workbench, given on the command line"""
+    def __init__(self, elements):
+        self.elements = elements
+    def getFirstElement(self):
+        return self.elements[0] if len(self.elements) > 0 else None
+    def toList(self):
+        return list(self.elements)
+    def isEmpty(self):
+        return len(self.elements) == 0
+
+
+class HeadlessSession(object):
+    """A Sirius session on a .capella file"""
+    def __init__(self, resource, workspace):
+        self.resource = resource
+        self.workspace = workspace
+    def getSessionResource(self):
+        return self
+    def getURI(self):
+        return HeadlessPath(self.resource.path, self.workspace)
+    def getSemanticResources(self):
+        return XMIEList([self.resource])
+    def save(self, monitor):
+        raise NotImplementedError("saving a model is not supported without Capella: " + str(self.resource.path))
+
+
+class HeadlessRuntime(object):
+    """The EASE functions used by the Java API, working on the .capella files of a workspace folder"""
+    def __init__(self, workspace = None, use_cache = False):
+        self.workspace = os.path.abspath(workspace if workspace is not None else WORKSPACE)
+        # reads the models from the cache of headless.cache
+        self.use_cache = use_cache
+        self.sessions = {}
+        self.current_session = None
+        self.selection = []
+        self.registry = XMIResource()
+    def get_path(self, uri):
+        """Gets the file system path of a workspace URI or path"""
+        path = str(uri)
+        for prefix in WORKSPACE_PREFIXES:
+            if path.startswith(prefix):
+                path = path[len(prefix):]
+                break
+        if os.path.isabs(path) and os.path.exists(path):
+            return path
+        res = os.path.join(self.workspace, path.lstrip("/"))
+        if not os.path.exists(res) and os.path.exists(os.path.join(WORKSPACE, path.lstrip("/"))):
+            # the Python4Capella scripts when the workspace is another folder
+            return os.path.join(WORKSPACE, path.lstrip("/"))
+        return res
+    def get_capella_path(self, uri):
+        """Gets the path of the .capella file of the given .aird or .capella file"""
+        path = self.get_path(uri)
+        root, extension = os.path.splitext(path)
+        if extension == ".aird":
+            return root + ".capella"
+        return path
+    def get_resource(self):
+        """Gets the resource of the current session, or a resource registering the EPackages if no model is opened"""
+        if self.current_session is not None:
+            return self.current_session.resource
+        return self.registry
+    # workspace functions
+    def include(self, uri):
+        path = self.get_path(uri)
+        with open(path) as script:
+            code = compile(script.read(), path, "exec")
+        exec(code, sys.modules["__main__"].__dict__)
+    def loadModule(self, name):
+        return None
+    def getFile(self, uri):
+        path = self.get_path(uri)
+        if os.path.exists(path) or os.path.exists(self.get_capella_path(uri)):
+            return path
+        return None
+    def getProject(self, name):
+        # scripts often pass the project part of a workspace path, such as "/Project/"
+        return HeadlessFolder(os.path.join(self.workspace, name.strip("/")), self.workspace)
+    def refreshResource(self, resource):
+        return None
+    def getSelection(self):
+        return HeadlessSelection(self.selection)
+    # Sirius functions
+    def loadSiriusSession(self, aird_path):
+        path = os.path.abspath(self.get_capella_path(aird_path))
+        session = self.sessions.get(path)
+        if session is None:
+            if self.use_cache:
+                # imported here: importing headless must not import headless.cache, which also runs as python -m headless.cache
+                from . import cache
+                resource = cache.load_cached_resource(path)
+            else:
+                resource = load_resource(path)
+            session = self.sessions[path] = HeadlessSession(resource, self.workspace)
+        self.current_session = session
+        return session
+    def open_resource(self, resource):
+        """Opens a session on a resource built in memory (for instance by headless.generator)"""
+        session = self.sessions[resource.path if resource.path is not None else id(resource)] = HeadlessSession(resource, self.workspace)
+        self.current_session = session
+        return session
+    def getEngineering(self, session):
+        for root in session.resource.roots:
+            if root.eClass().getName() == "SystemEngineering":
+                return root
+            for model_root in root.getOwnedModelRoots():
+                if model_root.eClass().getName() == "SystemEngineering":
+                    return model_root
+        return None
+    def getSession(self, e_object):
+        for session in self.sessions.values():
+            if session.resource is e_object.eResource():
+                return session
+        return None
+    def startTransaction(self, session):
+        return None
+    def commitTransaction(self, session):
+        return None
+    def rollbackTransaction(self, session):
+        return None
+    def createProgressMonitor(self):
+        return None
+    def getRepresentationDescriptors(self, e_object):
+        return XMIEList()
+    def getAllDiagrams(self, session):
+        return XMIEList()
+    def getDiagrams(self, session, diagram_type):
+        return XMIEList()
+    def getRepresentingDiagrams(self, e_object):
+        return XMIEList()
+    def getContextualElementForDiagrams(self, e_object):
+        return XMIEList()
+    def exportImage(self, descriptor, file_path):
+        raise NotImplementedError("diagrams are not available without Capella")
+    # Capella functions
+    def getCapellaVersion(self):
+        version = self.get_resource().get_capella_version()
+        return version if version is not None else DEFAULT_CAPELLA_VERSION
+    def getLabel(self, e_object):
+        name = e_object.getName()
+        return name if name is not None else ""
+    def isSystem(self, component):
+        return metamodel.is_system(component)
+    def getLibraries(self, system_engineering):
+        return XMIEList()
+    def callQuery(self, query_class, e_object):
+        raise NotImplementedError("Java queries are not available without Capella: " + query_class)
+    def getSBQuery(self, e_object, query_name):
+        query = SB_QUERIES.get(query_name)
+        if query is not None:
+            return XMIEList(query(e_object))
+        words = query_name.split(" ")
+        derive = SB_QUERY_PREFIXES.get(words[0])
+        if derive is not None and len(words) > 1:
+            return XMIEList(derive(e_object, metamodel.get_singular("".join(words[1:]))))
+        raise NotImplementedError("Semantic Browser query not available without Capella: " + query_name)
+    def getAvailableSBQueries(self, e_object):
+        return sorted(SB_QUERIES.keys())
+    # EMF functions
+    def eAllContents(self, e_object):
+        return e_object.eAllContents()
+    def getEClassifier(self, ns_uri, name):
+        return self.get_resource().get_e_class(ns_uri, name)
+    def create(self, ns_uri, name):
+        return self.get_resource().create(ns_uri, name)
+    def getEnumLiteral(self, ns_uri, enum_name, literal_name):
+        return XMIEnumLiteral(literal_name)
+    def eInverse(self, e_object, reference_name):
+        return XMIEList(metamodel.get_inverse(e_object, reference_name))
+    # Java functions
+    def iteratorHasNext(self, iterator):
+        return iterator.hasNext()
+    def iteratorNext(self, iterator):
+        return iterator.next()
+    def get_functions(self):
+        """Gets the EASE functions by name"""
+        res = {}
+        for name in EASE_FUNCTIONS:
+            res[name] = getattr(self, name)
+        return res
+    def install(self):
+        """Makes the EASE functions available to all scripts"""
+        for name, function in self.get_functions().items():
+            setattr(builtins, name, function)
+        return self
+
+
+def install(workspace = None, use_cache = False):
+    """Installs a runtime on the given workspace folder (the folder containing Python4Capella by default)"""
+    return HeadlessRuntime(workspace, use_cache).install()
+
+
+def load_simplified_api(runtime, names = ("capella",)):
+    """Includes the given simplified API scripts in the __main__ namespace, returns the __main__ module"""
+    for name in names:
+        runtime.include("workspace://Python4Capella/simplified_api/" + name + ".py")
+    return sys.modules["__main__"]
+
+
+def run_script(script_path, args = (), model_path = None, selection = None, workspace = None, use_cache = False):
+    """Runs an EASE script as __main__ with the given arguments (argv).
+    If a model is given, it is opened and the selection is its SystemEngineering, or the element with the given id"""
+    runtime = install(workspace, use_cache)
+    if model_path is not None:
+        session = runtime.loadSiriusSession(model_path)
+        if selection is None:
+            runtime.selection = [runtime.getEngineering(session)]
+        else:
+            runtime.selection = [session.resource.get_by_id(selection)]
+    return runpy.run_path(script_path, init_globals = {"argv": list(args)}, run_name = "__main__")
@@ -0,0 +1,329 @@
+'''
+Generates synthetic Capella models of a configurable size, to measure how scripts scale beyond the
+sample models.
+
+The logical and physical architectures get a tree of components with parts, ports and component
+exchanges, a tree of functions allocated to the leaf components, functional exchanges between leaf
+functions, functional chains following these exchanges, state machines with nested regions,
+property values and requirements linked to functions and components. The model is built in memory
+as an XMIResource which can be opened with HeadlessRuntime.open_resource() or saved as a .capella
+file (with the .afm and .aird files needed to open it in Capella).
+
+The in-memory model is read through the simplified API, it doesn't produce the MockCapellaModel of the
+simulator tests: the simulator runs on a CapellaModel opened on the generated resource instead.
+
+    python -m headless.generator --elements 100000 /tmp/synthetic/synthetic.capella
+'''
+import argparse
+import io
+import os
+import random
+import sys
+import uuid
+
+from .xmi import XMIObject, XMIResource
+
+DEFAULT_CAPELLA_VERSION = "5.0.0"
+# the versioned namespaces used by the generated model, the version is appended to the URI
+CAPELLA_NAMESPACES = {
+    "capellamodeller": "http://www.polarsys.org/capella/core/modeller/",
+    "capellacore": "http://www.polarsys.org/capella/core/core/",
+    "capellacommon": "http://www.polarsys.org/capella/core/common/",
+    "libraries": "http://www.polarsys.org/capella/common/libraries/",
+    "cs": "http://www.polarsys.org/capella/core/cs/",
+    "fa": "http://www.polarsys.org/capella/core/fa/",
+    "oa": "http://www.polarsys.org/capella/core/oa/",
+    "ctx": "http://www.polarsys.org/capella/core/ctx/",
+    "la": "http://www.polarsys.org/capella/core/la/",
+    "pa": "http://www.polarsys.org/capella/core/pa/",
+    "epbs": "http://www.polarsys.org/capella/core/epbs/",
+}
+REQUIREMENTS_NAMESPACES = {
+    "CapellaRequirements": "http://www.polarsys.org/capella/requirements",
+    "Requirements": "http://www.polarsys.org/kitalpha/requirements",
+}
+# the number of children of each function and component of the generated trees
+FAN_OUT = 5
+# the maximum number of functional exchanges of a functional chain
+CHAIN_LENGTH = 5
+PROPERTY_VALUE_TYPES = ["StringPropertyValue", "IntegerPropertyValue", "FloatPropertyValue", "BooleanPropertyValue"]
+REQUIREMENT_ATTRIBUTES = [("Priority", "StringValueAttribute", ["High", "Medium", "Low"]), ("Cost", "IntegerValueAttribute", None)]
+AFM = u'''<?xml version="1.0" encoding="UTF-8"?>
+<metadata:Metadata xmi:version="2.0" xmlns:xmi="http://www.omg.org/XMI" xmlns:metadata="http://www.polarsys.org/kitalpha/ad/metadata/1.0.0" id="{id}">
+  <viewpointReferences id="{reference_id}" vpId="org.polarsys.capella.core.viewpoint" version="{version}"/>
+</metadata:Metadata>
+'''
+AIRD = u'''<?xml version="1.0" encoding="UTF-8"?>
+<viewpoint:DAnalysis xmi:version="2.0" xmlns:xmi="http://www.omg.org/XMI" xmlns:viewpoint="http://www.eclipse.org/sirius/1.1.0" uid="{id}">
+  <semanticResources>{afm}</semanticResources>
+  <semanticResources>{capella}</semanticResources>
+</viewpoint:DAnalysis>
+'''
+# the layers with components, functions, exchanges, state machines, property values and requirements
+LAYERS = [
+    {"architecture": ("la", "LogicalArchitecture", "Logical Architecture"), "component": "LogicalComponent", "function": "LogicalFunction", "prefix": "la"},
+    {"architecture": ("pa", "PhysicalArchitecture", "Physical Architecture"), "component": "PhysicalComponent", "function": "PhysicalFunction", "prefix": "pa"},
+]
+
+
+def get_sizes(element_count):
+    """Gets the generator sizes producing about the given number of elements"""
+    return {
+        "components": max(1, element_count // 75),
+        "functions": max(1, element_count // 30),
+        "exchanges": max(1, element_count // 30),
+        "functional_chains": max(1, element_count // 2000),
+        "state_machines": max(1, element_count // 1000),
+        "requirements": max(1, element_count // 75),
+    }
+
+
+class ModelGenerator(object):
+    """Generates a synthetic model. Sizes are given per layer, the same random seed gives the same model"""
+    def __init__(self, components = 10, functions = 20, exchanges = 20, functional_chains = 2, state_machines = 2, states = 4,
+                 region_depth = 1, property_values = 2, requirements = 10, seed = 0, name = "Synthetic Model", capella_version = DEFAULT_CAPELLA_VERSION):
+        self.components = components
+        self.functions = functions
+        self.exchanges = exchanges
+        self.functional_chains = functional_chains
+        self.state_machines = state_machines
+        self.states = states
+        self.region_depth = region_depth
+        self.property_values = property_values
+        self.requirements = requirements
+        self.seed = seed
+        self.name = name
+        self.capella_version = capella_version
+        self.namespaces = dict(REQUIREMENTS_NAMESPACES)
+        for prefix, ns_uri in CAPELLA_NAMESPACES.items():
+            self.namespaces[prefix] = ns_uri + capella_version
+        self.random = None
+        self.resource = None
+    def new_id(self):
+        return str(uuid.UUID(int = self.random.getrandbits(128), version = 4))
+    def create(self, prefix, e_class_name, container = None, feature = None, name = None, **attributes):
+        """Creates an object with the given attributes (strings, objects or lists of objects) in the given feature of the given container"""
+        e_object = XMIObject(self.resource.get_e_class(self.namespaces[prefix], e_class_name), self.resource)
+        e_object_id = self.new_id()
+        e_object.attributes["id"] = e_object_id
+        if name is not None:
+            e_object.attributes["name"] = name
+        for feature_name, value in attributes.items():
+            if isinstance(value, XMIObject):
+                value = "#" + value.getId()
+            elif isinstance(value, list):
+                value = " ".join("#" + element.getId() for element in value)
+            e_object.attributes[feature_name] = value
+        if container is None:
+            self.resource.roots.append(e_object)
+        else:
+            container.add_child(feature, e_object)
+        self.resource.ids[e_object_id] = e_object
+        return e_object
+    def generate(self, path = None):
+        """Generates the model in a new resource with the given path"""
+        self.random = random.Random(self.seed)
+        self.resource = XMIResource(path)
+        for prefix in sorted(self.namespaces):
+            self.resource.get_e_package(self.namespaces[prefix], prefix)
+        project = self.create("capellamodeller", "Project", name = self.name)
+        self.create("libraries", "ModelInformation", project, "ownedExtensions")
+        system_engineering = self.create("capellamodeller", "SystemEngineering", project, "ownedModelRoots", self.name)
+        self.generate_operational_analysis(system_engineering)
+        self.generate_system_analysis(system_engineering)
+        for layer in LAYERS:
+            self.generate_layer(system_engineering, layer)
+        self.generate_epbs(system_engineering)
+        return self.resource
+    def generate_operational_analysis(self, system_engineering):
+        architecture = self.create("oa", "OperationalAnalysis", system_engineering, "ownedArchitectures", "Operational Analysis")
+        package = self.create("oa", "OperationalActivityPkg", architecture, "ownedFunctionPkg", "Operational Activities")
+        self.create("oa", "OperationalActivity", package, "ownedOperationalActivities", "Root Operational Activity")
+        self.create("oa", "EntityPkg", architecture, "ownedEntityPkg", "Operational Entities")
+    def generate_system_analysis(self, system_engineering):
+        architecture = self.create("ctx", "SystemAnalysis", system_engineering, "ownedArchitectures", "System Analysis")
+        package = self.create("ctx", "SystemFunctionPkg", architecture, "ownedFunctionPkg", "System Functions")
+        self.create("ctx", "SystemFunction", package, "ownedSystemFunctions", "Root System Function")
+        package = self.create("ctx", "SystemComponentPkg", architecture, "ownedSystemComponentPkg", "Structure")
+        system = self.create("ctx", "SystemComponent", package, "ownedSystemComponents", "System")
+        self.create("cs", "Part", package, "ownedParts", "System", abstractType = system)
+    def generate_epbs(self, system_engineering):
+        architecture = self.create("epbs", "EPBSArchitecture", system_engineering, "ownedArchitectures", "EPBS Architecture")
+        package = self.create("epbs", "ConfigurationItemPkg", architecture, "ownedConfigurationItemPkg", "Structure")
+        self.create("epbs", "ConfigurationItem", package, "ownedConfigurationItems", "System")
+    def generate_layer(self, system_engineering, layer):
+        prefix = layer["prefix"]
+        architecture_prefix, architecture_class, architecture_name = layer["architecture"]
+        architecture = self.create(architecture_prefix, architecture_class, system_engineering, "ownedArchitectures", architecture_name)
+        function_name = layer["function"]
+        package = self.create(prefix, function_name + "Pkg", architecture, "ownedFunctionPkg", architecture_name + " Functions")
+        root_function = self.create(prefix, function_name, package, "owned" + function_name + "s", "Root " + function_name)
+        functions = self.generate_tree(prefix, function_name, root_function, "ownedFunctions", self.functions)
+        leaf_functions = [function for function in functions if len(function.contents) == 0] or [root_function]
+        component_name = layer["component"]
+        package = self.create(prefix, component_name + "Pkg", architecture, "owned" + component_name + "Pkg", "Structure")
+        system = self.create(prefix, component_name, package, "owned" + component_name + "s", component_name.replace("Component", " System"))
+        self.create("cs", "Part", package, "ownedParts", system.getName(), abstractType = system)
+        components = self.generate_tree(prefix, component_name, system, "owned" + component_name + "s", self.components)
+        for component in components:
+            self.create("cs", "Part", component.eContainer(), "ownedFeatures", component.getName(), abstractType = component)
+            if prefix == "pa":
+                component.attributes["nature"] = "NODE" if component.eContainer() is system else "BEHAVIOR"
+        leaf_components = [component for component in [system] + components if not any(child.eClass().getName() == component_name for child in component.contents)]
+        allocations = {}
+        for index, function in enumerate(leaf_functions):
+            component = leaf_components[index % len(leaf_components)]
+            allocations[function] = component
+            self.create("fa", "ComponentFunctionalAllocation", component, "ownedFunctionalAllocation", sourceElement = component, targetElement = function)
+        exchanges = self.generate_exchanges(root_function, leaf_functions)
+        self.generate_component_exchanges(package, exchanges, allocations)
+        self.generate_functional_chains(root_function, exchanges)
+        self.generate_state_machines([system] + components)
+        self.generate_property_values([system] + components + leaf_functions)
+        self.generate_requirements(architecture, prefix, leaf_functions + components)
+    def generate_tree(self, prefix, e_class_name, root, feature, count):
+        """Generates the given number of objects in a tree of the given root, each object has FAN_OUT children"""
+        res = []
+        for index in range(count):
+            parent = root if index < FAN_OUT else res[index // FAN_OUT - 1]
+            res.append(self.create(prefix, e_class_name, parent, feature, e_class_name + " " + str(index + 1)))
+        return res
+    def generate_exchanges(self, root_function, functions):
+        """Generates functional exchanges between the given functions, each exchange has its own ports"""
+        res = []
+        for index in range(self.exchanges):
+            source = functions[index % len(functions)]
+            target = functions[self.random.randrange(len(functions))]
+            output_port = self.create("fa", "FunctionOutputPort", source, "outputs", "FOP " + str(index + 1))
+            input_port = self.create("fa", "FunctionInputPort", target, "inputs", "FIP " + str(index + 1))
+            res.append(self.create("fa", "FunctionalExchange", root_function, "ownedFunctionalExchanges", "Exchange " + str(index + 1), target = input_port, source = output_port))
+        return res
+    def generate_component_exchanges(self, package, exchanges, allocations):
+        """Generates a component exchange between the components of the functions of every other functional exchange"""
+        for index, exchange in enumerate(exchanges[::2]):
+            source = allocations[exchange.getSource().eContainer()]
+            target = allocations[exchange.getTarget().eContainer()]
+            source_port = self.create("fa", "ComponentPort", source, "ownedFeatures", "CP " + str(2 * index + 1), orientation = "OUT", kind = "FLOW")
+            target_port = self.create("fa", "ComponentPort", target, "ownedFeatures", "CP " + str(2 * index + 2), orientation = "IN", kind = "FLOW")
+            component_exchange = self.create("fa", "ComponentExchange", package, "ownedComponentExchanges", "C" + exchange.getName(), source = source_port, target = target_port, kind = "FLOW")
+            self.create("fa", "ComponentExchangeFunctionalExchangeAllocation", component_exchange, "ownedComponentExchangeFunctionalExchangeAllocations", sourceElement = component_exchange, targetElement = exchange)
+    def generate_functional_chains(self, root_function, exchanges):
+        """Generates functional chains following the outgoing exchanges of functions"""
+        outgoing = {}
+        for exchange in exchanges:
+            outgoing.setdefault(exchange.getSource().eContainer(), []).append(exchange)
+        for index in range(self.functional_chains):
+            chain = self.create("fa", "FunctionalChain", root_function, "ownedFunctionalChains", "Functional Chain " + str(index + 1))
+            exchange = exchanges[self.random.randrange(len(exchanges))] if len(exchanges) > 0 else None
+            function = exchange.getSource().eContainer() if exchange is not None else root_function
+            involvement = self.create("fa", "FunctionalChainInvolvementFunction", chain, "ownedFunctionalChainInvolvements", involved = function)
+            visited = set()
+            while exchange is not None and exchange not in visited and len(visited) < CHAIN_LENGTH:
+                visited.add(exchange)
+                function = exchange.getTarget().eContainer()
+                next_involvement = self.create("fa", "FunctionalChainInvolvementFunction", chain, "ownedFunctionalChainInvolvements", involved = function)
+                self.create("fa", "FunctionalChainInvolvementLink", chain, "ownedFunctionalChainInvolvements", involved = exchange, source = involvement, target = next_involvement)
+                involvement = next_involvement
+                candidates = outgoing.get(function)
+                exchange = candidates[self.random.randrange(len(candidates))] if candidates else None
+    def generate_state_machines(self, components):
+        for index in range(self.state_machines):
+            component = components[index % len(components)]
+            state_machine = self.create("capellacommon", "StateMachine", component, "ownedStateMachines", "State Machine " + str(index + 1))
+            self.generate_region(state_machine, "Default Region", 0)
+    def generate_region(self, container, name, depth):
+        """Generates a region with an initial state, a sequence of states and a final state, states have nested regions up to region_depth"""
+        region = self.create("capellacommon", "Region", container, "ownedRegions", name)
+        states = [self.create("capellacommon", "InitialPseudoState", region, "ownedStates", name + " Initial")]
+        for index in range(self.states):
+            state = self.create("capellacommon", "State", region, "ownedStates", name + " State " + str(index + 1))
+            if depth < self.region_depth:
+                self.generate_region(state, name + " State " + str(index + 1) + " Region", depth + 1)
+            states.append(state)
+        states.append(self.create("capellacommon", "FinalState", region, "ownedStates", name + " Final"))
+        for index in range(len(states) - 1):
+            self.create("capellacommon", "StateTransition", region, "ownedTransitions", triggerDescription = "event" + str(index + 1), source = states[index], target = states[index + 1])
+        return region
+    def generate_property_values(self, elements):
+        if self.property_values <= 0:
+            return
+        for element in elements:
+            group = self.create("capellacore", "PropertyValueGroup", element, "ownedPropertyValueGroups", "Synthetic")
+            for index in range(self.property_values):
+                e_class_name = PROPERTY_VALUE_TYPES[index % len(PROPERTY_VALUE_TYPES)]
+                if e_class_name == "StringPropertyValue":
+                    value = "value " + str(self.random.randrange(100))
+                elif e_class_name == "IntegerPropertyValue":
+                    value = str(self.random.randrange(1000))
+                elif e_class_name == "FloatPropertyValue":
+                    value = repr(round(self.random.random() * 100, 3))
+                else:
+                    value = "true" if self.random.random() < 0.5 else "false"
+                self.create("capellacore", e_class_name, group, "ownedPropertyValues", "PV" + str(index + 1), value = value)
+    def generate_requirements(self, architecture, prefix, elements):
+        """Generates a requirement module with requirements linked to the given elements"""
+        if self.requirements <= 0:
+            return
+        types_folder = self.create("CapellaRequirements", "CapellaTypesFolder", architecture, "ownedExtensions", ReqIFLongName = "Types")
+        requirement_type = self.create("Requirements", "RequirementType", types_folder, "ownedDefinitionTypes", ReqIFLongName = "Synthetic Requirement")
+        definitions = []
+        for name, attribute_class, values in REQUIREMENT_ATTRIBUTES:
+            definitions.append(self.create("Requirements", "AttributeDefinition", requirement_type, "ownedAttributes", ReqIFLongName = name))
+        module = self.create("CapellaRequirements", "CapellaModule", architecture, "ownedExtensions", ReqIFIdentifier = prefix.upper(), ReqIFLongName = "Synthetic Requirements")
+        folder = module
+        for index in range(self.requirements):
+            if index % 50 == 0:
+                folder = self.create("Requirements", "Folder", module, "ownedRequirements", ReqIFIdentifier = prefix.upper() + "-F" + str(index // 50 + 1), ReqIFLongName = "Chapter " + str(index // 50 + 1))
+            identifier = prefix.upper() + "-" + str(index + 1)
+            requirement = self.create("Requirements", "Requirement", folder, "ownedRequirements", ReqIFIdentifier = identifier, ReqIFName = identifier,
+                                      ReqIFChapterName = folder.attributes["ReqIFLongName"], ReqIFText = "The system shall satisfy requirement " + identifier + ".", requirementType = requirement_type)
+            for definition, (name, attribute_class, values) in zip(definitions, REQUIREMENT_ATTRIBUTES):
+                value = values[index % len(values)] if values is not None else str(self.random.randrange(100))
+                self.create("Requirements", attribute_class, requirement, "ownedAttributes", definition = definition, value = value)
+            element = elements[index % len(elements)]
+            if index % 2 == 0:
+                self.create("CapellaRequirements", "CapellaIncomingRelation", requirement, "ownedRelations", source = requirement, target = element)
+            else:
+                self.create("CapellaRequirements", "CapellaOutgoingRelation", element, "ownedExtensions", source = element, target = requirement)
+    def save(self, path):
+        """Generates the model and writes it in the given .capella file, with its .afm and .aird files. Returns the resource"""
+        resource = self.generate(path)
+        folder = os.path.dirname(path)
+        if folder and not os.path.isdir(folder):
+            os.makedirs(folder)
+        resource.save(path)
+        root = os.path.splitext(path)[0]
+        with io.open(root + ".afm", "w", encoding = "utf-8") as afm:
+            afm.write(AFM.format(id = "_" + self.new_id(), reference_id = "_" + self.new_id(), version = self.capella_version))
+        with io.open(root + ".aird", "w", encoding = "utf-8") as aird:
+            aird.write(AIRD.format(id = "_" + self.new_id(), afm = os.path.basename(root) + ".afm", capella = os.path.basename(path)))
+        return resource
+
+
+def generate_model(path = None, **sizes):
+    """Generates a model with the given sizes (see ModelGenerator), writes it in the given .capella file if not None"""
+    generator = ModelGenerator(**sizes)
+    if path is not None:
+        return generator.save(path)
+    return generator.generate()
+
+
+def main(args = None):
+    parser = argparse.ArgumentParser(prog = "python -m headless.generator", description = "Generates a synthetic Capella model")
+    parser.add_argument("--elements", type = int, help = "the approximate number of elements, sets the sizes not given explicitly")
+    for size in ["components", "functions", "exchanges", "functional_chains", "state_machines", "states", "region_depth", "property_values", "requirements", "seed"]:
+        parser.add_argument("--" + size.replace("_", "-"), type = int, dest = size)
+    parser.add_argument("--name", default = "Synthetic Model")
+    parser.add_argument("path", help = "the .capella file to write")
+    options = parser.parse_args(args)
+    sizes = get_sizes(options.elements) if options.elements is not None else {}
+    for size, value in vars(options).items():
+        if value is not None and size not in ("elements", "path"):
+            sizes[size] = value
+    resource = generate_model(options.path, **sizes)
+    print("%s: %d elements" % (options.path, len(resource.ids)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
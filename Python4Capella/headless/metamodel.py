@@ -0,0 +1,305 @@
+'''
+The part of the Capella metamodel needed to read a .capella file without the Ecore packages.
+
+A .capella file only stores the values of non derived features. The type of a feature is not
+written in the file, so the multiplicity, enumeration and boolean features are described here,
+and the derived features used by the simplified API are computed from the stored features.
+'''
+
+# features with a plural name holding a single value
+SINGLE_FEATURES = set([
+    "status", "process", "address",
+])
+
+# features with a singular name holding many values
+MANY_FEATURES = set([
+    "incoming", "outgoing", "ownedFunctionalAllocation", "ownedMigratedElements",
+    "entry", "exit", "do", "super", "sub",
+])
+
+# containment features which are not named owned...
+CONTAINMENT_FEATURES = set([
+    "specifiedValues",
+])
+
+# features holding a string even when their value starts with '#'
+STRING_FEATURES = set([
+    "id", "sid", "name", "description", "summary", "review", "value", "body", "text",
+    "ReqIFText", "ReqIFName", "ReqIFLongName", "ReqIFChapterName", "ReqIFPrefix", "ReqIFIdentifier",
+])
+
+# enumeration features with the name of their default literal
+ENUM_DEFAULTS = {
+    "aggregationKind": "UNSET",
+    "exchangeMechanism": "UNSET",
+    "kind": "UNSET",
+    "nature": "UNSET",
+    "operator": "UNSET",
+    "orientation": "UNSET",
+    "visibility": "UNSET",
+}
+
+# default literals depending on the EClass
+ENUM_CLASS_DEFAULTS = {
+    "CatalogElement": {"kind": "REC"},
+    "FunctionalChain": {"kind": "SIMPLE"},
+    "OperationalActivity": {"kind": "FUNCTION"},
+    "SystemFunction": {"kind": "FUNCTION"},
+    "LogicalFunction": {"kind": "FUNCTION"},
+    "PhysicalFunction": {"kind": "FUNCTION"},
+}
+
+# boolean features with their default value, any other boolean feature defaults to False
+BOOLEAN_DEFAULTS = {
+    "maxInclusive": True,
+    "minInclusive": True,
+    "unique": True,
+    "visibleInDoc": True,
+    "visibleInLM": True,
+}
+
+# attributes which are not strings, by EClass
+TYPED_ATTRIBUTES = {
+    ("BooleanPropertyValue", "value"): bool,
+    ("FloatPropertyValue", "value"): float,
+    ("IntegerPropertyValue", "value"): int,
+    ("LiteralBooleanValue", "value"): bool,
+    ("BooleanValueAttribute", "value"): bool,
+    ("IntegerValueAttribute", "value"): int,
+    ("RealValueAttribute", "value"): float,
+}
+
+# EClasses matching an abstract type name used in a derived feature
+SUB_CLASSES = {
+    "Operation": ["Service"],
+    "PhysicalArtifact": ["PhysicalComponent", "PhysicalLink", "PhysicalPort"],
+    "Component": ["Entity", "SystemComponent", "LogicalComponent", "PhysicalComponent", "ConfigurationItem"],
+}
+
+# EClasses of the architecture layers
+ARCHITECTURES = set(["OperationalAnalysis", "SystemAnalysis", "LogicalArchitecture", "PhysicalArchitecture", "EPBSArchitecture"])
+
+TRUE = "true"
+
+
+def is_many(feature):
+    """Tells if the given feature holds a list of values"""
+    if feature in MANY_FEATURES:
+        return True
+    if feature in SINGLE_FEATURES:
+        return False
+    return feature.endswith("s")
+
+
+def is_containment(feature):
+    """Tells if the values of the given feature are contained by their owner"""
+    return feature.startswith("owned") or feature in CONTAINMENT_FEATURES
+
+
+def get_singular(name):
+    """Gets the singular of the given plural type name"""
+    if name.endswith("ies"):
+        return name[:-3] + "y"
+    elif name.endswith("sses") or name.endswith("ches") or name.endswith("xes"):
+        return name[:-2]
+    elif name.endswith("is") or not name.endswith("s"):
+        return name
+    return name[:-1]
+
+
+def get_enum_default(e_class_name, feature):
+    """Gets the name of the default literal of the given enumeration feature, None if the feature is not an enumeration"""
+    defaults = ENUM_CLASS_DEFAULTS.get(e_class_name)
+    if defaults is not None and feature in defaults:
+        return defaults[feature]
+    return ENUM_DEFAULTS.get(feature)
+
+
+def decode_typed(e_class_name, feature, value):
+    """Decodes the string value of an attribute which is not a string, returns the string if the attribute is a string"""
+    value_type = TYPED_ATTRIBUTES.get((e_class_name, feature))
+    if value_type is None:
+        return value
+    elif value_type is bool:
+        return value == TRUE
+    return value_type(value)
+
+
+def is_instance_of(e_object, type_name):
+    """Tells if the EClass name of the given object matches the given type name, compared to the end of the EClass name"""
+    if type_name == "":
+        return True
+    e_class_name = e_object.eClass().getName()
+    if e_class_name.endswith(type_name):
+        return True
+    for sub_class in SUB_CLASSES.get(type_name, []):
+        if e_class_name.endswith(sub_class):
+            return True
+    return False
+
+
+def filter_type(e_objects, type_name):
+    """Gets the given objects matching the given type name"""
+    return [e_object for e_object in e_objects if e_object is not None and is_instance_of(e_object, type_name)]
+
+
+def get_inverse(e_object, reference):
+    """Gets the objects referencing the given object with the given reference, in the resource of the given object"""
+    resource = e_object.eResource()
+    if resource is None:
+        return []
+    return resource.get_inverse(e_object, reference)
+
+
+def get_traces(e_object, reference, trace_kind):
+    """Gets the traces of the given kind (Allocation, Realization) referencing the given object with the given reference"""
+    return [trace for trace in get_inverse(e_object, reference) if trace_kind in trace.eClass().getName()]
+
+
+def get_ports_and_self(e_object):
+    """Gets the given object and its direct contents, exchanges are connected to the ports of functions and components"""
+    res = [e_object]
+    res.extend(e_object.eContents())
+    return res
+
+
+def get_root_component(architecture):
+    """Gets the system of the given architecture: the first component of its root component package which is not an actor"""
+    for package in architecture.eContents():
+        if package.eClass().getName().endswith("ComponentPkg") or package.eClass().getName() == "ConfigurationItemPkg":
+            for component in package.eContents():
+                e_class_name = component.eClass().getName()
+                if e_class_name in ("SystemComponent", "LogicalComponent", "PhysicalComponent", "ConfigurationItem") and not component.isActor():
+                    return component
+    return None
+
+
+def get_architecture(e_object):
+    """Gets the architecture containing the given object"""
+    container = e_object.eContainer()
+    while container is not None:
+        if container.eClass().getName() in ARCHITECTURES:
+            return container
+        container = container.eContainer()
+    return None
+
+
+def is_system(component):
+    """Tells if the given component is the system of its architecture"""
+    architecture = get_architecture(component)
+    return architecture is not None and get_root_component(architecture) is component
+
+
+def derive_contained(e_object, type_name):
+    return filter_type(e_object.eContents(), type_name)
+
+
+def derive_allocated(e_object, type_name):
+    return filter_type([trace.getTargetElement() for trace in get_traces(e_object, "sourceElement", "Allocation")], type_name)
+
+
+def derive_allocating(e_object, type_name):
+    return filter_type([trace.getSourceElement() for trace in get_traces(e_object, "targetElement", "Allocation")], type_name)
+
+
+def derive_realized(e_object, type_name):
+    return filter_type([trace.getTargetElement() for trace in get_traces(e_object, "sourceElement", "Realization")], type_name)
+
+
+def derive_realizing(e_object, type_name):
+    return filter_type([trace.getSourceElement() for trace in get_traces(e_object, "targetElement", "Realization")], type_name)
+
+
+def derive_involved(e_object, type_name):
+    return filter_type([involvement.getInvolved() for involvement in e_object.eContents() if involvement.eIsSet("involved")], type_name)
+
+
+def derive_involving(e_object, type_name):
+    return filter_type([involvement.eContainer() for involvement in get_inverse(e_object, "involved")], type_name)
+
+
+def derive_incoming(e_object, type_name):
+    res = []
+    for end in get_ports_and_self(e_object):
+        res.extend(get_inverse(end, "target"))
+    return filter_type(res, type_name)
+
+
+def derive_outgoing(e_object, type_name):
+    res = []
+    for end in get_ports_and_self(e_object):
+        res.extend(get_inverse(end, "source"))
+    return filter_type(res, type_name)
+
+
+# derived features computed from a prefix of their name and the type name following it
+DERIVED_PREFIXES = [
+    ("contained", derive_contained),
+    ("allocated", derive_allocated),
+    ("allocating", derive_allocating),
+    ("realized", derive_realized),
+    ("realizing", derive_realizing),
+    ("involved", derive_involved),
+    ("involving", derive_involving),
+    ("incoming", derive_incoming),
+    ("outgoing", derive_outgoing),
+]
+
+
+def derive_end_port(e_object, feature, port_type):
+    port = e_object.get_feature(feature)
+    if port is not None and port.eClass().getName() == port_type:
+        return port
+    return None
+
+
+def derive_system(e_object):
+    if e_object.eClass().getName() in ARCHITECTURES:
+        return get_root_component(e_object)
+    return None
+
+
+def derive_super(e_object):
+    return [generalization.getSuper() for generalization in e_object.getOwnedGeneralizations() if generalization.getSuper() is not None]
+
+
+def derive_sub(e_object):
+    return [generalization.eContainer() for generalization in get_inverse(e_object, "super")]
+
+
+def derive_owned_system(e_object):
+    for component in e_object.eContents():
+        if is_system(component):
+            return component
+    return None
+
+
+# derived features computed by a dedicated function
+DERIVED_FEATURES = {
+    "sourceFunctionOutputPort": lambda e_object: derive_end_port(e_object, "source", "FunctionOutputPort"),
+    "targetFunctionInputPort": lambda e_object: derive_end_port(e_object, "target", "FunctionInputPort"),
+    "involvedElement": lambda e_object: e_object.get_feature("involved"),
+    "system": derive_system,
+    "super": derive_super,
+    "sub": derive_sub,
+    "ownedSystem": derive_owned_system,
+    "ownedLogicalSystem": derive_owned_system,
+}
+
+NOT_DERIVED = object()
+
+
+def get_derived_feature(e_object, feature):
+    """Computes the value of the given derived feature, NOT_DERIVED if the feature is not a known derived feature"""
+    function = DERIVED_FEATURES.get(feature)
+    if function is not None:
+        return function(e_object)
+    for prefix, function in DERIVED_PREFIXES:
+        if feature.startswith(prefix) and (len(feature) == len(prefix) or feature[len(prefix)].isupper()):
+            values = function(e_object, get_singular(feature[len(prefix):]))
+            if is_many(feature):
+                return values
+            elif len(values) > 0:
+                return values[0]
+            return None
+    return NOT_DERIVED
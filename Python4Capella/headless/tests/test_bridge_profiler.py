@@ -0,0 +1,86 @@
+import pytest
+
+from headless import install, load_simplified_api
+from headless.tests.test_headless import IFE_AIRD
+
+
+class GatewayClient(object):
+    """Records the commands a Py4J gateway client would send to Java"""
+    def __init__(self):
+        self.commands = []
+    def send_command(self, command, retry = True, binary = False):
+        self.commands.append(command)
+        return "ys" + command.split("\n")[2]
+
+
+class JavaProxy(object):
+    """Calls its methods through a gateway client as a Py4J proxy does"""
+    def __init__(self, gateway_client, target_id):
+        self._gateway_client = gateway_client
+        self._target_id = target_id
+    def getName(self):
+        return self._gateway_client.send_command("c\n" + self._target_id + "\ngetName\ne\n")[2:]
+
+
+@pytest.fixture(scope="module")
+def api():
+    runtime = install()
+    api = load_simplified_api(runtime, ("capella",))
+    runtime.include("workspace://Python4Capella/utilities/BridgeProfiler.py")
+    return api
+
+
+@pytest.fixture
+def profiler(api):
+    gateway_client = GatewayClient()
+    api.BridgeProfiler.enable(None, gateway_client)
+    api.BridgeProfiler.reset()
+    try:
+        yield api.BridgeProfiler
+    finally:
+        api.BridgeProfiler.disable()
+    assert "send_command" not in vars(gateway_client)
+
+
+def get_entries(entries, **values):
+    return [entry for entry in entries if all(entry[key] == value for key, value in values.items())]
+
+
+def test_gateway_round_trips(api, profiler):
+    element = api.CapellaElement(JavaProxy(profiler.gateway_client, "o7"))
+
+    assert element.get_name() == "getName"
+    report = profiler.get_report()
+    assert profiler.gateway_client.commands == ["c\no7\ngetName\ne\n"]
+    assert [(entry["name"], entry["calls"]) for entry in get_entries(report["functions"], category="java")] == [("getName", 1)]
+    assert [(entry["method"], entry["calls"]) for entry in get_entries(report["api_methods"], name="getName")] == [("CapellaElement.get_name", 1)]
+
+
+def test_bridge_function_attribution(api, profiler):
+    model = api.CapellaModel()
+    model.open(IFE_AIRD)
+    functions = model.get_system_engineering().get_all_contents_by_type(api.LogicalFunction)
+
+    report = profiler.get_report()
+    iterator_calls = get_entries(report["api_methods"], method="EObject.get_all_contents_by_type", name="iteratorNext")
+    assert len(iterator_calls) == 1 and iterator_calls[0]["calls"] >= len(functions)
+    assert get_entries(report["functions"], category="bridge", name="loadSiriusSession")[0]["calls"] == 1
+    assert report["split"]["java"] == 0.0
+
+
+def test_cache_category(api, profiler):
+    model = api.CapellaModel()
+    model.open(IFE_AIRD)
+    exchange = model.get_system_engineering().get_logical_architecture().get_all_contents_by_type(api.FunctionalExchange)[0]
+    profiler.reset()
+    api.capella_query_by_name(exchange, "Target")
+    api.capella_query_by_name(exchange, "Target")
+    model.get_element_by_id(exchange.get_id())
+
+    report = profiler.get_report()
+    assert get_entries(report["functions"], category="cache", name="QueryCache.get")[0]["calls"] == 2
+    assert get_entries(report["functions"], category="cache", name="ElementIndex.get_by_id")[0]["calls"] == 1
+    assert get_entries(report["functions"], category="bridge", name="capella_query_by_name")[0]["calls"] == 2
+    assert get_entries(report["functions"], category="bridge", name="QueryCache.get") == []
+    assert [entry for entry in report["call_sites"] if "Cache" in entry["name"] or "Index" in entry["name"]] == []
+    assert report["split"]["cache"] > 0.0
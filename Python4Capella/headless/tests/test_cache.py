@@ -0,0 +1,96 @@
+import os
+import shutil
+import subprocess
+import sys
+
+from headless import cache, load_resource
+from headless.tests.test_headless import IFE_CAPELLA
+
+
+def get_summary(resource):
+    return [(e_object.eClass().getName(), e_object.eContainingFeature(), sorted(e_object.attributes.items())) for e_object in resource.get_all_contents()]
+
+
+def get_model(resource):
+    """Gets everything read from the file: the objects with their EClass, container, raw attributes and texts"""
+    indexes = {}
+    res = []
+    for e_object in resource.get_all_contents():
+        indexes[e_object] = len(indexes)
+        container = e_object.eContainer()
+        texts = sorted((feature, list(value)) for feature, value in e_object.values.items() if not value.containment)
+        res.append((e_object.eClass().getEPackage().getNsURI(), e_object.eClass().getName(), None if container is None else indexes[container],
+                    e_object.eContainingFeature(), sorted(e_object.attributes.items()), texts))
+    return res
+
+
+def test_cached_resource(tmp_path):
+    cache_folder = str(tmp_path)
+    parsed = cache.load_cached_resource(IFE_CAPELLA, cache_folder)
+    cached = cache.load_cached_resource(IFE_CAPELLA, cache_folder)
+
+    assert os.path.exists(cache.get_cache_path(IFE_CAPELLA, cache_folder))
+    assert get_model(cached) == get_model(parsed) == get_model(load_resource(IFE_CAPELLA))
+    assert cached.get_capella_version() == "5.0.0"
+    system_engineering = cached.roots[0].getOwnedModelRoots().get(0)
+    assert cached.get_by_id(system_engineering.getId()) is system_engineering
+    assert sorted(cached.ids) == sorted(parsed.ids)
+    assert cache.inspect(IFE_CAPELLA, cache_folder)["objects"] == len(get_summary(parsed))
+
+
+def test_lazy_cached_resource(tmp_path):
+    cache_folder = str(tmp_path)
+    parsed = cache.load_cached_resource(IFE_CAPELLA, cache_folder)
+    cached = cache.load_cached_resource(IFE_CAPELLA, cache_folder)
+    function = [e_object for e_object in parsed.get_all_contents() if e_object.eClass().getName() == "LogicalFunction"][-1]
+
+    assert cached.get_created_count() == len(cached.roots) == 1
+    # only the function and its containers are created
+    cached_function = cached.get_by_id(function.getId())
+    depth = 0
+    container = function
+    while container is not None:
+        depth += 1
+        container = container.eContainer()
+    assert cached.get_created_count() == depth
+    assert cached_function.getName() == function.getName()
+    assert cached_function.eContainer().getId() == function.eContainer().getId()
+    assert [e_object.getId() for e_object in cached_function.eContainer().eContents()] == [e_object.getId() for e_object in function.eContainer().eContents()]
+    assert cached.get_by_id("unknown") is None
+    # references are resolved with the ids of the cache file
+    exchange = [e_object for e_object in parsed.get_all_contents() if e_object.eClass().getName() == "FunctionalExchange"][0]
+    assert cached.get_by_id(exchange.getId()).getTarget().getId() == exchange.getTarget().getId()
+    cached_function.setId("renamed")
+    assert cached.get_by_id("renamed") is cached_function
+
+
+def test_cache_validation(tmp_path):
+    model_path = str(tmp_path / "model.capella")
+    shutil.copy(IFE_CAPELLA, model_path)
+    cache_folder = str(tmp_path / "cache")
+    cache.warm(model_path, cache_folder)
+    # same content: still valid
+    os.utime(model_path, (0, 0))
+    assert cache.inspect(model_path, cache_folder)["valid"]
+    with open(model_path, "rb") as model_file:
+        content = model_file.read()
+    with open(model_path, "wb") as model_file:
+        model_file.write(content.replace(b'name="In-Flight Entertainment System"', b'name="In-Flight Entertainment Systen"', 1))
+    assert not cache.inspect(model_path, cache_folder)["valid"]
+
+    resource = cache.load_cached_resource(model_path, cache_folder)
+
+    assert "In-Flight Entertainment Systen" in [e_object.getName() for e_object in resource.get_all_contents() if e_object.eClass().getName() in ("Project", "SystemEngineering")]
+    assert len(resource.ids) == len(load_resource(model_path).ids)
+    assert cache.inspect(model_path, cache_folder)["valid"]
+    assert cache.evict(None, cache_folder) == [cache.get_cache_path(model_path, cache_folder)]
+    assert cache.inspect(model_path, cache_folder) is None
+
+
+def test_command_line(tmp_path):
+    # the package must not import headless.cache before it runs as __main__
+    output = subprocess.check_output([sys.executable, "-W", "error", "-m", "headless.cache", "--cache-folder", str(tmp_path), "warm", IFE_CAPELLA],
+                                     cwd = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), stderr = subprocess.STDOUT)
+
+    assert b"RuntimeWarning" not in output
+    assert os.path.exists(cache.get_cache_path(IFE_CAPELLA, str(tmp_path)))
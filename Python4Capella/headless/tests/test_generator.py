@@ -0,0 +1,79 @@
+from collections import Counter
+
+from headless import install, load_resource, load_simplified_api
+from headless.generator import ModelGenerator
+
+
+def get_counts(resource):
+    return Counter(e_object.eClass().getName() for e_object in resource.get_all_contents())
+
+
+def get_values(resource, e_class_name, feature):
+    """Gets the value of the given feature of all the objects of the given EClass: the ids of a list or of a single object"""
+    res = []
+    for e_object in resource.get_all_contents():
+        if e_object.eClass().getName() == e_class_name:
+            value = e_object.eGet(feature)
+            res.append([element.getId() for element in value] if isinstance(value, list) else value.getId())
+    return res
+
+
+def test_generate_model(tmp_path):
+    path = str(tmp_path / "synthetic.capella")
+    generated = ModelGenerator(components=12, functions=30, exchanges=40, state_machines=3, region_depth=1, requirements=8).save(path)
+    loaded = load_resource(path)
+
+    assert sorted(loaded.ids) == sorted(generated.ids)
+    assert (tmp_path / "synthetic.aird").exists() and (tmp_path / "synthetic.afm").exists()
+    assert ModelGenerator(seed=1).generate().roots[0].getId() == ModelGenerator(seed=1).generate().roots[0].getId()
+
+
+def test_simplified_api_on_generated_model():
+    runtime = install()
+    api = load_simplified_api(runtime, ("capella", "requirement", "pvmt"))
+    resource = ModelGenerator(components=12, functions=30, exchanges=40, functional_chains=2, state_machines=3, states=3, region_depth=1, requirements=8).generate()
+    runtime.open_resource(resource)
+    model = api.CapellaModel()
+    model.open(api.SystemEngineering(runtime.getEngineering(runtime.current_session)))
+    logical_architecture = model.get_system_engineering().get_logical_architecture()
+
+    assert logical_architecture.get_logical_system().get_name() == "Logical System"
+    assert len(logical_architecture.get_all_contents_by_type(api.LogicalComponent)) == 12
+    assert len(logical_architecture.get_all_contents_by_type(api.FunctionalExchange)) == 40
+    # 3 states, each with a nested region of 3 states
+    assert len(logical_architecture.get_all_contents_by_type(api.State)) == 3 * 12
+    functions = logical_architecture.get_all_contents_by_type(api.LogicalFunction)
+    assert len([function for function in functions if function.get_allocating_component() is not None]) == 25
+    assert api.PVMT.get_p_v_names(logical_architecture.get_logical_system()) == ["PV1", "PV2"]
+    assert sum(len(api.RequirementAddOn.get_incoming_requirements(function)) for function in functions) > 0
+
+
+def test_generated_model_round_trip(tmp_path):
+    path = str(tmp_path / "synthetic.capella")
+    generator = ModelGenerator(components=12, functions=30, exchanges=40, functional_chains=3, state_machines=2, states=3, region_depth=1, property_values=3, requirements=8)
+    generated = generator.save(path)
+    loaded = load_resource(path)
+    counts = get_counts(loaded)
+
+    assert counts == get_counts(generated)
+    # per layer: the root function and its tree, the system and the component tree, one part per component
+    assert counts["LogicalFunction"] == counts["PhysicalFunction"] == 31
+    assert counts["LogicalComponent"] == counts["PhysicalComponent"] == 13
+    assert counts["Part"] == 2 * 13 + 1
+    assert counts["FunctionalExchange"] == counts["FunctionInputPort"] == counts["FunctionOutputPort"] == 2 * 40
+    assert counts["ComponentExchange"] == 2 * 20 and counts["ComponentPort"] == 2 * 40
+    assert counts["FunctionalChain"] == 2 * 3
+    # a region of 3 states per state machine, each state with a nested region of 3 states
+    assert counts["StateMachine"] == 2 * 2 and counts["Region"] == 2 * 2 * 4
+    assert counts["State"] == 2 * 2 * 12 and counts["StateTransition"] == 2 * 2 * 4 * 4
+    assert counts["Requirement"] == 2 * 8 and counts["CapellaIncomingRelation"] == counts["CapellaOutgoingRelation"] == 2 * 4
+    # the multiplicity of the features is guessed from their name (see headless.metamodel), it must survive the round trip
+    for e_class_name, feature in [("LogicalComponent", "ownedFunctionalAllocation"), ("PhysicalComponent", "ownedFunctionalAllocation"),
+                                  ("FunctionalChain", "ownedFunctionalChainInvolvements"), ("State", "ownedRegions"), ("Region", "ownedStates"),
+                                  ("PropertyValueGroup", "ownedPropertyValues"), ("Requirement", "ownedAttributes"),
+                                  ("FunctionalExchange", "source"), ("FunctionalExchange", "target"), ("StateTransition", "target"),
+                                  ("Part", "abstractType"), ("FunctionalChainInvolvementLink", "involved")]:
+        assert get_values(loaded, e_class_name, feature) == get_values(generated, e_class_name, feature), feature
+    allocations = get_values(loaded, "LogicalComponent", "ownedFunctionalAllocation")
+    assert sum(len(value) for value in allocations) == counts["ComponentFunctionalAllocation"] // 2
+    assert max(len(value) for value in allocations) > 1
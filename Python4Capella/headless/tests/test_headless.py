@@ -0,0 +1,294 @@
+import gc
+import os
+
+import pytest
+
+from headless import install, load_resource, load_simplified_api, run_script
+from headless.ease import WORKSPACE
+
+IFE_AIRD = "/In-Flight Entertainment System/In-Flight Entertainment System.aird"
+IFE_CAPELLA = os.path.join(WORKSPACE, "In-Flight Entertainment System", "In-Flight Entertainment System.capella")
+
+
+@pytest.fixture(scope="module")
+def api():
+    return load_simplified_api(install(), ("capella", "requirement"))
+
+
+@pytest.fixture(scope="module")
+def model(api):
+    model = api.CapellaModel()
+    model.open(IFE_AIRD)
+    return model
+
+
+@pytest.fixture(scope="module")
+def se(model):
+    return model.get_system_engineering()
+
+
+def test_load_resource():
+    resource = load_resource(IFE_CAPELLA)
+    project = resource.roots[0]
+
+    assert project.eClass().getName() == "Project"
+    assert resource.get_capella_version() == "5.0.0"
+    system_engineering = project.getOwnedModelRoots().get(0)
+    assert system_engineering.getName() == "In-Flight Entertainment System"
+    assert system_engineering.eClass().getEPackage().getNsURI() == "http://www.polarsys.org/capella/core/modeller/5.0.0"
+    assert [architecture.eClass().getName() for architecture in system_engineering.getOwnedArchitectures()] == [
+        "OperationalAnalysis", "SystemAnalysis", "LogicalArchitecture", "PhysicalArchitecture", "EPBSArchitecture"]
+
+
+def test_tree_iterator_prune():
+    system_engineering = load_resource(IFE_CAPELLA).roots[0].getOwnedModelRoots().get(0)
+    iterator = system_engineering.eAllContents()
+    architectures = []
+    while iterator.hasNext():
+        value = iterator.next()
+        if value.eClass().getName().endswith(("Analysis", "Architecture")):
+            architectures.append(value.eClass().getName())
+            iterator.prune()
+
+    assert len(architectures) == 5
+
+
+def test_simplified_api(api, se):
+    logical_architecture = se.get_logical_architecture()
+
+    assert len(se.get_all_contents_by_type(api.LogicalFunction)) == 64
+    assert isinstance(logical_architecture.get_logical_system(), api.LogicalSystem)
+    assert logical_architecture.get_logical_system().get_name() == "IFE System"
+    assert api.capella_version() == "5.0.0"
+
+
+def test_derived_features(api, se):
+    media_server = [component for component in se.get_all_contents_by_type(api.LogicalComponent) if component.get_name() == "Media Server"][0]
+
+    assert sorted(function.get_name() for function in media_server.get_allocated_functions()) == ["Load Digital Media ", "Store Digital Media"]
+    for function in media_server.get_allocated_functions():
+        assert function.get_allocating_component() == media_server
+    exchange = se.get_logical_architecture().get_all_contents_by_type(api.FunctionalExchange)[0]
+    assert exchange.get_source_function().get_name() == "Capture Aircraft Notifications and Parameters"
+    assert exchange.get_target_function().get_name() == "Determine Operating Profiles"
+
+
+def test_query_cache(api, model, se):
+    exchange = se.get_logical_architecture().get_all_contents_by_type(api.FunctionalExchange)[0]
+    hits = api.capella_query_cache_info()["hits"]
+
+    targets = api.capella_query_by_name(exchange, "Target")
+    assert api.capella_query_by_name(exchange, "Target") == targets
+    assert api.capella_query_cache_info()["hits"] == hits + 1
+    model.start_transaction()
+    assert api.capella_query_cache_info()["size"] == 0
+    assert api.capella_query_by_name(exchange, "Target") == targets
+    assert api.capella_query_cache_info()["size"] == 0
+    model.commit_transaction()
+    api.capella_query_by_name(exchange, "Target")
+    assert api.capella_query_cache_info()["size"] == 1
+
+
+def test_refused_transaction(api, model, se, monkeypatch):
+    def start_transaction(session):
+        raise RuntimeError("read only session")
+    monkeypatch.setattr(api.Sirius, "start_transaction", staticmethod(start_transaction))
+    exchange = se.get_logical_architecture().get_all_contents_by_type(api.FunctionalExchange)[0]
+
+    with pytest.raises(RuntimeError):
+        model.start_transaction()
+    assert not model.is_in_transaction()
+    assert [index.transaction_depth for index in (api.query_cache, api.inverse_reference_index, api.property_value_index, api.requirement_attribute_index,
+                                                  api.container_chain_cache, api.element_index)] == [0] * 6
+    api.capella_query_by_name(exchange, "Target")
+    assert api.capella_query_cache_info()["size"] > 0
+
+
+def test_query_many(api, se):
+    exchanges = se.get_logical_architecture().get_all_contents_by_type(api.FunctionalExchange)[:6]
+    api.query_cache.clear()
+    api.capella_query_by_name(exchanges[0], "Source")
+    info = api.capella_query_cache_info()
+
+    sources = api.capella_query_by_name_many(exchanges, "Source")
+    assert list(sources) == exchanges
+    assert [[source.get_java_object() for source in sources[exchange]] for exchange in exchanges] == [[exchange.get_java_object().getSource()] for exchange in exchanges]
+    assert api.capella_query_cache_info()["hits"] == info["hits"] + 1
+    assert api.capella_query_cache_info()["size"] == info["size"] + 5
+    assert [api.capella_query_by_name(exchange, "Source") for exchange in exchanges] == list(sources.values())
+
+
+def test_query_cache_eviction(api):
+    cache = api.QueryCache(2)
+    cache.put("a", [1])
+    cache.put("b", [2])
+    assert cache.get("a") == [1]
+    cache.put("c", [3])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [1] and cache.get("c") == [3]
+    assert cache.cache_info() == {"hits": 3, "misses": 1, "evictions": 1, "invalidations": 0, "size": 2, "max_size": 2}
+
+
+def test_element_index(api, model, se):
+    function = se.get_all_contents_by_type(api.LogicalFunction)[3]
+    api.element_index.clear()
+    builds = api.element_index.index_info()["builds"]
+
+    assert model.get_element_by_id(function.get_id()) == function
+    assert model.get_elements_by_ids([se.get_id(), "unknown", function.get_id()]) == [se, None, function]
+    model.start_transaction()
+    function_id = function.get_id()
+    function.set_id("renamed")
+    assert model.get_element_by_id(function_id) is None
+    function.set_id(function_id)
+    model.commit_transaction()
+    assert model.get_element_by_id(function_id) == function
+    assert api.element_index.index_info()["builds"] == builds + 1
+
+
+def test_element_index_per_session(api, model, se):
+    function = se.get_all_contents_by_type(api.LogicalFunction)[4]
+    other_model = api.CapellaModel()
+    other_model.open(function)
+    api.element_index.clear()
+    builds = api.element_index.index_info()["builds"]
+
+    assert model.get_element_by_id(function.get_id()) == function
+    assert other_model.get_element_by_id(function.get_id()) == function
+    assert api.element_index.index_info()["sessions"] == 1
+    # a transaction of another model of the session is seen by the index
+    other_model.start_transaction()
+    function_id = function.get_id()
+    function.set_id("renamed")
+    assert model.get_element_by_id(function_id) is None
+    other_model.commit_transaction()
+    assert model.get_element_by_id("renamed") == function
+    function.set_id(function_id)
+    assert model.get_element_by_id(function_id) == function
+    assert api.element_index.index_info()["builds"] == builds + 1
+
+
+def test_element_index_added_elements(api, model, se):
+    function = se.get_all_contents_by_type(api.LogicalFunction)[5]
+    model.start_transaction()
+    api.element_index.clear()
+    builds = api.element_index.index_info()["builds"]
+    # built inside the transaction
+    assert model.get_element_by_id(function.get_id()) == function
+    package = api.LogicalFunctionPkg()
+    package.get_owned_logical_functions().add(api.LogicalFunction())
+    function.get_owned_logical_function_pkgs().add(package)
+    added_function = package.get_owned_logical_functions()[0]
+    assert model.get_element_by_id(package.get_id()) is None
+    model.commit_transaction()
+
+    assert api.element_index.transaction_depth == 0
+    assert model.get_element_by_id(package.get_id()) == package
+    assert model.get_element_by_id(added_function.get_id()) == added_function
+    assert api.element_index.index_info()["builds"] == builds + 1
+    # removed elements are no longer found
+    function.get_owned_logical_function_pkgs().remove(package)
+    assert model.get_element_by_id(package.get_id()) is None
+
+
+def test_inverse_reference_index(api, model, se):
+    exchange = se.get_logical_architecture().get_all_contents_by_type(api.FunctionalExchange)[0]
+    port = exchange.get_java_object().getTarget()
+
+    assert api.capella_inverse(port, "target") == list(api.e_inverse(port, "target"))
+    assert exchange.get_java_object() in api.capella_inverse(port, "target")
+    assert api.resource_sessions[port.eResource()] is model.session
+    info = api.capella_inverse_index_info()
+    model.start_transaction()
+    added_exchange = api.FunctionalExchange()
+    added_exchange.get_java_object().setTarget(port)
+    exchanges = api.create_e_list(exchange.get_java_object().eContainer().getOwnedFunctionalExchanges(), api.FunctionalExchange)
+    exchanges.add(added_exchange)
+    model.commit_transaction()
+
+    # the added exchange is indexed without building the index again
+    assert api.capella_inverse(port, "target") == list(api.e_inverse(port, "target"))
+    assert added_exchange.get_java_object() in api.capella_inverse(port, "target")
+    assert api.capella_inverse_index_info()["builds"] == info["builds"]
+    assert api.capella_inverse_index_info()["updates"] == info["updates"] + 1
+    exchanges.remove(added_exchange)
+    assert added_exchange.get_java_object() not in api.capella_inverse(port, "target")
+    assert api.capella_inverse(port, "target") == list(api.e_inverse(port, "target"))
+
+
+def test_container_chain_cache(api, model, se):
+    function = se.get_logical_architecture().get_all_contents_by_type(api.LogicalFunction)[5]
+
+    assert api.RequirementAddOn.get_system_engineering(function) == se
+    assert api.RequirementAddOn.get_system_engineering(se) is None
+    assert function.get_architecture() == se.get_logical_architecture()
+    assert se.get_logical_architecture().get_architecture() == se.get_logical_architecture()
+    assert se.get_architecture() is None
+    walks = api.container_chain_cache.cache_info()["walks"]
+    function.get_architecture()
+    assert api.container_chain_cache.cache_info()["walks"] == walks + 1
+    model.start_transaction()
+    model.commit_transaction()
+    assert api.container_chain_cache.cache_info()["size"] == 0
+
+
+def test_iter_all_contents_prune(api, se):
+    logical_architecture = se.get_logical_architecture()
+    contents = list(se.iter_all_contents(lambda element: element == logical_architecture))
+
+    assert logical_architecture in contents
+    assert not set(contents) & set(logical_architecture.get_all_contents())
+    assert len(contents) == len(se.get_all_contents()) - len(logical_architecture.get_all_contents())
+    assert list(se.iter_all_contents_by_type(api.LogicalFunction, lambda element: element == logical_architecture)) == []
+
+
+def test_iter_all_contents_by_type(api, se):
+    contents = se.get_all_contents()
+
+    for cls in [api.LogicalFunction, api.LogicalComponent, api.LogicalActor, api.PhysicalComponent, api.BehaviorPC, api.NodePC, api.Requirement]:
+        assert se.get_all_contents_by_type(cls) == [element for element in contents if isinstance(element, cls)]
+    assert api.e_class_resolver.get_pruned_e_class_names(api.e_class_resolver.get_e_class_names(api.BehaviorPC)) == set(
+        ["OperationalAnalysis", "SystemAnalysis", "LogicalArchitecture", "EPBSArchitecture"])
+
+
+def test_e_class_names_of_included_subclass(api):
+    assert "SyntheticActor" not in api.e_class_resolver.get_e_class_names(api.LogicalActor)
+    exec("class SyntheticActor(LogicalActor):\n    __slots__ = ()", vars(api))
+    try:
+        assert "SyntheticActor" in api.e_class_resolver.get_e_class_names(api.LogicalActor)
+    finally:
+        del api.SyntheticActor
+        gc.collect()
+
+
+def test_e_class_resolver(api, se):
+    resolver = api.EClassResolver()
+    function = se.get_all_contents_by_type(api.LogicalFunction)[0].get_java_object()
+    component = se.get_logical_architecture().get_logical_system().get_java_object()
+
+    assert resolver.resolve(function) is api.LogicalFunction
+    assert resolver.resolve(function) is api.LogicalFunction
+    assert resolver.cache_info() == {"hits": 1, "misses": 1, "discriminated": 0, "size": 1}
+    # chosen per instance: neither a hit nor cached
+    assert resolver.resolve(component) is api.LogicalSystem
+    assert resolver.cache_info() == {"hits": 1, "misses": 1, "discriminated": 1, "size": 1}
+    assert resolver.resolve_by_name(function, "UnknownEClass") is None
+    assert resolver.cache_info()["size"] == 1
+    resolver.cache_clear()
+    assert resolver.cache_info() == {"hits": 0, "misses": 0, "discriminated": 0, "size": 0}
+
+
+def test_unsupported_query(api, se):
+    port = se.get_all_contents_by_type(api.ComponentPort)[0]
+    with pytest.raises(NotImplementedError):
+        port.get_provided_interfaces()
+
+
+def test_run_script(capsys):
+    script = os.path.join(WORKSPACE, "Python4Capella", "sample_scripts", "List_logical_functions_in_console.py")
+    run_script(script, model_path=IFE_AIRD)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "The model name is <teste> In-Flight Entertainment System"
+    assert len(lines) == 65
@@ -0,0 +1,96 @@
+import pytest
+
+from headless import install, load_simplified_api
+from headless.tests.test_headless import IFE_AIRD
+from headless.xmi import XMIEList
+
+
+@pytest.fixture(scope="module")
+def api():
+    return load_simplified_api(install(), ("capella",))
+
+
+@pytest.fixture(scope="module")
+def se(api):
+    model = api.CapellaModel()
+    model.open(IFE_AIRD)
+    return model.get_system_engineering()
+
+
+@pytest.fixture
+def functions(api, se):
+    return [function.get_java_object() for function in se.get_all_contents_by_type(api.LogicalFunction)[:10]]
+
+
+def test_java_list_bulk_reads(api, functions):
+    java_list = api.JavaList(XMIEList(functions), api.LogicalFunction)
+    wrapped = [api.LogicalFunction(function) for function in functions]
+
+    assert java_list.to_list() == java_list.to_list(3) == list(java_list) == wrapped
+    assert java_list.get_range(2, 5) == java_list[2:5] == wrapped[2:5]
+    assert java_list.get_range(5, 2) == []
+    assert [len(chunk) for chunk in java_list.iter_chunks(4)] == [4, 4, 2]
+    assert sum(java_list.iter_chunks(4), []) == wrapped
+    assert java_list[-1] == java_list.get(9) == wrapped[-1]
+    assert java_list[::3] == wrapped[::3]
+    with pytest.raises(IndexError):
+        java_list[10]
+
+
+def test_java_list_element_class(api, se):
+    project = se.get_java_object().eContainer()
+    java_list = api.JavaList(XMIEList([project, None]), api.CapellaElement)
+
+    # no simplified API class for a Project: both accessors fall back to the class of the list
+    assert type(java_list[0]) is type(java_list.get(0)) is api.CapellaElement
+    assert java_list[1] is java_list.get(1) is None
+
+
+def test_java_list_iteration_sees_added_elements(api, functions):
+    java_list = api.JavaList(XMIEList(functions[:3]), api.LogicalFunction)
+    visited = []
+    for chunk in java_list.iter_chunks(2):
+        visited.extend(chunk)
+        if len(java_list) < 5:
+            java_list.get_java_object().add(functions[len(java_list)])
+
+    assert visited == [api.LogicalFunction(function) for function in functions[:5]]
+
+
+class JavaProxy(object):
+    """Counts the calls a Py4J proxy would send to Java"""
+    def __init__(self, target_id, java_hash_code):
+        self._target_id = target_id
+        self.java_hash_code = java_hash_code
+        self.calls = 0
+    def __eq__(self, other):
+        self.calls += 1
+        return isinstance(other, JavaProxy) and self.java_hash_code == other.java_hash_code
+    def __hash__(self):
+        self.calls += 1
+        return self.java_hash_code
+
+
+def test_wrapper_equality(api, functions):
+    function = api.LogicalFunction(functions[0])
+    element = api.CapellaElement(functions[0])
+
+    # a new wrapper for each wrap, equal to the others wrapping the same Java Object
+    assert api.LogicalFunction(functions[0]) is not function
+    assert element == function and hash(element) == hash(function)
+    assert len(set([function, element, api.LogicalFunction(functions[0])])) == 1
+    assert function != api.LogicalFunction(functions[1])
+    assert not hasattr(function, "__dict__")
+
+
+def test_wrapper_hash_without_java_calls(api):
+    proxy = JavaProxy("o1", 42)
+    wrapper = api.JavaObject(proxy)
+
+    assert wrapper == api.JavaObject(proxy)
+    assert proxy.calls == 0
+    assert hash(wrapper) == hash(wrapper) == 42
+    assert proxy.calls == 1
+    # another proxy of the same Java object
+    other = api.JavaObject(JavaProxy("o2", 42))
+    assert other == wrapper and hash(other) == hash(wrapper)
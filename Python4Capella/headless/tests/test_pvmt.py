@@ -0,0 +1,140 @@
+import pytest
+
+from headless import install, load_simplified_api
+from headless.generator import ModelGenerator
+
+
+@pytest.fixture(scope="module")
+def api():
+    return load_simplified_api(install(), ("capella", "pvmt"))
+
+
+@pytest.fixture(scope="module")
+def model(api):
+    runtime = install()
+    runtime.open_resource(ModelGenerator(components=6, functions=10, exchanges=10, property_values=4, requirements=0).generate())
+    model = api.CapellaModel()
+    model.open(api.SystemEngineering(runtime.getEngineering(runtime.current_session)))
+    return model
+
+
+@pytest.fixture(scope="module")
+def components(api, model):
+    return model.get_system_engineering().get_logical_architecture().get_all_contents_by_type(api.LogicalComponent)
+
+
+def test_get_p_v_values(api, components):
+    component = components[0]
+    values = api.PVMT.get_p_v_values(component)
+
+    assert list(values) == api.PVMT.get_p_v_names(component) == ["PV1", "PV2", "PV3", "PV4"]
+    assert api.PVMT.get_p_v_values(component, "Synthetic") == values
+    assert api.PVMT.get_p_v_values(component, "unknown") == {}
+    assert [api.PVMT.get_p_v_value(component, name) for name in values] == [str(value) for value in values.values()]
+    assert api.PVMT.is_p_v_defined(component, "PV4") and not api.PVMT.is_p_v_defined(component, "PV5")
+    assert api.PVMT.get_p_v_value(component, "PV5") is None
+
+
+def test_typed_p_v_values(api, components):
+    component = components[2]
+    property_values = component.get_java_object().getOwnedPropertyValueGroups().get(0).getOwnedPropertyValues()
+
+    assert [type(api.PVMT.get_typed_p_v_value(component, name)) for name in ["PV1", "PV2", "PV3", "PV4"]] == [str, int, float, bool]
+    assert api.PVMT.get_p_v_value(component, "PV4") == str(api.PVMT.get_typed_p_v_value(component, "PV4"))
+    assert [api.PropertyValue(property_value).get_typed_value() for property_value in property_values] == list(api.PVMT.get_p_v_values(component).values())
+    assert api.PVMT.get_typed_p_v_value(component, "PV5") is None
+
+
+def test_property_value_index_invalidation(api, model, components):
+    component = components[1]
+    property_value = component.get_java_object().getOwnedPropertyValueGroups().get(0).getOwnedPropertyValues().get(0)
+    previous = api.PVMT.get_p_v_value(component, "PV1")
+
+    model.start_transaction()
+    property_value.setName("Renamed")
+    assert api.PVMT.get_p_v_value(component, "Renamed") == previous
+    model.commit_transaction()
+    assert api.PVMT.get_p_v_value(component, "PV1") is None
+    assert api.property_value_index.index_info()["elements"] == 1
+
+
+def test_extract_table(api, components):
+    table = api.PVMT.extract_table(components, ["PV2", "PV4", "PV9"], {"PV2": float})
+    values = [api.PVMT.get_p_v_values(component)["PV2"] for component in components if api.PVMT.is_p_v_defined(component, "PV2")]
+    statistics = api.PVMT.get_statistics(table["PV2"])
+
+    assert list(table) == ["PV2", "PV4", "PV9"]
+    assert statistics["count"] == len(values) > 0
+    assert statistics["min"] == min(values) and statistics["max"] == max(values)
+    assert statistics["mean"] == pytest.approx(float(sum(values)) / len(values))
+    assert api.PVMT.get_statistics(table["PV9"])["count"] == 0
+    rollup = api.PVMT.rollup(table["PV2"], [index % 2 for index in range(len(components))])
+    assert list(rollup) == [0, 1]
+    assert rollup[0]["count"] + rollup[1]["count"] == len(values)
+    assert rollup[0]["sum"] + rollup[1]["sum"] == pytest.approx(sum(values))
+
+
+def test_set_p_v_values(api, model, components):
+    res = api.PVMT.set_p_v_values(dict((component, {"PV2": "50", "Progress": 0.5, "Done": False}) for component in components[3:5]), "Status", model)
+
+    # PV2 already exists on each element: one updated and two created property values per element
+    assert res == {"created": 4, "updated": 2, "elements": 2, "groups": 2}
+    for component in components[3:5]:
+        assert api.PVMT.get_p_v_values(component, "Status") == {"Progress": 0.5, "Done": False}
+        assert api.PVMT.get_typed_p_v_value(component, "PV2") == 50
+    assert api.PVMT.set_p_v_values({components[3]: {"Progress": "0.75", "PV2": 3.0}, components[4]: {}}) == {"created": 0, "updated": 2, "elements": 1, "groups": 0}
+    assert api.PVMT.get_typed_p_v_value(components[3], "Progress") == 0.75
+    assert api.PVMT.get_typed_p_v_value(components[3], "PV2") == 3
+
+
+@pytest.fixture(scope="module")
+def literals(api, model):
+    ns_uri = "http://www.polarsys.org/capella/core/core/" + api.capella_version()
+    model.start_transaction()
+    enumeration = api.create_e_object(ns_uri, "EnumerationPropertyType")
+    enumeration.setName("Phase")
+    model.get_system_engineering().get_logical_architecture().get_java_object().getOwnedEnumerationPropertyTypes().add(enumeration)
+    for name in ["TODO", "DONE"]:
+        literal = api.create_e_object(ns_uri, "EnumerationPropertyLiteral")
+        literal.setName(name)
+        enumeration.getOwnedLiterals().add(literal)
+    model.commit_transaction()
+    return [api.EnumerationPropertyLiteral(literal) for literal in enumeration.getOwnedLiterals()]
+
+
+def test_set_p_v_values_new_enumeration(api, model, components, literals):
+    api.PVMT.set_p_v_values({components[0]: {"Phase": literals[0]}}, "Status", model)
+    property_value = components[0].get_java_object().getOwnedPropertyValueGroups().get(1).getOwnedPropertyValues().get(0)
+
+    assert property_value.eClass().getName() == "EnumerationPropertyValue"
+    assert property_value.getType() == literals[0].get_java_object().eContainer()
+    assert api.PVMT.get_typed_p_v_value(components[0], "Phase") == literals[0]
+
+
+def test_set_p_v_values_enumeration_names(api, model, components, literals):
+    api.PVMT.set_p_v_values({components[1]: {"Phase": literals[0]}}, "Status", model)
+
+    api.PVMT.set_p_v_values({components[1]: {"Phase": "DONE"}}, "Status", model)
+    assert api.PVMT.get_typed_p_v_value(components[1], "Phase") == literals[1]
+    with pytest.raises(ValueError):
+        api.PVMT.set_p_v_values({components[1]: {"Phase": "CANCELLED"}}, "Status", model)
+    assert api.PVMT.get_typed_p_v_value(components[1], "Phase") == literals[1]
+
+
+def test_set_p_v_values_errors(api, model, components):
+    # PV2 is an IntegerPropertyValue
+    value = api.PVMT.get_typed_p_v_value(components[5], "PV2")
+    with pytest.raises(ValueError):
+        api.PVMT.set_p_v_values({components[5]: {"PV2": 2.5}}, "Status", model)
+    assert not model.is_in_transaction()
+    assert api.PVMT.get_typed_p_v_value(components[5], "PV2") == value
+    # in a transaction already started, the values are written in it
+    other_model = api.CapellaModel()
+    other_model.open(components[5])
+    other_model.start_transaction()
+    assert model.is_in_transaction()
+    api.PVMT.set_p_v_values({components[5]: {"PV2": 7}}, "Status", model)
+    assert model.is_in_transaction()
+    other_model.commit_transaction()
+    assert not model.is_in_transaction()
+    assert api.PVMT.get_typed_p_v_value(components[5], "PV2") == 7
@@ -0,0 +1,124 @@
+import pytest
+
+from headless import install, load_simplified_api
+from headless.generator import ModelGenerator
+
+
+@pytest.fixture(scope="module")
+def api():
+    return load_simplified_api(install(), ("capella", "requirement"))
+
+
+@pytest.fixture(scope="module")
+def model(api):
+    runtime = install()
+    runtime.open_resource(ModelGenerator(components=6, functions=20, exchanges=10, requirements=12).generate())
+    model = api.CapellaModel()
+    model.open(api.SystemEngineering(runtime.getEngineering(runtime.current_session)))
+    return model
+
+
+@pytest.fixture(scope="module")
+def se(model):
+    return model.get_system_engineering()
+
+
+def test_traceability_matrix(api, se):
+    functions = se.get_all_contents_by_type(api.LogicalFunction) + se.get_all_contents_by_type(api.PhysicalFunction)
+    requirements = [requirement for requirement in se.get_all_contents_by_type(api.Requirement) if not isinstance(requirement, api.Folder)]
+    matrix = api.RequirementAddOn.build_traceability_matrix(se, (api.LogicalFunction, api.PhysicalFunction))
+
+    assert matrix.get_shape()[0] == len(requirements) and matrix.get_shape()[1] >= len(functions)
+    for requirement in requirements:
+        linked = requirement.get_outgoing_linked_elems() + requirement.get_incoming_linked_elems()
+        assert sorted(element.get_id() for element in matrix.get_linked_elements(requirement)) == sorted(set(element.get_id() for element in linked))
+        assert matrix.requirements[matrix.row_index[requirement.get_java_object().getId()]] == requirement.get_java_object()
+    function = functions[0]
+    assert sorted(requirement.get_id() for requirement in matrix.get_linked_requirements(function)) == sorted(requirement.get_id() for requirement in api.RequirementAddOn.get_incoming_requirements(function) + api.RequirementAddOn.get_outgoing_requirements(function))
+    untraced = matrix.get_untraced_elements()
+    assert len(untraced) > 0 and all(len(api.RequirementAddOn.get_incoming_requirements(element)) == 0 for element in untraced)
+    data, rows, columns = matrix.get_coo()
+    assert sum(data) == sum(len(requirement.get_outgoing_linked_elems() + requirement.get_incoming_linked_elems()) for requirement in requirements)
+    coverage = matrix.get_coverage()
+    assert sum(layer["requirements"] for layer in coverage.values()) == len(requirements)
+    assert coverage["Logical Architecture"]["traced_elements"] > 0
+
+
+def test_attributes_table(api, se):
+    requirements = [requirement for requirement in se.get_all_contents_by_type(api.Requirement) if not isinstance(requirement, api.Folder)]
+    table = api.Requirement.get_attributes_table(requirements, ["Priority", "Cost", "Missing"])
+
+    assert list(table) == ["Priority", "Cost", "Missing"]
+    assert table["Priority"] == [requirement.get_attribute("Priority") for requirement in requirements]
+    assert all(isinstance(cost, int) for cost in table["Cost"]) and table["Missing"] == [None] * len(requirements)
+    assert requirements[0].get_all_attributes() == ["Priority", "Cost"]
+    requirements[0].set_attribute("Cost", 1234)
+    assert requirements[0].get_attribute("Cost") == 1234
+
+
+def test_reqif_round_trip(api, model, se, tmp_path):
+    module = se.get_all_contents_by_type(api.CapellaModule)[0]
+    path = str(tmp_path / "module.reqif")
+    module.export_reqif(path)
+
+    imported = api.CapellaModule()
+    imported.set_long_name("Imported")
+    model.start_transaction()
+    module.get_java_object().eContainer().getOwnedExtensions().add(imported.get_java_object())
+    model.commit_transaction()
+    counts = imported.import_reqif(path, model, chunk_size = 5)
+
+    requirements = [requirement for requirement in module.get_all_contents_by_type(api.Requirement) if not isinstance(requirement, api.Folder)]
+    assert counts["requirements"] == len(requirements) and counts["transactions"] > 1
+    assert [folder.get_long_name() for folder in imported.get_owned_requirements()] == [folder.get_long_name() for folder in module.get_owned_requirements()]
+    imported_requirements = [requirement for requirement in imported.get_all_contents_by_type(api.Requirement) if not isinstance(requirement, api.Folder)]
+    assert [requirement.get_id() for requirement in imported_requirements] == [requirement.get_id() for requirement in requirements]
+    assert [requirement.get_text() for requirement in imported_requirements] == [requirement.get_text() for requirement in requirements]
+    assert api.Requirement.get_attributes_table(imported_requirements, ["Priority", "Cost"]) == api.Requirement.get_attributes_table(requirements, ["Priority", "Cost"])
+    # in a transaction started by another model of the session, nothing is committed
+    other_model = api.CapellaModel()
+    other_model.open(module)
+    other_model.start_transaction()
+    counts = imported.import_reqif(path, chunk_size = 5)
+    assert counts["requirements"] == len(requirements) and counts["transactions"] == 0
+    assert model.is_in_transaction()
+    other_model.commit_transaction()
+
+
+def test_reqif_import_errors(api, model, se, tmp_path, monkeypatch):
+    module = se.get_all_contents_by_type(api.CapellaModule)[0]
+    path = str(tmp_path / "module.reqif")
+    module.export_reqif(path)
+    rollbacks = []
+    rollback_transaction = api.Sirius.rollback_transaction
+    monkeypatch.setattr(api.Sirius, "rollback_transaction", staticmethod(lambda session: rollbacks.append(session) or rollback_transaction(session)))
+    imported = api.CapellaModule()
+    model.start_transaction()
+    module.get_java_object().eContainer().getOwnedExtensions().add(imported.get_java_object())
+    model.commit_transaction()
+
+    # a requirement of the second chunk can't be created: its transaction is rolled back
+    create_requirement = api.ReqIFReader.create_requirement
+    created = []
+    def fail_on_seventh_requirement(reader, element):
+        created.append(element)
+        if len(created) == 7:
+            raise ValueError("unexpected SPEC-OBJECT")
+        create_requirement(reader, element)
+    monkeypatch.setattr(api.ReqIFReader, "create_requirement", fail_on_seventh_requirement)
+    with pytest.raises(ValueError):
+        imported.import_reqif(path, model, chunk_size = 5)
+    assert len(rollbacks) == 1 and not model.is_in_transaction()
+    monkeypatch.setattr(api.ReqIFReader, "create_requirement", create_requirement)
+    # Sirius refuses the transaction of the second chunk: there is no transaction to roll back
+    starts = []
+    start_transaction = api.Sirius.start_transaction
+    def refuse_second_transaction(session):
+        starts.append(session)
+        if len(starts) == 2:
+            raise RuntimeError("read only session")
+        start_transaction(session)
+    monkeypatch.setattr(api.Sirius, "start_transaction", staticmethod(refuse_second_transaction))
+    with pytest.raises(RuntimeError):
+        imported.import_reqif(path, model, chunk_size = 5)
+    assert len(rollbacks) == 1 and not model.is_in_transaction()
@@ -0,0 +1,125 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+from headless import install, load_resource, run_script
+from headless.ease import WORKSPACE
+from headless.tests.test_headless import IFE_AIRD, IFE_CAPELLA
+
+openpyxl = pytest.importorskip("openpyxl")
+from openpyxl.formatting.rule import ColorScaleRule
+
+SAMPLE_SCRIPTS = os.path.join(WORKSPACE, "Python4Capella", "sample_scripts")
+IFE_PROJECT = "In-Flight Entertainment System"
+
+
+@pytest.fixture(scope="module")
+def workspace(tmp_path_factory):
+    """A workspace with a copy of the IFE sample, the exported files are written in it"""
+    workspace = tmp_path_factory.mktemp("workspace")
+    os.mkdir(str(workspace / IFE_PROJECT))
+    shutil.copy(IFE_CAPELLA, str(workspace / IFE_PROJECT))
+    return str(workspace)
+
+
+@pytest.fixture(scope="module")
+def xlsx():
+    install().include("workspace://Python4Capella/utilities/XlsxExport.py")
+    return sys.modules["__main__"]
+
+
+def export(workspace, script, xlsx_path):
+    run_script(os.path.join(SAMPLE_SCRIPTS, script), model_path = IFE_AIRD, workspace = workspace)
+    return openpyxl.load_workbook(os.path.join(workspace, IFE_PROJECT, xlsx_path))
+
+
+def get_values(worksheet):
+    return [[cell.value for cell in row] for row in worksheet.iter_rows()]
+
+
+def assert_framed(cell):
+    assert cell.border.left.style == cell.border.top.style == cell.border.right.style == cell.border.bottom.style == "medium"
+    assert cell.alignment.wrap_text and cell.alignment.vertical == "top"
+
+
+def test_framed_exporter(workspace):
+    workbook = export(workspace, "Export_a_pseudo_hierarchy_of_PA_elements_to_xlsx.py", "results/Export_a_pseudo_hierarchy_of_PA_elements_to_xlsx.xlsx")
+    worksheet = workbook["PA export"]
+    values = get_values(worksheet)
+
+    assert values[0] == ["Elem " + str(index) for index in range(1, 10)]
+    for cell in worksheet[1]:
+        assert_framed(cell)
+        assert cell.font.color.rgb == "000000FF"
+    for cell in worksheet[2]:
+        assert_framed(cell)
+        assert cell.font.color is None
+    assert [worksheet.column_dimensions[letter].width for letter in "ABCDEFGHI"] == [17] * 9
+    # a NodePC of the physical system in the first column, then its deployed components and their functions
+    system = load_resource(IFE_CAPELLA).roots[0].getOwnedModelRoots().get(0).getOwnedArchitectures().get(3).getSystem()
+    node_names = [component.getName() for component in system.getOwnedPhysicalComponents() if component.getNature().getName() == "NODE"]
+    assert [row[0] for row in values[1:] if row[0] is not None] == node_names
+    assert len(values) > len(node_names) + 1 and all(any(value is not None for value in row) for row in values[1:])
+
+
+def test_exporters_values(workspace):
+    se = load_resource(IFE_CAPELLA).roots[0].getOwnedModelRoots().get(0)
+    physical_architecture = se.getOwnedArchitectures().get(3)
+
+    worksheet = export(workspace, "Export_the_list_of_physical_components_to_xlsx.py", "Python4Capella_exported_xlsx/" + IFE_PROJECT + "_physical_components.xlsx")["Sheet"]
+    # no header and no style
+    assert get_values(worksheet) == [[component.getName()] for component in physical_architecture.getOwnedPhysicalComponentPkg().getOwnedPhysicalComponents()]
+    assert worksheet["A1"].style == "Normal" and worksheet["A1"].border.left.style is None
+    worksheet = export(workspace, "Export_list_of_Requirements_to_xlsx.py", "results/Export_list_of_Requirements_to_xlsx.xlsx")["Requirements export"]
+    values = get_values(worksheet)
+    requirement_ids = [e_object.getId() for e_object in load_resource(IFE_CAPELLA).get_all_contents() if e_object.eClass().getName() == "Requirement"]
+    assert values[0] == ["Req id", "Req Text", "Linked Elements (incoming links)", "Linked Elements (outgoing links)"]
+    assert [row[0] for row in values[1:]] == requirement_ids
+
+
+def test_status_sheets(xlsx, tmp_path):
+    # the sheets of Export_Missions_capabilities_FC_status.py, which needs the Exploited Capabilities query of Capella
+    path = str(tmp_path / "status.xlsx")
+    export = xlsx.XlsxExport()
+    rows = [("Mission 1",), (None, "Capability 1", 10, 50, None), (None, "Capability 2", 100, 0, 30)]
+    count = export.add_sheet("Mission, Capability, statuses", [xlsx.XlsxColumn("Mission name", width = 30, **xlsx.FRAMED),
+                                                                xlsx.XlsxColumn("Exploited Capability name", width = 30, **xlsx.FRAMED),
+                                                                xlsx.XlsxColumn("Percentage Designed", width = 20, **xlsx.FRAMED),
+                                                                xlsx.XlsxColumn("Percentage Developed", width = 20, **xlsx.FRAMED),
+                                                                xlsx.XlsxColumn("Percentage Validated", width = 20, **xlsx.FRAMED)], iter(rows),
+                             conditional_formattings = {"C:E": ColorScaleRule(start_type = "min", start_value = 0, start_color = "AA0000", end_type = "max", end_value = 100, end_color = "F7FF3C")})
+    export.save(path)
+    worksheet = openpyxl.load_workbook(path)["Mission, Capability, statuses"]
+
+    assert count == 3
+    assert get_values(worksheet) == [["Mission name", "Exploited Capability name", "Percentage Designed", "Percentage Developed", "Percentage Validated"],
+                                     ["Mission 1", None, None, None, None], [None, "Capability 1", 10, 50, None], [None, "Capability 2", 100, 0, 30]]
+    assert [worksheet.column_dimensions[letter].width for letter in "ABCDE"] == [30, 30, 20, 20, 20]
+    assert_framed(worksheet["E2"])
+    assert worksheet["A1"].font.color.rgb == "000000FF" and worksheet["A2"].font.color is None
+    formattings = list(worksheet.conditional_formatting)
+    assert [str(formatting.sqref) for formatting in formattings] == ["C2:E4"]
+    rule = formattings[0].rules[0]
+    assert rule.type == "colorScale" and [color.rgb for color in rule.colorScale.color] == ["00AA0000", "00F7FF3C"]
+
+
+def test_unstyled_sheets(xlsx, tmp_path):
+    # the sheets of the exploited capabilities and physical links exporters, which need Semantic Browser queries of Capella
+    path = str(tmp_path / "links.xlsx")
+    export = xlsx.XlsxExport()
+    export.add_sheet("Mission, Capability,FC", [xlsx.XlsxColumn("Mission name"), xlsx.XlsxColumn("Exploited Capability name"), xlsx.XlsxColumn("Involved Functional Chain name")],
+                     (row for row in [("Mission 1", None, None), (None, "Capability 1", None), (None, None, "Chain 1")]))
+    export.add_sheet("PA export", [xlsx.XlsxColumn("NodePC name"), xlsx.XlsxColumn("NodePC summary"), xlsx.XlsxColumn("ComponentPort name"), xlsx.XlsxColumn("direction"),
+                                   xlsx.XlsxColumn("PhysicalLink name", lambda row: ", ".join(row[4]))],
+                     [("Node 1", "summary", "Port 1", "IN", ["Link 1", "Link 2"])])
+    export.save(path)
+    workbook = openpyxl.load_workbook(path)
+
+    assert workbook.sheetnames == ["Mission, Capability,FC", "PA export"]
+    assert get_values(workbook["Mission, Capability,FC"])[1:] == [["Mission 1", None, None], [None, "Capability 1", None], [None, None, "Chain 1"]]
+    assert get_values(workbook["PA export"]) == [["NodePC name", "NodePC summary", "ComponentPort name", "direction", "PhysicalLink name"],
+                                                 ["Node 1", "summary", "Port 1", "IN", "Link 1, Link 2"]]
+    assert workbook["PA export"]["A1"].style == "Normal" and workbook["PA export"]["A1"].border.left.style is None
+    assert len(list(workbook["PA export"].conditional_formatting)) == 0
@@ -0,0 +1,620 @@
+'''
+A streaming reader of .capella (XMI) files.
+
+The elements of the file are read with an incremental XML parser into XMIObjects. An XMIObject
+answers the subset of the Java EObject interface used by the simplified API: eClass(), eContainer(),
+eContents(), eAllContents() and the generated getX() / isX() / setX() accessors of the features.
+References ("#id") are resolved when they are first read.
+A resource can be written back to an XMI file with save().
+'''
+import io
+import uuid
+import xml.etree.ElementTree as ElementTree
+from xml.sax.saxutils import escape, quoteattr
+
+from . import metamodel
+
+XMI_NAMESPACE = "http://www.omg.org/XMI"
+XSI_NAMESPACE = "http://www.w3.org/2001/XMLSchema-instance"
+XSI_TYPE = "{http://www.w3.org/2001/XMLSchema-instance}type"
+HREF = "href"
+ID = "id"
+MODELLER_NAMESPACE = "http://www.polarsys.org/capella/core/modeller/"
+
+# markers pushed on the parser stack for the elements which are not EObjects
+TEXT_VALUE = object()
+REFERENCE_VALUE = object()
+WRAPPER = object()
+
+
+class XMIEPackage(object):
+    """The EPackage of a namespace URI"""
+    __slots__ = ("ns_uri", "name", "e_classes")
+    def __init__(self, ns_uri, name):
+        self.ns_uri = ns_uri
+        self.name = name
+        self.e_classes = {}
+    def getNsURI(self):
+        return self.ns_uri
+    def getName(self):
+        return self.name
+    def getEClassifier(self, name):
+        try:
+            return self.e_classes[name]
+        except KeyError:
+            e_class = self.e_classes[name] = XMIEClass(name, self)
+            return e_class
+    def __repr__(self):
+        return "XMIEPackage(" + str(self.ns_uri) + ")"
+
+
+class XMIEClass(object):
+    """The EClass of an XMIObject"""
+    __slots__ = ("name", "e_package")
+    def __init__(self, name, e_package):
+        self.name = name
+        self.e_package = e_package
+    def getName(self):
+        return self.name
+    def getEPackage(self):
+        return self.e_package
+    def getEStructuralFeature(self, name):
+        # the features are not known without the metamodel: unset features have their default value
+        return XMIEStructuralFeature(name)
+    def __repr__(self):
+        return "XMIEClass(" + self.name + ")"
+
+
+class XMIEStructuralFeature(object):
+    """A feature of an XMIEClass"""
+    __slots__ = ("name",)
+    def __init__(self, name):
+        self.name = name
+    def getName(self):
+        return self.name
+    def isMany(self):
+        return metamodel.is_many(self.name)
+
+
+class XMIEnumLiteral(object):
+    """A literal of an enumeration attribute"""
+    __slots__ = ("name",)
+    def __init__(self, name):
+        self.name = name
+    def getName(self):
+        return self.name
+    def getLiteral(self):
+        return self.name
+    def toString(self):
+        return self.name
+    def __str__(self):
+        return self.name
+    def __repr__(self):
+        return "XMIEnumLiteral(" + self.name + ")"
+    def __eq__(self, other):
+        return isinstance(other, XMIEnumLiteral) and other.name == self.name
+    def __ne__(self, other):
+        return not self.__eq__(other)
+    def __hash__(self):
+        return hash(self.name)
+
+
+class XMIEList(list):
+    """A list of feature values with the Java List methods, maintains the container of the values of containment features"""
+    __slots__ = ("owner", "feature", "containment")
+    def __init__(self, values = (), owner = None, feature = None, containment = False):
+        list.__init__(self, values)
+        self.owner = owner
+        self.feature = feature
+        self.containment = containment
+    def size(self):
+        return len(self)
+    def get(self, index):
+        return self[index]
+    def isEmpty(self):
+        return len(self) == 0
+    def contains(self, value):
+        return value in self
+    def indexOf(self, value):
+        for index, element in enumerate(self):
+            if element is value or element == value:
+                return index
+        return -1
+    def lastIndexOf(self, value):
+        for index in range(len(self) - 1, -1, -1):
+            if self[index] is value or self[index] == value:
+                return index
+        return -1
+    def subList(self, start, stop):
+        return XMIEList(self[start:stop])
+    def toArray(self):
+        return list(self)
+    def iterator(self):
+        return XMIIterator(self)
+    def add(self, *args):
+        # add(value) or add(index, value)
+        value = args[-1]
+        if self.containment:
+            value.set_container(self.owner, self.feature)
+        else:
+            self.invalidate()
+        if len(args) == 1:
+            self.append(value)
+        else:
+            self.insert(args[0], value)
+        return True
+    def remove(self, value):
+        index = self.indexOf(value)
+        if index < 0:
+            return False
+        del self[index]
+        if self.containment:
+            value.set_container(None, None)
+        else:
+            self.invalidate()
+        return True
+    def clear(self):
+        for value in list(self):
+            self.remove(value)
+    def invalidate(self):
+        if self.owner is not None and self.owner.eResource() is not None:
+            self.owner.eResource().invalidate()
+
+
+class XMIIterator(object):
+    """A Java Iterator over a list"""
+    __slots__ = ("values", "index")
+    def __init__(self, values):
+        self.values = values
+        self.index = 0
+    def hasNext(self):
+        return self.index < len(self.values)
+    def next(self):
+        if self.index >= len(self.values):
+            raise StopIteration
+        value = self.values[self.index]
+        self.index += 1
+        return value
+    __next__ = next
+    def __iter__(self):
+        return self
+
+
+class XMITreeIterator(XMIIterator):
+    """The EMF TreeIterator over all the contents of an XMIObject, the contents of the last returned object are skipped if prune() is called"""
+    __slots__ = ("stack", "last")
+    def __init__(self, root):
+        self.stack = [[root.contents, 0]]
+        self.last = None
+    def hasNext(self):
+        if self.last is not None:
+            if len(self.last.contents) > 0:
+                self.stack.append([self.last.contents, 0])
+            self.last = None
+        stack = self.stack
+        while len(stack) > 0 and stack[-1][1] >= len(stack[-1][0]):
+            stack.pop()
+        return len(stack) > 0
+    def next(self):
+        if not self.hasNext():
+            raise StopIteration
+        top = self.stack[-1]
+        value = top[0][top[1]]
+        top[1] += 1
+        self.last = value
+        return value
+    __next__ = next
+    def prune(self):
+        self.last = None
+
+
+class XMIObject(object):
+    """An EObject read from an XMI file"""
+    __slots__ = ("e_class", "resource", "container", "containing_feature", "attributes", "values", "contents")
+    def __init__(self, e_class, resource = None):
+        self.e_class = e_class
+        self.resource = resource
+        self.container = None
+        self.containing_feature = None
+        # not decoded attribute values read from the file
+        self.attributes = {}
+        # decoded values, children and values set after loading
+        self.values = {}
+        self.contents = []
+    def eClass(self):
+        return self.e_class
+    def eContainer(self):
+        return self.container
+    def eContainingFeature(self):
+        return self.containing_feature
+    def eResource(self):
+        return self.resource
+    def eIsProxy(self):
+        return False
+    def eContents(self):
+        return XMIEList(self.contents)
+    def eAllContents(self):
+        return XMITreeIterator(self)
+    def eIsSet(self, feature):
+        if feature in self.attributes:
+            return True
+        value = self.values.get(feature)
+        if isinstance(value, list):
+            return len(value) > 0
+        return value is not None
+    def eGet(self, feature):
+        if isinstance(feature, XMIEStructuralFeature):
+            feature = feature.name
+        return self.get_feature(feature)
+    def eSet(self, feature, value):
+        if isinstance(feature, XMIEStructuralFeature):
+            feature = feature.name
+        self.set_feature(feature, value)
+    def equals(self, other):
+        return self is other
+    def toString(self):
+        return repr(self)
+    def __repr__(self):
+        return "XMIObject(" + self.e_class.name + ", " + str(self.attributes.get(ID, self.values.get(ID))) + ")"
+    def __getattr__(self, name):
+        # the generated Java accessors: getX(), isX() and setX(value)
+        if name.startswith("get") and len(name) > 3:
+            feature = self.get_feature_name(name[3:])
+            return lambda: self.get_feature(feature)
+        elif name.startswith("is") and len(name) > 2:
+            feature = self.get_feature_name(name[2:])
+            return lambda: self.get_boolean(feature)
+        elif name.startswith("set") and len(name) > 3:
+            feature = self.get_feature_name(name[3:])
+            return lambda value: self.set_feature(feature, value)
+        raise AttributeError(name)
+    def get_feature_name(self, accessor_suffix):
+        """Gets the name of the feature for the given accessor name without its get/is/set prefix"""
+        feature = accessor_suffix[0].lower() + accessor_suffix[1:]
+        if feature not in self.attributes and feature not in self.values and (accessor_suffix in self.attributes or accessor_suffix in self.values or accessor_suffix in metamodel.STRING_FEATURES):
+            # features starting with an upper case letter like ReqIFText, even when they are not set yet
+            return accessor_suffix
+        return feature
+    def get_feature(self, feature):
+        """Gets the value of the given feature, lists are returned for many valued features"""
+        try:
+            value = self.values[feature]
+        except KeyError:
+            if feature in self.attributes:
+                value = self.values[feature] = self.decode(feature, self.attributes.pop(feature))
+            else:
+                value = metamodel.get_derived_feature(self, feature)
+                if value is not metamodel.NOT_DERIVED:
+                    # not cached: derived values change with the model
+                    return XMIEList(value) if isinstance(value, list) else value
+                value = self.get_default(feature)
+        if isinstance(value, XMIEList) and value.containment and not metamodel.is_many(feature):
+            return value[0] if len(value) > 0 else None
+        return value
+    def get_boolean(self, feature):
+        """Gets the value of the given boolean feature"""
+        if feature in self.values:
+            return bool(self.values[feature])
+        elif feature in self.attributes:
+            return self.attributes[feature] == metamodel.TRUE
+        return metamodel.BOOLEAN_DEFAULTS.get(feature, False)
+    def get_default(self, feature):
+        """Gets the value of a feature which is not set"""
+        if metamodel.is_many(feature):
+            value = self.values[feature] = XMIEList((), self, feature, metamodel.is_containment(feature))
+            return value
+        literal = metamodel.get_enum_default(self.e_class.name, feature)
+        if literal is not None:
+            return XMIEnumLiteral(literal)
+        return None
+    def decode(self, feature, raw):
+        """Decodes the string value of the given feature read from the file"""
+        if metamodel.get_enum_default(self.e_class.name, feature) is not None:
+            return XMIEnumLiteral(raw)
+        elif is_reference(feature, raw):
+            values = [self.resource.resolve(token) for token in raw.split()]
+            if metamodel.is_many(feature):
+                return XMIEList([value for value in values if value is not None], self, feature)
+            return values[0]
+        return metamodel.decode_typed(self.e_class.name, feature, raw)
+    def set_feature(self, feature, value):
+        """Sets the value of the given feature"""
+        current = self.values.get(feature)
+        self.attributes.pop(feature, None)
+        if isinstance(current, XMIEList) and current.containment:
+            current.clear()
+            if value is not None:
+                current.add(value)
+        else:
+            self.values[feature] = value
+            if self.resource is not None:
+                self.resource.invalidate()
+        if feature == ID and self.resource is not None:
+            self.resource.ids[value] = self
+    def set_container(self, container, feature):
+        """Moves this object in the given feature of the given container, or detaches it if the container is None"""
+        if self.container is not None:
+            self.container.contents.remove(self)
+            owner_values = self.container.values.get(self.containing_feature)
+            if owner_values is not None and self in owner_values:
+                list.remove(owner_values, self)
+        self.container = container
+        self.containing_feature = feature
+        if container is not None:
+            container.contents.append(self)
+            resource = container.eResource()
+            if resource is not None and self.resource is not resource:
+                for e_object in [self] + list(XMITreeIterator(self)):
+                    e_object.resource = resource
+                    resource.register(e_object)
+            if resource is not None:
+                resource.invalidate()
+        elif self.resource is not None:
+            # as in EMF, a detached object is no longer in a resource
+            resource = self.resource
+            for e_object in [self] + list(XMITreeIterator(self)):
+                e_object.resource = None
+            resource.invalidate()
+    def add_child(self, feature, child):
+        """Adds a child read from the file"""
+        children = self.values.get(feature)
+        if children is None:
+            children = self.values[feature] = XMIEList((), self, feature, True)
+        children.append(child)
+        child.container = self
+        child.containing_feature = feature
+        self.contents.append(child)
+    def add_text(self, feature, text):
+        """Adds a value of a many valued string attribute read from the file"""
+        values = self.values.get(feature)
+        if values is None:
+            values = self.values[feature] = XMIEList((), self, feature)
+        values.append(text)
+    def add_reference(self, feature, href):
+        """Adds a reference written as an href element"""
+        current = self.attributes.get(feature)
+        self.attributes[feature] = href if current is None else current + " " + href
+    def iter_references(self):
+        """Yields the (feature, referenced object) of all non containment references of this object"""
+        for feature, raw in list(self.attributes.items()):
+            if is_reference(feature, raw):
+                self.get_feature(feature)
+        for feature, value in list(self.values.items()):
+            if isinstance(value, XMIObject):
+                yield feature, value
+            elif isinstance(value, XMIEList) and not value.containment:
+                for element in value:
+                    if isinstance(element, XMIObject):
+                        yield feature, element
+
+
+def is_reference(feature, raw):
+    """Tells if the given attribute value read from the file is a list of references"""
+    if feature in metamodel.STRING_FEATURES or "#" not in raw:
+        return False
+    for token in raw.split():
+        if "#" not in token:
+            return False
+    return True
+
+
+class XMIResource(object):
+    """The content of a .capella file"""
+    def __init__(self, path = None):
+        self.path = path
+        self.roots = []
+        self.ids = {}
+        self.packages = {}
+        self.inverse = None
+    def getURI(self):
+        return self.path
+    def getContents(self):
+        return XMIEList(self.roots)
+    def get_e_package(self, ns_uri, name = None):
+        """Gets the EPackage of the given namespace URI"""
+        try:
+            return self.packages[ns_uri]
+        except KeyError:
+            if name is None:
+                name = ns_uri.rstrip("/").split("/")[-2] if ns_uri is not None and ns_uri.count("/") > 1 else ns_uri
+            package = self.packages[ns_uri] = XMIEPackage(ns_uri, name)
+            return package
+    def get_e_class(self, ns_uri, name):
+        """Gets the EClass with the given name in the given namespace URI"""
+        return self.get_e_package(ns_uri).getEClassifier(name)
+    def get_capella_version(self):
+        """Gets the version of the Capella metamodel used in this file (for instance 5.0.0)"""
+        for ns_uri in self.packages:
+            if ns_uri is not None and ns_uri.startswith(MODELLER_NAMESPACE):
+                return ns_uri[len(MODELLER_NAMESPACE):]
+        return None
+    def create(self, ns_uri, name):
+        """Creates a new object not contained in this resource yet"""
+        e_object = XMIObject(self.get_e_class(ns_uri, name))
+        e_object.values[ID] = str(uuid.uuid4())
+        return e_object
+    def register(self, e_object):
+        """Indexes the id of an object added to this resource"""
+        e_object_id = e_object.getId()
+        if e_object_id is not None:
+            self.ids[e_object_id] = e_object
+    def get_by_id(self, e_object_id):
+        """Gets the object with the given id, None if there is no such object"""
+        return self.ids.get(e_object_id)
+    def resolve(self, token):
+        """Resolves a reference: "#id" or "file#id", None if the reference can't be resolved in this resource"""
+        return self.ids.get(token[token.index("#") + 1:])
+    def get_all_contents(self):
+        """Yields all the objects of this resource"""
+        for root in self.roots:
+            yield root
+            iterator = XMITreeIterator(root)
+            while iterator.hasNext():
+                yield iterator.next()
+    def get_inverse(self, e_object, reference = None):
+        """Gets the objects referencing the given object, with the given reference if not None"""
+        if self.inverse is None:
+            inverse = {}
+            for source in self.get_all_contents():
+                for feature, target in source.iter_references():
+                    inverse.setdefault(target, []).append((feature, source))
+            self.inverse = inverse
+        res = []
+        for feature, source in self.inverse.get(e_object, ()):
+            if (reference is None or feature == reference) and source not in res:
+                res.append(source)
+        return res
+    def invalidate(self):
+        """Forgets the indexes computed from the references, called when the model is modified"""
+        self.inverse = None
+    def save(self, path = None):
+        """Writes this resource in the given XMI file, the path of this resource by default"""
+        if path is None:
+            path = self.path
+        with io.open(path, "w", encoding = "utf-8") as output:
+            XMIWriter(self, output).write()
+        return path
+    def load(self, source = None):
+        """Reads the given file or file object, the path of this resource by default"""
+        if source is None:
+            source = self.path
+        prefixes = {}
+        stack = []
+        elements = []
+        for event, element in ElementTree.iterparse(source, events = ("start-ns", "start", "end")):
+            if event == "start-ns":
+                prefix, ns_uri = element
+                prefixes[prefix] = ns_uri
+                self.get_e_package(ns_uri, prefix.split(".")[-1])
+            elif event == "start":
+                elements.append(element)
+                e_object = self.read_start(element, stack, prefixes)
+                stack.append(e_object)
+            else:
+                e_object = stack.pop()
+                if e_object is TEXT_VALUE:
+                    stack[-1].add_text(element.tag, element.text or "")
+                # the element is no longer needed: keeps the memory used by the parser low
+                elements.pop()
+                element.clear()
+                if len(elements) > 0:
+                    elements[-1].remove(element)
+        return self
+    def read_start(self, element, stack, prefixes):
+        tag = element.tag
+        attributes = element.attrib
+        parent = stack[-1] if len(stack) > 0 else None
+        if parent is TEXT_VALUE or parent is REFERENCE_VALUE:
+            # not expected in a .capella file
+            return REFERENCE_VALUE
+        elif parent is None or parent is WRAPPER:
+            # a root object: the tag is the qualified EClass name
+            ns_uri, name = tag[1:].split("}")
+            if ns_uri == XMI_NAMESPACE:
+                return WRAPPER
+            e_object = XMIObject(self.get_e_class(ns_uri, name), self)
+            self.roots.append(e_object)
+        else:
+            type_name = attributes.get(XSI_TYPE)
+            if type_name is not None:
+                prefix, name = type_name.split(":")
+                e_class = self.get_e_class(prefixes.get(prefix), name)
+            elif HREF in attributes:
+                parent.add_reference(tag, attributes[HREF])
+                return REFERENCE_VALUE
+            elif len(attributes) == 0:
+                return TEXT_VALUE
+            else:
+                # typed by the feature: the EClass is not known without the metamodel
+                e_class = self.get_e_class(None, tag[0].upper() + tag[1:])
+            e_object = XMIObject(e_class, self)
+            parent.add_child(tag, e_object)
+        for key, value in attributes.items():
+            if key[0] != "{":
+                e_object.attributes[key] = value
+        e_object_id = attributes.get(ID)
+        if e_object_id is not None:
+            self.ids[e_object_id] = e_object
+        return e_object
+
+
+class XMIWriter(object):
+    """Writes the objects of a resource with their raw attributes, values set after loading are encoded back to strings"""
+    def __init__(self, resource, output):
+        self.resource = resource
+        self.output = output
+        self.prefixes = {}
+        for ns_uri, package in resource.packages.items():
+            if ns_uri is not None and ns_uri not in (XMI_NAMESPACE, XSI_NAMESPACE):
+                prefix = package.getName()
+                while prefix in self.prefixes.values():
+                    prefix += "_"
+                self.prefixes[ns_uri] = prefix
+    def write(self):
+        namespaces = ' xmlns:xmi="' + XMI_NAMESPACE + '" xmlns:xsi="' + XSI_NAMESPACE + '"'
+        for ns_uri in sorted(self.prefixes):
+            namespaces += " xmlns:" + self.prefixes[ns_uri] + "=" + quoteattr(ns_uri)
+        self.output.write(u'<?xml version="1.0" encoding="UTF-8"?>\n')
+        roots = self.resource.roots
+        if len(roots) == 1:
+            self.write_object(roots[0], self.get_qualified_name(roots[0]), ' xmi:version="2.0"' + namespaces, "")
+        else:
+            self.output.write(u'<xmi:XMI xmi:version="2.0"' + namespaces + ">\n")
+            for root in roots:
+                self.write_object(root, self.get_qualified_name(root), "", "  ")
+            self.output.write(u"</xmi:XMI>\n")
+    def get_qualified_name(self, e_object):
+        return self.prefixes[e_object.eClass().getEPackage().getNsURI()] + ":" + e_object.eClass().getName()
+    def write_object(self, e_object, tag, header, indent):
+        attributes = [header]
+        if not header and e_object.eClass().getEPackage().getNsURI() is not None:
+            attributes.append(" xsi:type=" + quoteattr(self.get_qualified_name(e_object)))
+        texts = []
+        for feature, raw in e_object.attributes.items():
+            attributes.append(" " + feature + "=" + quoteattr(raw))
+        for feature, value in e_object.values.items():
+            if isinstance(value, XMIEList):
+                if value.containment or len(value) == 0:
+                    continue
+                elif isinstance(value[0], XMIObject):
+                    value = " ".join("#" + element.getId() for element in value)
+                else:
+                    texts.extend((feature, text) for text in value)
+                    continue
+            else:
+                value = encode(value)
+            if value is not None:
+                attributes.append(" " + feature + "=" + quoteattr(value))
+        output = self.output
+        if len(e_object.contents) == 0 and len(texts) == 0:
+            output.write(indent + u"<" + tag + u"".join(attributes) + u"/>\n")
+            return
+        output.write(indent + u"<" + tag + u"".join(attributes) + u">\n")
+        child_indent = indent + "  "
+        for child in e_object.contents:
+            self.write_object(child, child.containing_feature, "", child_indent)
+        for feature, text in texts:
+            output.write(child_indent + u"<" + feature + u">" + escape(text) + u"</" + feature + u">\n")
+        output.write(indent + u"</" + tag + u">\n")
+
+
+def encode(value):
+    """Encodes a single feature value as an XMI attribute value, None if the value is not set"""
+    if value is None:
+        return None
+    elif isinstance(value, XMIObject):
+        return "#" + value.getId()
+    elif isinstance(value, XMIEnumLiteral):
+        return value.getName()
+    elif isinstance(value, bool):
+        return metamodel.TRUE if value else "false"
+    elif isinstance(value, float):
+        return repr(value)
+    elif not isinstance(value, str):
+        return str(value)
+    return value
+
+
+def load_resource(path):
+    """Reads the given .capella file"""
+    return XMIResource(path).load()
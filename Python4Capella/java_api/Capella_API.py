@@ -1,30 +1,588 @@
 loadModule('/Capella/Capella')
 import sys
+from collections import OrderedDict
+
+class QueryCache():
+    """A LRU cache of Semantic Browser query results keyed by (query, EObject).
+    Caching is suspended during transactions and the cache is cleared when they start and end"""
+    def __init__(self, max_size = 10000):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.transaction_depth = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    def get(self, key):
+        """Gets the cached results for the given key, None if not cached"""
+        if self.transaction_depth > 0:
+            return None
+        try:
+            res = self.entries.pop(key)
+        except KeyError:
+            self.misses += 1
+            return None
+        # most recently used entries are at the end
+        self.entries[key] = res
+        self.hits += 1
+        return res
+    def put(self, key, results):
+        """Caches the given results"""
+        if self.transaction_depth > 0 or self.max_size <= 0:
+            return
+        self.entries[key] = results
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(False)
+            self.evictions += 1
+    def clear(self):
+        """Removes all cached results"""
+        if len(self.entries) > 0:
+            self.invalidations += 1
+        self.entries.clear()
+    def start_transaction(self):
+        """Suspends the caching until the matching end_transaction()"""
+        self.clear()
+        self.transaction_depth += 1
+    def end_transaction(self):
+        """Resumes the caching suspended by start_transaction()"""
+        self.clear()
+        if self.transaction_depth > 0:
+            self.transaction_depth -= 1
+    def cache_info(self):
+        """Gets the statistics of this cache"""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "invalidations": self.invalidations, "size": len(self.entries), "max_size": self.max_size}
+
+query_cache = QueryCache()
+
+# resource -> Sirius session, see get_e_object_session()
+resource_sessions = {}
+
+def get_e_object_session(e_obj):
+    """Gets the Sirius session of the given EObject, looked up once per resource. None if the EObject is not in a session"""
+    resource = e_obj.eResource()
+    if resource is None:
+        return None
+    res = resource_sessions.get(resource)
+    if res is None:
+        res = Sirius.get_session(e_obj)
+        if res is not None:
+            resource_sessions[resource] = res
+    return res
+
+class ElementIndex():
+    """An index of the EObjects of each Sirius session by id and sid, built in one traversal of the semantic resources of a session
+    on its first lookup. The EObjects added with add() are indexed with their contents at once, or at the commit of the transactions
+    adding them (they are forgotten at rollback). Since the index is not rebuilt, found EObjects are checked against their current
+    resource and key once a transaction started: deleted EObjects are not returned"""
+    def __init__(self):
+        # session -> ({id: EObject}, {sid: EObject})
+        self.indexes = {}
+        # the EObjects added in each of the current nested transactions, with a flag telling if their contents are added
+        self.added = []
+        # checks the found EObjects once the model may have been modified
+        self.checked = False
+        # (id, sid) availability per EClass name
+        self.e_class_features = {}
+        self.transaction_depth = 0
+        self.builds = 0
+    def get_index(self, session):
+        """Gets the ids and sids of the given session, indexed on first use"""
+        res = self.indexes.get(session)
+        if res is None:
+            res = self.indexes[session] = ({}, {})
+            for resource in session.getSemanticResources():
+                for root in resource.getContents():
+                    self.index(res, root, True, False)
+            self.builds += 1
+        return res
+    def index(self, index, e_object, with_contents, replace):
+        """Indexes the given EObject, and all its contents if with_contents is True.
+        An existing key is replaced by the indexed EObject only if replace is True"""
+        by_id, by_sid = index
+        tree_iterator = e_object.eAllContents() if with_contents else None
+        while e_object is not None:
+            features = self.get_features(e_object.eClass())
+            if features[0]:
+                e_object_id = e_object.getId()
+                if e_object_id is not None and (replace or e_object_id not in by_id):
+                    by_id[e_object_id] = e_object
+            if features[1]:
+                e_object_sid = e_object.getSid()
+                if e_object_sid is not None and (replace or e_object_sid not in by_sid):
+                    by_sid[e_object_sid] = e_object
+            e_object = iteratorNext(tree_iterator) if tree_iterator is not None and iteratorHasNext(tree_iterator) else None
+    def get_features(self, e_class):
+        """Tells if the EObjects of the given EClass have an id and a sid"""
+        e_class_name = e_class.getName()
+        res = self.e_class_features.get(e_class_name)
+        if res is None:
+            res = self.e_class_features[e_class_name] = (e_class.getEStructuralFeature("id") is not None, e_class.getEStructuralFeature("sid") is not None)
+        return res
+    def add(self, e_object, with_contents = True):
+        """Indexes an EObject added to a session, with its contents if with_contents is True (False when only its id or sid changed).
+        During a transaction, the EObject is indexed at the commit"""
+        if self.transaction_depth > 0:
+            self.added[-1].append((e_object, with_contents))
+            return
+        session = get_e_object_session(e_object) if len(self.indexes) > 0 else None
+        index = self.indexes.get(session) if session is not None else None
+        if index is None:
+            return
+        if with_contents and self.get_features(e_object.eClass())[0] and index[0].get(e_object.getId()) == e_object:
+            # an EObject moved or added to a non containment reference, its contents are already indexed
+            return
+        self.index(index, e_object, with_contents, True)
+    def get_by_id(self, session, e_object_id):
+        """Gets the EObject of the given session with the given id, None if there is no such EObject"""
+        return self.check(self.get_index(session)[0].get(e_object_id), lambda e_object: e_object.getId() == e_object_id)
+    def get_by_sid(self, session, e_object_sid):
+        """Gets the EObject of the given session with the given sid, None if there is no such EObject"""
+        return self.check(self.get_index(session)[1].get(e_object_sid), lambda e_object: e_object.getSid() == e_object_sid)
+    def check(self, e_object, has_key):
+        """Checks that a found EObject was not deleted and still has the same key"""
+        if e_object is not None and self.checked:
+            if e_object.eResource() is None or not has_key(e_object):
+                return None
+        return e_object
+    def clear(self):
+        """Forgets all the indexes, they will be built again on their next use"""
+        self.indexes.clear()
+        self.checked = self.transaction_depth > 0
+    def start_transaction(self):
+        self.checked = True
+        self.transaction_depth += 1
+        self.added.append([])
+    def end_transaction(self, commit = True):
+        """Ends the current transaction: the EObjects it added are indexed at commit, or passed to the enclosing transaction"""
+        if self.transaction_depth == 0:
+            return
+        self.transaction_depth -= 1
+        added = self.added.pop()
+        if not commit:
+            return
+        if self.transaction_depth > 0:
+            self.added[-1].extend(added)
+            return
+        for e_object, with_contents in added:
+            self.add(e_object, with_contents)
+    def index_info(self):
+        """Gets the statistics of this index"""
+        return {"builds": self.builds, "sessions": len(self.indexes), "ids": sum(len(index[0]) for index in self.indexes.values()),
+                "sids": sum(len(index[1]) for index in self.indexes.values())}
+
+element_index = ElementIndex()
+
+class InverseReferenceIndex():
+    """An index of the EObjects referencing each EObject through a given EReference, per Sirius session.
+    The index of a reference name is built in one traversal of the semantic resources the first time it is used.
+    It is not used during transactions (e_inverse() is called instead). The EObjects given to update() during a transaction,
+    such as the ones added to or removed from a list of the simplified API, have their references indexed again at its commit"""
+    def __init__(self):
+        # (session, reference name) -> {target: [sources]}
+        self.indexes = {}
+        # (session, reference name) -> {source: [targets]}, the indexed values of the reference
+        self.values = {}
+        # the EObjects updated in each of the current nested transactions
+        self.updated = []
+        self.transaction_depth = 0
+        self.builds = 0
+        self.updates = 0
+    def get(self, e_obj, reference_name):
+        """Gets the EObjects referencing the given EObject through the given reference, None if the index is not available"""
+        if self.transaction_depth > 0:
+            return None
+        session = get_e_object_session(e_obj)
+        if session is None:
+            return None
+        key = (session, reference_name)
+        index = self.indexes.get(key)
+        if index is None:
+            self.build(session, reference_name)
+            index = self.indexes[key]
+        return index.get(e_obj, ())
+    def build(self, session, reference_name):
+        """Indexes the values of the given reference for all the EObjects of the semantic resources of the given session"""
+        key = (session, reference_name)
+        index = self.indexes[key] = {}
+        values = self.values[key] = {}
+        # the reference of each EClass name, False if there is no such reference
+        references = {}
+        for resource in session.getSemanticResources():
+            for root in resource.getContents():
+                self.index(index, values, references, root, reference_name)
+        self.builds += 1
+    def index(self, index, values, references, root, reference_name):
+        """Indexes the values of the given reference for the given EObject and all its contents"""
+        tree_iterator = root.eAllContents()
+        source = root
+        while source is not None:
+            e_class = source.eClass()
+            e_class_name = e_class.getName()
+            reference = references.get(e_class_name)
+            if reference is None:
+                reference = e_class.getEStructuralFeature(reference_name)
+                if reference is None:
+                    reference = False
+                references[e_class_name] = reference
+            if reference is not False:
+                value = source.eGet(reference)
+                if value is not None:
+                    targets = values[source] = list(value) if reference.isMany() else [value]
+                    for target in targets:
+                        sources = index.get(target)
+                        if sources is None:
+                            index[target] = [source]
+                        elif source not in sources:
+                            sources.append(source)
+            source = iteratorNext(tree_iterator) if iteratorHasNext(tree_iterator) else None
+    def forget(self, index, values, root):
+        """Removes the indexed values of the given EObject and all its contents"""
+        tree_iterator = root.eAllContents()
+        source = root
+        while source is not None:
+            for target in values.pop(source, ()):
+                sources = index.get(target)
+                if sources is not None and source in sources:
+                    sources.remove(source)
+                    if len(sources) == 0:
+                        del index[target]
+            source = iteratorNext(tree_iterator) if iteratorHasNext(tree_iterator) else None
+    def update(self, e_obj):
+        """Indexes again the references of the given EObject and all its contents, for instance after it was added to or removed from the model.
+        During a transaction, the EObject is indexed again at the commit"""
+        if self.transaction_depth > 0:
+            self.updated[-1].append(e_obj)
+            return
+        if len(self.indexes) == 0:
+            return
+        session = get_e_object_session(e_obj)
+        for key, index in self.indexes.items():
+            values = self.values[key]
+            self.forget(index, values, e_obj)
+            if key[0] == session:
+                self.index(index, values, {}, e_obj, key[1])
+        self.updates += 1
+    def clear(self):
+        """Forgets all the indexes"""
+        self.indexes.clear()
+        self.values.clear()
+    def start_transaction(self):
+        """Suspends the index until the matching end_transaction()"""
+        self.transaction_depth += 1
+        self.updated.append([])
+    def end_transaction(self, commit = True):
+        """Resumes the index, the EObjects updated in the transaction are indexed again at commit"""
+        if self.transaction_depth == 0:
+            return
+        self.transaction_depth -= 1
+        updated = self.updated.pop()
+        if not commit:
+            return
+        if self.transaction_depth > 0:
+            self.updated[-1].extend(updated)
+            return
+        for e_obj in updated:
+            self.update(e_obj)
+    def index_info(self):
+        """Gets the statistics of this index"""
+        return {"builds": self.builds, "updates": self.updates, "references": len(self.indexes), "targets": sum(len(index) for index in self.indexes.values())}
+
+inverse_reference_index = InverseReferenceIndex()
+
+def index_list_change(e_obj, added):
+    """Updates the indexes with an EObject added to or removed from a list of the simplified API"""
+    if added:
+        element_index.add(e_obj)
+    inverse_reference_index.update(e_obj)
+
+class ContainerChainCache():
+    """A cache of the SystemEngineering and the architecture (OperationalAnalysis, SystemAnalysis, LogicalArchitecture,
+    PhysicalArchitecture or EPBSArchitecture) containing each EObject. A lookup walks up the containers until one is already cached,
+    then caches all the walked containers. The cache is not used during transactions and it is cleared when they end"""
+    ARCHITECTURE_NAMES = set(["OperationalAnalysis", "SystemAnalysis", "LogicalArchitecture", "PhysicalArchitecture", "EPBSArchitecture"])
+    def __init__(self):
+        # EObject -> (SystemEngineering, architecture), the EObject itself included
+        self.entries = {}
+        # EClass -> "system engineering", "architecture" or None
+        self.kinds = {}
+        self.transaction_depth = 0
+        self.walks = 0
+    def get_kind(self, e_class):
+        res = self.kinds.get(e_class, False)
+        if res is False:
+            res = None
+            e_class_name = e_class.getName()
+            if e_class_name == "SystemEngineering" and e_class.getEPackage().getNsURI().startswith("http://www.polarsys.org/capella/core/modeller"):
+                res = "system engineering"
+            elif e_class_name in self.ARCHITECTURE_NAMES:
+                res = "architecture"
+            self.kinds[e_class] = res
+        return res
+    def get(self, e_obj):
+        """Gets the SystemEngineering and the architecture containing the given EObject or being the given EObject, None when there is no such container"""
+        entries = self.entries if self.transaction_depth == 0 else {}
+        walked = []
+        res = (None, None)
+        current = e_obj
+        while current is not None:
+            cached = entries.get(current)
+            if cached is not None:
+                res = cached
+                break
+            kind = self.get_kind(current.eClass())
+            if kind == "system engineering":
+                res = entries[current] = (current, None)
+                break
+            walked.append((current, kind))
+            current = current.eContainer()
+        for container, kind in reversed(walked):
+            if kind == "architecture":
+                res = (res[0], container)
+            entries[container] = res
+        self.walks += 1
+        return res
+    def get_system_engineering(self, e_obj):
+        """Gets the SystemEngineering containing the given EObject, None if there is no such container"""
+        container = e_obj.eContainer()
+        if container is None:
+            return None
+        return self.get(container)[0]
+    def get_architecture(self, e_obj):
+        """Gets the architecture containing the given EObject or being the given EObject, None if there is no such architecture"""
+        return self.get(e_obj)[1]
+    def clear(self):
+        """Forgets all the containers"""
+        self.entries.clear()
+    def start_transaction(self):
+        """Suspends the cache until the matching end_transaction()"""
+        self.transaction_depth += 1
+    def end_transaction(self):
+        """Resumes the cache, the containers will be walked again on their next use"""
+        self.clear()
+        if self.transaction_depth > 0:
+            self.transaction_depth -= 1
+    def cache_info(self):
+        """Gets the statistics of this cache"""
+        return {"walks": self.walks, "size": len(self.entries)}
+
+container_chain_cache = ContainerChainCache()
+
+def capella_inverse(e_obj, reference_name):
+    """Gets the EObjects referencing the given EObject via an EReference with the given name, from the inverse reference index"""
+    res = inverse_reference_index.get(e_obj, reference_name)
+    if res is None:
+        return list(e_inverse(e_obj, reference_name))
+    return list(res)
+
+def capella_inverse_index_info():
+    """Gets the statistics of the inverse reference index"""
+    return inverse_reference_index.index_info()
+
+def decode_number(cls):
+    """Gets a decoder converting the value of a PropertyValue EObject with the given class, None stays None"""
+    def decode(property_value):
+        value = property_value.getValue()
+        return None if value is None else cls(value)
+    return decode
+
+class PropertyValueDecoder():
+    """Decodes the value of PropertyValue EObjects to a native value: bool, int, float, str or the EnumerationPropertyLiteral EObject.
+    The decoder of an EClass is chosen once from its kind (its name)"""
+    KIND_DECODERS = {
+        "BooleanPropertyValue": lambda property_value: bool(property_value.isValue()),
+        "IntegerPropertyValue": decode_number(int),
+        "FloatPropertyValue": decode_number(float),
+        "StringPropertyValue": lambda property_value: property_value.getValue(),
+        "EnumerationPropertyValue": lambda property_value: property_value.getValue(),
+    }
+    def __init__(self):
+        # EClass -> decoder
+        self.decoders = {}
+    def get_decoder(self, e_class):
+        """Gets the decoder of the PropertyValues of the given EClass, other kinds are decoded with getValue()"""
+        res = self.decoders.get(e_class)
+        if res is None:
+            res = self.decoders[e_class] = self.KIND_DECODERS.get(e_class.getName(), lambda property_value: property_value.getValue())
+        return res
+    def decode(self, property_value):
+        """Gets the native value of the given PropertyValue EObject"""
+        return self.get_decoder(property_value.eClass())(property_value)
+
+property_value_decoder = PropertyValueDecoder()
+
+class PropertyValueIndex():
+    """An index of the property values of EObjects by name and by group name, built in one pass over the groups of an EObject
+    on its first lookup. It is not used during transactions and it is cleared when they end"""
+    def __init__(self):
+        # EObject -> ({name: value}, {group name: {name: value}}, {name: PropertyValue}, {group name: PropertyValueGroup})
+        self.entries = {}
+        self.transaction_depth = 0
+        self.builds = 0
+    def get(self, e_obj):
+        """Gets the values of the property values of the given EObject by name (the first one for a duplicated name) and by group name,
+        then the PropertyValue and PropertyValueGroup EObjects by name"""
+        if self.transaction_depth > 0:
+            return self.build(e_obj)
+        res = self.entries.get(e_obj)
+        if res is None:
+            res = self.entries[e_obj] = self.build(e_obj)
+        return res
+    def build(self, e_obj):
+        """Reads the property values of the given EObject"""
+        by_name = OrderedDict()
+        by_group = OrderedDict()
+        property_values = {}
+        groups = {}
+        for group in e_obj.getOwnedPropertyValueGroups():
+            group_name = group.getName()
+            groups.setdefault(group_name, group)
+            group_values = by_group.setdefault(group_name, OrderedDict())
+            for property_value in group.getOwnedPropertyValues():
+                name = property_value.getName()
+                value = property_value_decoder.decode(property_value)
+                if name not in by_name:
+                    by_name[name] = value
+                    property_values[name] = property_value
+                if name not in group_values:
+                    group_values[name] = value
+        self.builds += 1
+        return by_name, by_group, property_values, groups
+    def clear(self):
+        """Forgets all the property values"""
+        self.entries.clear()
+    def start_transaction(self):
+        """Suspends the index until the matching end_transaction()"""
+        self.transaction_depth += 1
+    def end_transaction(self):
+        """Resumes the index, the property values will be read again on their next use"""
+        self.clear()
+        if self.transaction_depth > 0:
+            self.transaction_depth -= 1
+    def index_info(self):
+        """Gets the statistics of this index"""
+        return {"builds": self.builds, "elements": len(self.entries)}
+
+property_value_index = PropertyValueIndex()
+
+def decode_requirement_attribute(attribute):
+    """Gets the value of a requirement attribute EObject, the list of the names of the EnumValues for an EnumerationValueAttribute"""
+    if attribute.eClass().getName() == "EnumerationValueAttribute":
+        return [value.getReqIFLongName() for value in attribute.getValues()]
+    return attribute.getValue()
+
+class RequirementAttributeIndex():
+    """An index of the attributes of requirements by the ReqIFLongName of their definition, built in one pass over the attributes
+    of a requirement on its first lookup. It is not used during transactions and it is cleared when they end"""
+    def __init__(self):
+        # requirement EObject -> ({name: value}, {name: attribute EObject})
+        self.entries = {}
+        self.transaction_depth = 0
+        self.builds = 0
+    def get(self, e_obj):
+        """Gets the values of the attributes of the given requirement by name (the first one for a duplicated name), then the attribute EObjects by name"""
+        if self.transaction_depth > 0:
+            return self.build(e_obj)
+        res = self.entries.get(e_obj)
+        if res is None:
+            res = self.entries[e_obj] = self.build(e_obj)
+        return res
+    def get_table(self, e_objs, names):
+        """Gets the values of the attributes with the given names of all the given requirements, as a dict mapping each name to its column (None for a missing attribute)"""
+        res = OrderedDict((name, []) for name in names)
+        for e_obj in e_objs:
+            values = self.get(e_obj)[0]
+            for name, column in res.items():
+                column.append(values.get(name))
+        return res
+    def build(self, e_obj):
+        """Reads the attributes of the given requirement"""
+        values = OrderedDict()
+        attributes = {}
+        for attribute in e_obj.getOwnedAttributes():
+            definition = attribute.getDefinition()
+            name = definition.getReqIFLongName() if definition is not None else None
+            if name is not None and name not in values:
+                values[name] = decode_requirement_attribute(attribute)
+                attributes[name] = attribute
+        self.builds += 1
+        return values, attributes
+    def forget(self, e_obj):
+        """Forgets the attributes of the given requirement, they will be read again on their next use"""
+        self.entries.pop(e_obj, None)
+    def clear(self):
+        """Forgets the attributes of all the requirements"""
+        self.entries.clear()
+    def start_transaction(self):
+        """Suspends the index until the matching end_transaction()"""
+        self.transaction_depth += 1
+    def end_transaction(self):
+        """Resumes the index, the attributes will be read again on their next use"""
+        self.clear()
+        if self.transaction_depth > 0:
+            self.transaction_depth -= 1
+    def index_info(self):
+        """Gets the statistics of this index"""
+        return {"builds": self.builds, "requirements": len(self.entries)}
+
+requirement_attribute_index = RequirementAttributeIndex()
+
+def wrap_query_results(java_results, cls):
+    """Wraps the results of a query with their specific classes, or the given class if there is no specific class"""
+    return [e for e in wrap_java_objects(java_results, cls) if e is not None]
 
 def capella_query(query_class, e_obj, cls = None):
     """Call a query from the semantic browser from the qualified class name of the query and the EObect to pass as parameter"""
-    res = []
-    for e in callQuery(query_class, e_obj.get_java_object()):
-        e_object_class = getattr(sys.modules["__main__"], "EObject")
-        specific_cls = e_object_class.get_class(e)
-        if specific_cls is not None:
-            res.append(specific_cls(e))
-        elif cls is not None:
-            res.append(cls(e))
-    return res
+    key = (query_class, e_obj.get_java_object(), cls)
+    res = query_cache.get(key)
+    if res is None:
+        res = wrap_query_results(callQuery(query_class, e_obj.get_java_object()), cls)
+        query_cache.put(key, res)
+    return list(res)
 
 def capella_query_by_name(e_obj, query_name, cls = None):
     """Call a query from the semantic browser from the query name and the EObect to pass as parameter"""
-    res = []
-    for e in getSBQuery(e_obj.get_java_object(), query_name):
-        e_object_class = getattr(sys.modules["__main__"], "EObject")
-        specific_cls = e_object_class.get_class(e)
-        if specific_cls is not None:
-            res.append(specific_cls(e))
-        elif cls is not None:
-            res.append(cls(e))
+    key = (query_name, e_obj.get_java_object(), cls)
+    res = query_cache.get(key)
+    if res is None:
+        res = wrap_query_results(getSBQuery(e_obj.get_java_object(), query_name), cls)
+        query_cache.put(key, res)
+    return list(res)
+
+def capella_query_many(query_class, e_objs, cls = None):
+    """Call a query from the semantic browser on each of the given EObjects, returns a dict from each EObject to its results"""
+    return run_query_many(query_class, e_objs, cls, lambda java_object: callQuery(query_class, java_object))
+
+def capella_query_by_name_many(e_objs, query_name, cls = None):
+    """Call a query from the semantic browser from its name on each of the given EObjects, returns a dict from each EObject to its results"""
+    return run_query_many(query_name, e_objs, cls, lambda java_object: getSBQuery(java_object, query_name))
+
+def run_query_many(query, e_objs, cls, run_query):
+    """Runs the given query on each EObject not already cached, and wraps all the results in one batch"""
+    res = {}
+    pending = []
+    for e_obj in e_objs:
+        key = (query, e_obj.get_java_object(), cls)
+        cached = query_cache.get(key)
+        if cached is not None:
+            res[e_obj] = list(cached)
+        else:
+            pending.append((e_obj, key, list(run_query(e_obj.get_java_object()))))
+    all_java_results = []
+    for e_obj, key, java_results in pending:
+        all_java_results.extend(java_results)
+    all_results = wrap_java_objects(all_java_results, cls)
+    start = 0
+    for e_obj, key, java_results in pending:
+        results = [e for e in all_results[start:start + len(java_results)] if e is not None]
+        start += len(java_results)
+        query_cache.put(key, results)
+        res[e_obj] = list(results)
     return res
 
+def capella_query_cache_info():
+    """Gets the statistics of the Semantic Browser query cache"""
+    return query_cache.cache_info()
+
 def available_query_names(e_obj):
     """List all available query names for the given EObject"""
     return getAvailableSBQueries(e_obj.get_java_object())
@@ -1,8 +1,9 @@
 loadModule('/Capella/Java')
 import sys
 
-class JavaObject:
+class JavaObject(object):
     """A wrapping class for a Java Object"""
+    __slots__ = ("java_object", "java_hash")
     def __init__(self, java_object):
         self.java_object = java_object
     def get_java_object(self):
@@ -10,12 +11,45 @@ class JavaObject:
         return self.java_object
     def __eq__(self, other):
         if isinstance(other, JavaObject):
-            return self.java_object == other.java_object
+            return self.java_object is other.java_object or self.java_object == other.java_object
         else:
             return False
+    def __ne__(self, other):
+        return not self.__eq__(other)
+    def __hash__(self):
+        # the Java hashCode() is only called once per wrapper
+        try:
+            return self.java_hash
+        except AttributeError:
+            self.java_hash = hash(self.java_object)
+            return self.java_hash
+
+def wrap_java_objects(java_objects, cls = None):
+    """Wraps a batch of Java Objects with their specific classes, falls back to the given class (or None) when there is no specific class.
+    EObject is looked up once per batch, the class of each element is still resolved from its EClass (eClass() and getName() calls)"""
+    e_object_class = getattr(sys.modules["__main__"], "EObject")
+    res = []
+    for value in java_objects:
+        specific_cls = None
+        if value is not None:
+            specific_cls = e_object_class.get_class(value)
+            if specific_cls is None:
+                specific_cls = cls
+        if specific_cls is not None:
+            res.append(specific_cls(value))
+        else:
+            res.append(None)
+    return res
+
+def notify_list_change(obj, added):
+    """Updates the indexes of the Capella API (if included) with an EObject added to or removed from a list"""
+    index_list_change = getattr(sys.modules["__main__"], "index_list_change", None)
+    if index_list_change is not None and isinstance(obj, getattr(sys.modules["__main__"], "EObject")):
+        index_list_change(obj.get_java_object(), added)
 
 class JavaIterator(JavaObject):
     """A wrapping class for a Java Iterator"""
+    __slots__ = ("cls",)
     def __init__(self, java_object, cls):
         JavaObject.__init__(self, java_object)
         self.cls = cls;
@@ -33,28 +67,80 @@ class JavaIterator(JavaObject):
 
 class JavaList(JavaObject):
     """A wrapping class for a Java Iterator"""
+    __slots__ = ("cls",)
+    # number of elements copied to an array by one toArray() call when iterating
+    CHUNK_SIZE = 1000
     def __init__(self, java_object, cls):
         JavaObject.__init__(self, java_object)
         self.cls = cls;
     def __iter__(self):
-        return JavaIterator(self.get_java_object().iterator(), self.cls)
+        for chunk in self.iter_chunks():
+            for element in chunk:
+                yield element
+    def __len__(self):
+        return self.size()
+    def __getitem__(self, index):
+        size = self.size()
+        if isinstance(index, slice):
+            start, stop, step = index.indices(size)
+            if step == 1:
+                return self.get_range(start, stop)
+            else:
+                return self.to_list()[index]
+        if index < 0:
+            index += size
+        if index < 0 or index >= size:
+            raise IndexError("JavaList index out of range")
+        return self.get(index)
+    def get_range(self, start, stop):
+        """Gets the wrapped Objects from start (inclusive) to stop (exclusive) as a Python list.
+        The slice is copied to a Java array with subList() and toArray(), then read with one call per element (an array access under Py4J)
+        instead of the two hasNext() and next() calls of an iterator"""
+        if start >= stop:
+            return []
+        return wrap_java_objects(self.get_java_object().subList(start, stop).toArray(), self.cls)
+    def iter_chunks(self, chunk_size = None):
+        """Iterates over the wrapped Objects of this List by Python lists of at most chunk_size elements.
+        The size is read again before each chunk, so as for a Python list, elements added during the iteration are visited"""
+        if chunk_size is None:
+            chunk_size = JavaList.CHUNK_SIZE
+        start = 0
+        size = self.size()
+        while start < size:
+            yield self.get_range(start, min(start + chunk_size, size))
+            start += chunk_size
+            size = self.size()
+    def to_list(self, chunk_size = None):
+        """Gets all the wrapped Objects of this List as a Python list, read from one Java array or by chunks of chunk_size elements (see get_range())"""
+        if chunk_size is None:
+            return wrap_java_objects(self.get_java_object().toArray(), self.cls)
+        res = []
+        for chunk in self.iter_chunks(chunk_size):
+            res.extend(chunk)
+        return res
     def add(self, obj):
         """Adds the given Object to the list"""
-        return self.get_java_object().add(obj.get_java_object())
+        res = self.get_java_object().add(obj.get_java_object())
+        notify_list_change(obj, True)
+        return res
     def add_all(self, list):
         """Adds all elements of the given List"""
         res = False;
         for e in list:
             res = self.get_java_object().add(e.get_java_object()) or res
+            notify_list_change(e, True)
         return res
     def remove(self, obj):
         """Removes the given Object"""
-        return self.get_java_object().remove(obj.get_java_object())
+        res = self.get_java_object().remove(obj.get_java_object())
+        notify_list_change(obj, False)
+        return res
     def remove_all(self, list):
         """Removes all elements from the given List"""
         res = False;
         for e in list:
             res = self.get_java_object().remove(e.get_java_object()) or res
+            notify_list_change(e, False)
         return res
     def contains(self, obj):
         """Tells if the given Object is contained in this List"""
@@ -73,16 +159,7 @@ class JavaList(JavaObject):
         return self.get_java_object().lastIndexOf(obj.get_java_object())
     def get(self, index):
         """Gets the Object at the given index"""
-        value = self.get_java_object().get(index)
-        if value is None:
-            return value
-        else:
-            e_object_class = getattr(sys.modules["__main__"], "EObject")
-            specific_cls = e_object_class.get_class(value)
-            if specific_cls is not None:
-                return specific_cls(value)
-            else:
-                return None
+        return wrap_java_objects([self.get_java_object().get(index)], self.cls)[0]
     def clear(self):
         """Removes all elements from this List"""
         return self.get_java_object().clear()
@@ -39,12 +39,11 @@ include('workspace://Python4Capella/utilities/CapellaPlatform.py')
 if False:
     from utilities.CapellaPlatform import *
     
-# include needed to read/write xlsx files
-from openpyxl import *
-from openpyxl.formatting.rule import ColorScaleRule,CellIsRule,FormulaRule
-from openpyxl.styles import Alignment, NamedStyle, Font, colors, Color, PatternFill
-from openpyxl.styles.differential import DifferentialStyle
-from openpyxl.styles.borders import Border, Side
+# include needed to write xlsx files
+include('workspace://Python4Capella/utilities/XlsxExport.py')
+if False:
+    from utilities.XlsxExport import *
+from openpyxl.formatting.rule import ColorScaleRule
 
 # Retrieve the Element from the current selection and its aird model path
 selected_elem = CapellaElement(CapellaPlatform.getFirstSelectedElement())
@@ -78,127 +77,47 @@ project_name = aird_path[0:(aird_path.index("/", 1) + 1)]
 project = CapellaPlatform.getProject(project_name)
 folder = CapellaPlatform.getFolder(project, 'results')
 xlsx_file_name = CapellaPlatform.getAbsolutePath(folder) + '/' + 'Mission_Capability_FC_and_progress_status.xlsx'
-# create a workbook
-workbook = Workbook()
-
-# writing excel file header
-worksheet1 = workbook.active
-worksheet1.title = 'Mission, Capability, statuses'
-worksheet1["A1"] = 'Mission name'
-worksheet1["B1"] = 'Exploited Capability name'
-worksheet1["C1"] = 'Percentage Designed'
-worksheet1["D1"] = 'Percentage Developed'
-worksheet1["E1"] = 'Percentage Validated'
-
-# retrieve the list of Missions and PVs
-all_Missions = []
-allPVs = []
-
 all_Missions = se.get_all_contents_by_type(Mission)
+# the exploited capabilities of all the missions are queried at once
+exploited_capabilities = capella_query_by_name_many(all_Missions, "Exploited Capabilities")
+
+# the progress statuses defined with PVMT add on, None when a capability has no such PV
+statuses = ['Percentage_Designed', 'Percentage_Developed', 'Percentage_Validated']
+
+def get_status(elem_capability, pvName):
+    value = PVMT.get_typed_p_v_value(elem_capability, pvName)
+    return int(value) if value is not None else None
+
+# now retrieving Missions, exploited Capabilities and progress statuses from model, a row per element
+def iter_status_rows():
+    for elem_Mission in all_Missions:
+        yield (elem_Mission.get_name(),)
+        for elem_capability in exploited_capabilities[elem_Mission]:
+            yield (None, elem_capability.get_name()) + tuple(get_status(elem_capability, pvName) for pvName in statuses)
+
+# now retrieving Missions, exploited Capabilities and involved Functional Chains from model, a row per element
+def iter_FC_rows():
+    for elem_Mission in all_Missions:
+        yield elem_Mission.get_name(), None, None
+        for elem_capability in exploited_capabilities[elem_Mission]:
+            yield None, elem_capability.get_name(), None
+            for elem_involved_FC in elem_capability.get_involved_functional_chains():
+                yield None, None, elem_involved_FC.get_name()
+
+# writing the sheets, the cells are framed, the header is blue and the statuses are colored from red to yellow
+export = XlsxExport()
+export.add_sheet('Mission, Capability, statuses', [XlsxColumn('Mission name', width = 30, **FRAMED),
+                                                   XlsxColumn('Exploited Capability name', width = 30, **FRAMED),
+                                                   XlsxColumn('Percentage Designed', width = 20, **FRAMED),
+                                                   XlsxColumn('Percentage Developed', width = 20, **FRAMED),
+                                                   XlsxColumn('Percentage Validated', width = 20, **FRAMED)], iter_status_rows(),
+                 conditional_formattings = {'C:E': ColorScaleRule(start_type='min', start_value=0,start_color ='AA0000', end_type ='max', end_value=100, end_color='F7FF3C')})
+export.add_sheet('Mission, capabilities, FC', [XlsxColumn('Mission name', width = 30, **FRAMED),
+                                               XlsxColumn('Exploited Capability name', width = 30, **FRAMED),
+                                               XlsxColumn('Involved Functional Chain name', width = 30, **FRAMED)], iter_FC_rows())
 
-# now retrieving Missions, exploited Capabilities and progress statuses defined with PVMT add on from model
-i = 1
-j = 2
-
-for elem_Mission in all_Missions:
-    i = i + 1
-    worksheet1.cell(row = i, column = 1).value = elem_Mission.get_name()
-    exploited_capability = elem_Mission.get_exploited_capabilities()
-    
-    for elem_capability in exploited_capability: 
-        i = i + 1
-        j = 2    
-        worksheet1.cell(row = i, column = 2).value = elem_capability.get_name()
-        for pvName in PVMT.get_p_v_names(elem_capability):
-            if pvName not in allPVs:
-                allPVs.append(pvName)
-        for pvName in allPVs:
-            if pvName == 'Percentage_Designed':
-                j = j + 1
-                worksheet1.cell(row = i, column = j).value = int(PVMT.get_p_v_value(elem_capability, pvName))
-            if pvName == 'Percentage_Developed':
-                j = j + 1
-                worksheet1.cell(row = i, column = j).value = int(PVMT.get_p_v_value(elem_capability, pvName))       
-            if pvName == 'Percentage_Validated':
-                j = j + 1
-                worksheet1.cell(row = i, column = j).value = int(PVMT.get_p_v_value(elem_capability, pvName))        
-
- 
-column_widths = [] 
-bd = Side(border_style='medium')
-chosen_border = Border(left=bd, top=bd,right=bd, bottom=bd)
-chosen_alignment = Alignment(wrap_text=True,vertical='top')
-
-
-first_row = worksheet1[1]
-Color_font = Font(color= colors.BLUE)
-for cell in first_row:
-    cell.font = Color_font
-          
-for row in worksheet1.iter_rows():
-
-    for cell in row:
-        cell.alignment = chosen_alignment
-        cell.border = chosen_border
-
-worksheet1.conditional_formatting.add('C1:E100', ColorScaleRule(start_type='min', start_value=0,start_color ='AA0000', end_type ='max', end_value=100, end_color='F7FF3C'))
-
-column_width = 30
-worksheet1.column_dimensions['A'].width = column_width
-worksheet1.column_dimensions['B'].width = column_width
-column_width = 20
-worksheet1.column_dimensions['C'].width = column_width
-worksheet1.column_dimensions['D'].width = column_width
-worksheet1.column_dimensions['E'].width = column_width
-
-# writing excel file header
-worksheet2 = workbook.create_sheet('Mission, capabilities, FC', 2)
-worksheet2["A1"] = 'Mission name'
-worksheet2["B1"] = 'Exploited Capability name'
-worksheet2["C1"] = 'Involved Functional Chain name'
-
-
-# retrieve the list of Missions and PVs
-all_Missions = []
-all_Missions = se.get_all_contents_by_type(Mission)
-
-# now retrieving Missions, exploited Capabilities and involved Functional Chains from model
-i = 1
-
-for elem_Mission in all_Missions:
-    i = i + 1
-    worksheet2.cell(row = i, column = 1).value = elem_Mission.get_name()
-    exploited_capability = elem_Mission.get_exploited_capabilities()
-    
-    for elem_capability in exploited_capability: 
-        i = i + 1    
-        worksheet2.cell(row = i, column = 2).value = elem_capability.get_name()
-        involved_FC = elem_capability.get_involved_functional_chains()
-        
-        for elem_involved_FC in involved_FC: 
-            i = i + 1    
-            worksheet2.cell(row = i, column = 3).value = elem_involved_FC.get_name()
-    
-column_widths = []            
-first_row = worksheet2[1]
-Color_font = Font(color= colors.BLUE)
-for cell in first_row:
-    cell.font = Color_font
-          
-for row in worksheet2.iter_rows():
-
-    for cell in row:
-        cell.alignment = chosen_alignment
-        cell.border = chosen_border
-
-column_width = 30
-worksheet2.column_dimensions['A'].width = column_width
-worksheet2.column_dimensions['B'].width = column_width
-worksheet2.column_dimensions['C'].width = column_width
-worksheet2.column_dimensions['D'].width = column_width
-                   
 # Save the xlsx file
-workbook.save(xlsx_file_name)
+export.save(xlsx_file_name)
 
 print('saving excel file')
 
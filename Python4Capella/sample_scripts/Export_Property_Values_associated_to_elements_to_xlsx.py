@@ -29,8 +29,10 @@ include('workspace://Python4Capella/utilities/CapellaPlatform.py')
 if False:
     from utilities.CapellaPlatform import *
     
-# include needed to read/write xlsx files
-from openpyxl import *
+# include needed to write xlsx files
+include('workspace://Python4Capella/utilities/XlsxExport.py')
+if False:
+    from utilities.XlsxExport import *
 
 # change this path to execute the script on your model (here is the IFE sample). 
 # comment it if you want to use the "Run configuration" instead
@@ -61,45 +63,26 @@ project = CapellaPlatform.getProject(project_name)
 folder = CapellaPlatform.getFolder(project, 'results')
 CapellaPlatform.getAbsolutePath(folder)
 xlsx_file_name = CapellaPlatform.getAbsolutePath(folder) + '/' + 'Export_Property_Values_associated_to_elements_to_xlsx.xlsx'
-# create a workbook
-workbook = Workbook()
-
-
-# writing excel file header
-worksheet = workbook.active
-worksheet.title = 'PV export on Functions'
-worksheet["A1"] = 'System Function name'
-
 # retrieve the list of PV to write the header
 allPVs = []
+knownPVs = set()
 
 # change SystemFunction by another type to retrieve PV for other elements
 allSF = se.get_all_contents_by_type(SystemFunction)
 
 for sf in allSF:
     for pvName in PVMT.get_p_v_names(sf):
-        if pvName not in allPVs:
+        if pvName not in knownPVs:
+            knownPVs.add(pvName)
             allPVs.append(pvName)
 
-# writing header for all PV found
-j = 2
-for pvName in allPVs:
-    worksheet.cell(row = 1, column = j).value = pvName
-    j = j + 1
-
-# now retrieving elements from model
-i = 2
-
-for sf in allSF:
-    worksheet.cell(row = i, column = 1).value = sf.get_name()
-    j = 2
-    for pvName in allPVs:
-        worksheet.cell(row = i, column = j).value = PVMT.get_p_v_value(sf, pvName)
-        j = j + 1
-    i = i + 1
+# writing the sheet, a column for all PV found
+projection = Projection(["name"] + [PVMT.get_p_v_attribute(pvName) for pvName in allPVs])
+export = XlsxExport()
+export.add_sheet('PV export on Functions', [XlsxColumn('System Function name')] + [XlsxColumn(pvName) for pvName in allPVs], projection.iter_rows(allSF))
 
 # Save the xlsx file
-workbook.save(xlsx_file_name)
+export.save(xlsx_file_name)
 
 print('saving excel file')
 
@@ -32,35 +32,35 @@ include('workspace://Python4Capella/utilities/CapellaPlatform.py')
 if False:
     from utilities.CapellaPlatform import *
     
-# include needed to read/write xlsx files
-from openpyxl import *
-from openpyxl.formatting.rule import ColorScaleRule,CellIsRule,FormulaRule
-from openpyxl.styles import Alignment, NamedStyle, Font, colors, Color, PatternFill
-from openpyxl.styles.differential import DifferentialStyle
-from openpyxl.styles.borders import Border, Side
+# include needed to write xlsx files
+include('workspace://Python4Capella/utilities/XlsxExport.py')
+if False:
+    from utilities.XlsxExport import *
 
-# we define a generic method to retrieve the sub-elements of any kind of element
-def getSubElements(ws, i, j, elem):
-    ws.cell(row = i, column = j).value = elem.get_name()
-    i = i+1
+# we define a generic method to retrieve the sub-elements of any kind of element, a row per element with its name in the column of its depth
+def getSubElements(j, elem):
+    yield (None,) * (j - 1) + (elem.get_name(),)
     if (isinstance(elem, NodePC)):
         npc = elem
         #: :type npc: NodePC
         # if we have a NodePC we want the sub-NodePC and deployed BehaviorPC
         for subPC in npc.get_owned_physical_components():
-            i = getSubElements(ws, i, j+1, subPC)
+            for row in getSubElements(j+1, subPC):
+                yield row
         for bpc in npc.get_deployed_behavior_p_cs():
-            i = getSubElements(ws, i, j+1, bpc)
+            for row in getSubElements(j+1, bpc):
+                yield row
     if isinstance(elem, BehaviorPC):
         bpc = elem
         #: :type bpc: BehaviorPC
         # if we have a BehaviorPC we want the sub-BehaviorPC and allocated Functions
         for subPC in bpc.get_owned_physical_components():
-            i = getSubElements(ws, i, j+1, subPC)
+            for row in getSubElements(j+1, subPC):
+                yield row
         for func in bpc.get_allocated_functions():
-            i = getSubElements(ws, i, j+1, func)
+            for row in getSubElements(j+1, func):
+                yield row
     # we have nothing more to do if we have a function
-    return i
 
 # Retrieve the Element from the current selection and its aird model path
 selected_elem = CapellaElement(CapellaPlatform.getFirstSelectedElement())
@@ -95,58 +95,20 @@ project_name = aird_path[0:(aird_path.index("/", 1) + 1)]
 project = CapellaPlatform.getProject(project_name)
 folder = CapellaPlatform.getFolder(project, 'results')
 xlsx_file_name = CapellaPlatform.getAbsolutePath(folder) + '/' + 'Export_a_pseudo_hierarchy_of_PA_elements_to_xlsx.xlsx'
-# create a workbook
-workbook = Workbook()
-
-# writing excel file header
-worksheet = workbook.active
-worksheet.title = 'PA export'
-worksheet["A1"] = 'Elem 1'
-worksheet["B1"] = 'Elem 2'
-worksheet["C1"] = 'Elem 3'
-worksheet["D1"] = 'Elem 4'
-worksheet["E1"] = 'Elem 5'
-worksheet["F1"] = 'Elem 6'
-worksheet["G1"] = 'Elem 7'
-worksheet["H1"] = 'Elem 8'
-worksheet["I1"] = 'Elem 9'
-
-i=2
-
 # retrieving elements from the model
-for npc in se.get_physical_architecture().get_physical_system().get_owned_physical_components():
-    if (isinstance(npc, NodePC)):
-        i = getSubElements(worksheet, i, 1, npc)
-        
-bd = Side(border_style='medium')
-chosen_border = Border(left=bd, top=bd,right=bd, bottom=bd)
-chosen_alignment = Alignment(wrap_text=True,vertical='top')
+def iter_rows():
+    for npc in se.get_physical_architecture().get_physical_system().get_owned_physical_components():
+        if (isinstance(npc, NodePC)):
+            for row in getSubElements(1, npc):
+                yield row
 
-
-first_row = worksheet[1]
-Color_font = Font(color= colors.BLUE)
-for cell in first_row:
-    cell.font = Color_font
-          
-for row in worksheet.iter_rows():
-
-    for cell in row:
-        cell.alignment = chosen_alignment
-        cell.border = chosen_border
-        
+# writing the sheet, the cells are framed and the header is blue
 column_width = 17
-worksheet.column_dimensions['A'].width = column_width
-worksheet.column_dimensions['B'].width = column_width
-worksheet.column_dimensions['C'].width = column_width
-worksheet.column_dimensions['D'].width = column_width
-worksheet.column_dimensions['E'].width = column_width  
-worksheet.column_dimensions['F'].width = column_width  
-worksheet.column_dimensions['G'].width = column_width  
-worksheet.column_dimensions['H'].width = column_width
-worksheet.column_dimensions['I'].width = column_width  
-        
+export = XlsxExport()
+export.add_sheet('PA export', [XlsxColumn('Elem ' + str(j), width = column_width, **FRAMED) for j in range(1, 10)], iter_rows())
+
 # Save the xlsx file
-workbook.save(xlsx_file_name)
+export.save(xlsx_file_name)
 
 print('saving excel file')
 
@@ -27,8 +27,10 @@ include('workspace://Python4Capella/utilities/CapellaPlatform.py')
 if False:
     from utilities.CapellaPlatform import *
     
-# include needed to read/write xlsx files
-from openpyxl import *
+# include needed to write xlsx files
+include('workspace://Python4Capella/utilities/XlsxExport.py')
+if False:
+    from utilities.XlsxExport import *
 
 # change this path to execute the script on your model (here is the IFE sample). 
 # comment it if you want to use the "Run configuration" instead
@@ -58,32 +60,18 @@ project_name = aird_path[0:(aird_path.index("/", 1) + 1)]
 project = CapellaPlatform.getProject(project_name)
 folder = CapellaPlatform.getFolder(project, 'results')
 xlsx_file_name = CapellaPlatform.getAbsolutePath(folder) + '/' + 'Capability_owned_scenario.xlsx'
-# create a workbook
-workbook = Workbook()
-
-# writing excel file header
-worksheet = workbook.active
-worksheet.title = 'Capability and owned scenario'
-worksheet["A1"] = 'Capability name'
-worksheet["B1"] = 'Owned Scenario name'
+# now retrieving capabilities and owned scenarios from model, a row per capability followed by a row per owned scenario
+def iter_rows():
+    for elem_capability in se.get_all_contents_by_type(Capability):
+        yield elem_capability.get_name(), None
+        for elem_scenario in elem_capability.get_owned_scenarios():
+            yield None, elem_scenario.get_name()
 
-# retrieve the list of Capabilities
-all_Capabilities = []
-all_Capabilities = se.get_all_contents_by_type(Capability)
-# now retrieving cpabilities and owned scenarios from model
-i = 1
+export = XlsxExport()
+export.add_sheet('Capability and owned scenario', [XlsxColumn('Capability name'), XlsxColumn('Owned Scenario name')], iter_rows())
 
-for elem_capability in all_Capabilities:
-    i = i + 1
-    worksheet.cell(row = i, column = 1).value = elem_capability.get_name()
-    involved_scenario = elem_capability.get_owned_scenarios()
-    
-    for elem_scenario in involved_scenario:
-        i = i + 1    
-        worksheet.cell(row = i, column = 2).value = elem_scenario.get_name()
-        
 # Save the xlsx file
-workbook.save(xlsx_file_name)
+export.save(xlsx_file_name)
 
 print('saving excel file')
 
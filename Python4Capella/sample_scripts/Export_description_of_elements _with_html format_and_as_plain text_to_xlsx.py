@@ -27,8 +27,10 @@ include('workspace://Python4Capella/utilities/CapellaPlatform.py')
 if False:
     from utilities.CapellaPlatform import *
     
-# include needed to read/write xlsx files
-from openpyxl import *
+# include needed to write xlsx files
+include('workspace://Python4Capella/utilities/XlsxExport.py')
+if False:
+    from utilities.XlsxExport import *
 # additional import for html format description parsing
 from io import StringIO
 from html.parser import HTMLParser
@@ -79,30 +81,15 @@ project_name = aird_path[0:(aird_path.index("/", 1) + 1)]
 project = CapellaPlatform.getProject(project_name)
 folder = CapellaPlatform.getFolder(project, 'results')
 xlsx_file_name = CapellaPlatform.getAbsolutePath(folder) + '/' + 'Export_description_of_elements _with_html format_and_as_plain text_to_xlsx.xlsx'
-# create a workbook
-workbook = Workbook()
-
-
-# writing excel file header
-worksheet = workbook.active
-worksheet.title = 'Elements Description'
-worksheet["A1"] = 'Element Name'
-worksheet["B1"] = 'HTML Description'
-worksheet["C1"] = 'Plain text description'
-
-i=2
+# retrieving elements from the model, the plain text is computed from the HTML description
+export = XlsxExport()
+export.add_sheet('Elements Description', [XlsxColumn('Element Name'),
+                                          XlsxColumn('HTML Description'),
+                                          XlsxColumn('Plain text description', lambda row: strip_tags(row[1]) if row[1] != None else None)],
+                 Projection(["name", "description"]).iter_rows(se.iter_all_contents_by_type(SystemFunction)))
 
-# retrieving elements from the model
-for elem in se.get_all_contents_by_type(SystemFunction):
-    elem = SystemFunction(elem)
-    worksheet["A" + str(i)] = elem.get_name()
-    worksheet["B" + str(i)] = elem.get_description()
-    if elem.get_description() != None:
-        worksheet["C" + str(i)] = strip_tags(elem.get_description())
-    i = i+1
-        
 # Save the xlsx file
-workbook.save(xlsx_file_name)
+export.save(xlsx_file_name)
 
 print('saving excel file')
 
@@ -33,8 +33,10 @@ include('workspace://Python4Capella/utilities/CapellaPlatform.py')
 if False:
     from utilities.CapellaPlatform import *
     
-# include needed to read/write xlsx files
-from openpyxl import *
+# include needed to write xlsx files
+include('workspace://Python4Capella/utilities/XlsxExport.py')
+if False:
+    from utilities.XlsxExport import *
 
 # change this path to execute the script on your model (here is the IFE sample). 
 # comment it if you want to use the "Run configuration" instead
@@ -64,38 +66,21 @@ project_name = aird_path[0:(aird_path.index("/", 1) + 1)]
 project = CapellaPlatform.getProject(project_name)
 folder = CapellaPlatform.getFolder(project, 'results')
 xlsx_file_name = CapellaPlatform.getAbsolutePath(folder) + '/' + 'Export_list_of_Requirements_to_xlsx.xlsx'
-# create a workbook
-workbook = Workbook()
-
+# retrieving elements from the model
+def join_names(elements):
+    return ', '.join([name for (name,) in project_elements(elements, ["name"])])
 
-# writing excel file header
-worksheet = workbook.active
-worksheet.title = 'Requirements export'
-worksheet["A1"] = 'Req id'
-worksheet["B1"] = 'Req Text'
-worksheet["C1"] = 'Linked Elements (incoming links)'
-worksheet["D1"] = 'Linked Elements (outgoing links)'
+projection = Projection(["id", "text",
+                         ("incoming", lambda req: join_names(req.get_incoming_linked_elems())),
+                         ("outgoing", lambda req: join_names(req.get_outgoing_linked_elems()))])
 
-i=2
+# writing the sheet, a row per requirement
+export = XlsxExport()
+export.add_sheet('Requirements export', [XlsxColumn('Req id'), XlsxColumn('Req Text'), XlsxColumn('Linked Elements (incoming links)'), XlsxColumn('Linked Elements (outgoing links)')],
+                 projection.iter_rows(se.iter_all_contents_by_type(Requirement)))
 
-# retrieving elements from the model
-for req in se.get_all_contents_by_type(Requirement):
-    #: :type req: Requirement
-    worksheet["A" + str(i)] = req.get_id()
-    worksheet["B" + str(i)] = req.get_text()
-    incoming_req_names = []
-    for res in req.get_incoming_linked_elems():
-        incoming_req_names.append(res.get_name())
-    outgoing_req_names = []
-    for res in req.get_outgoing_linked_elems():
-        outgoing_req_names.append(res.get_name())
-    worksheet["C" + str(i)] = ', '.join(incoming_req_names)
-    worksheet["D" + str(i)] = ', '.join(outgoing_req_names)
-    
-    i = i + 1
-        
 # Save the xlsx file
-workbook.save(xlsx_file_name)
+export.save(xlsx_file_name)
 
 print('saving excel file')
 
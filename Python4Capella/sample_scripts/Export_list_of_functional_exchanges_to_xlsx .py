@@ -27,8 +27,10 @@ include('workspace://Python4Capella/utilities/CapellaPlatform.py')
 if False:
     from utilities.CapellaPlatform import *
     
-# include needed to read/write xlsx files
-from openpyxl import *
+# include needed to write xlsx files
+include('workspace://Python4Capella/utilities/XlsxExport.py')
+if False:
+    from utilities.XlsxExport import *
 
 # change this path to execute the script on your model (here is the IFE sample). 
 # comment it if you want to use the "Run configuration" instead
@@ -59,39 +61,34 @@ project_name = aird_path[0:(aird_path.index("/", 1) + 1)]
 project = CapellaPlatform.getProject(project_name)
 folder = CapellaPlatform.getFolder(project, 'results')
 xlsx_file_name = CapellaPlatform.getAbsolutePath(folder) + '/' + 'Export_list_of_functional_exchanges_to_xlsx.xlsx'
-# create a workbook
-workbook = Workbook()
-
-# writing excel file header
-worksheet = workbook.active
-worksheet.title = 'Interfaces export'
-worksheet["A1"] = 'LC 1'
-worksheet["B1"] = 'LC 2'
-worksheet["C1"] = 'FE name'
-
-i=2
-
 # retrieving elements from the model
 all_LC = se.get_all_contents_by_type(LogicalComponent)
-all_FE = se.get_all_contents_by_type(FunctionalExchange)
-
-for LC1 in all_LC:
-    for LC2 in all_LC:
-        #: :type LC1: LogicalComponent
-        #: :type LC2: LogicalComponent
-        worksheet["A" + str(i)] = LC1.get_name()
-        worksheet["B" + str(i)] = LC2.get_name()
-        list_FE = []
-        for fe in all_FE:
-            #: :type LC1: FunctionalExchange
-            if (fe.get_source_function() is not None and fe.get_source_function().get_allocating_component() == LC1):
-                if (fe.get_target_function() is not None and fe.get_target_function().get_allocating_component() == LC2):
-                    list_FE.append(fe.get_name())
-        worksheet["C" + str(i)] = ', '.join(list_FE)
-        i = i +1
-        
+
+# group the functional exchange names by (source component, target component)
+FE_names_by_LC = {}
+for fe in se.iter_all_contents_by_type(FunctionalExchange):
+    #: :type fe: FunctionalExchange
+    source_function = fe.get_source_function()
+    target_function = fe.get_target_function()
+    if source_function is not None and target_function is not None:
+        key = (source_function.get_allocating_component(), target_function.get_allocating_component())
+        FE_names_by_LC.setdefault(key, []).append(fe.get_name())
+
+def iter_LC_pairs():
+    for LC1 in all_LC:
+        for LC2 in all_LC:
+            #: :type LC1: LogicalComponent
+            #: :type LC2: LogicalComponent
+            yield LC1, LC2
+
+# writing the sheet, a row per pair of components
+export = XlsxExport()
+export.add_sheet('Interfaces export', [XlsxColumn('LC 1', lambda pair: pair[0].get_name()),
+                                       XlsxColumn('LC 2', lambda pair: pair[1].get_name()),
+                                       XlsxColumn('FE name', lambda pair: ', '.join(FE_names_by_LC.get(pair, [])))], iter_LC_pairs())
+
 # Save the xlsx file
-workbook.save(xlsx_file_name)
+export.save(xlsx_file_name)
 
 print('saving excel file')
 
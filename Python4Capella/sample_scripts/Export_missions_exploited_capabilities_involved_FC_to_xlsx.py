@@ -27,8 +27,10 @@ include('workspace://Python4Capella/utilities/CapellaPlatform.py')
 if False:
     from utilities.CapellaPlatform import *
     
-# include needed to read/write xlsx files
-from openpyxl import *
+# include needed to write xlsx files
+include('workspace://Python4Capella/utilities/XlsxExport.py')
+if False:
+    from utilities.XlsxExport import *
 
 # change this path to execute the script on your model (here is the IFE sample). 
 # comment it if you want to use the "Run configuration" instead
@@ -58,42 +60,23 @@ project_name = aird_path[0:(aird_path.index("/", 1) + 1)]
 project = CapellaPlatform.getProject(project_name)
 folder = CapellaPlatform.getFolder(project, 'results')
 xlsx_file_name = CapellaPlatform.getAbsolutePath(folder) + '/' + 'Mission_Capability_FC.xlsx'
-# create a workbook
-workbook = Workbook()
-
-# writing excel file header
-worksheet = workbook.active
-worksheet.title = 'Mission, Capability,FC'
-worksheet["A1"] = 'Mission name'
-worksheet["B1"] = 'Exploited Capability name'
-worksheet["C1"] = 'Involved Functional Chain name'
-
-
-# retrieve the list of Missions
-all_Missions = []
+# now retrieving Missions, exploited Capabilities and involved Functional Chains from model, a row per element
+# the exploited capabilities are queried for all the missions before writing the rows
+def iter_rows():
+    all_Missions = se.get_all_contents_by_type(Mission)
+    exploited_capabilities = capella_query_by_name_many(all_Missions, "Exploited Capabilities")
+    for elem_Mission in all_Missions:
+        yield elem_Mission.get_name(), None, None
+        for elem_capability in exploited_capabilities[elem_Mission]:
+            yield None, elem_capability.get_name(), None
+            for elem_involved_FC in elem_capability.get_involved_functional_chains():
+                yield None, None, elem_involved_FC.get_name()
+
+export = XlsxExport()
+export.add_sheet('Mission, Capability,FC', [XlsxColumn('Mission name'), XlsxColumn('Exploited Capability name'), XlsxColumn('Involved Functional Chain name')], iter_rows())
 
-
-all_Missions = se.get_all_contents_by_type(Mission)
-
-# now retrieving Missions, exploited Capabilities and involved Functional Chains from model
-i = 1
-
-for elem_Mission in all_Missions:
-    i = i + 1
-    worksheet.cell(row = i, column = 1).value = elem_Mission.get_name()
-    exploited_capability = elem_Mission.get_exploited_capabilities()
-    
-    for elem_capability in exploited_capability: 
-        i = i + 1    
-        worksheet.cell(row = i, column = 2).value = elem_capability.get_name()
-        involved_FC = elem_capability.get_involved_functional_chains()
-        
-        for elem_involved_FC in involved_FC: 
-            i = i + 1    
-            worksheet.cell(row = i, column = 3).value = elem_involved_FC.get_name()
-        
 # Save the xlsx file
-workbook.save(xlsx_file_name)
+export.save(xlsx_file_name)
 
 print('saving excel file')
 
@@ -26,8 +26,10 @@ include('workspace://Python4Capella/utilities/CapellaPlatform.py')
 if False:
     from utilities.CapellaPlatform import *
     
-# include needed to read/write xlsx files
-from openpyxl import *
+# include needed to write xlsx files
+include('workspace://Python4Capella/utilities/XlsxExport.py')
+if False:
+    from utilities.XlsxExport import *
 
 # change this path to execute the script on your model (here is the IFE sample). 
 # comment it if you want to use the "Run configuration" instead
@@ -57,31 +59,21 @@ project_name = aird_path[0:(aird_path.index("/", 1) + 1)]
 project = CapellaPlatform.getProject(project_name)
 folder = CapellaPlatform.getFolder(project, 'results')
 xlsx_file_name = CapellaPlatform.getAbsolutePath(folder) + '/' + 'Physical_Paths_and_links.xlsx'
-# create a workbook
-workbook = Workbook()
-
-# writing excel file header
-worksheet = workbook.active
-worksheet.title = 'Physical Paths and links'
-worksheet["A1"] = 'Physical Paths name'
-worksheet["B1"] = 'Physical Links name'
-
-# retrieve the list of physical paths
-all_physical_paths = []
-all_physical_paths = se.get_all_contents_by_type(PhysicalPath)
+# now retrieve physical paths name and involved physical links name from model, a row per physical path followed by a row per involved link
+# the involved links of all the physical paths are queried at once
+def iter_rows():
+    physical_paths = se.get_all_contents_by_type(PhysicalPath)
+    involved_physical_links = capella_query_by_name_many(physical_paths, "Involved Physical Links")
+    for elem_physical_path in physical_paths:
+        yield elem_physical_path.get_name(), None
+        for elem_physical_link in involved_physical_links[elem_physical_path]:
+            yield None, elem_physical_link.get_name()
 
-# now retrieve physical paths name and involved physical links name from model
-i = 1
+export = XlsxExport()
+export.add_sheet('Physical Paths and links', [XlsxColumn('Physical Paths name'), XlsxColumn('Physical Links name')], iter_rows())
 
-for elem_physical_path in all_physical_paths:
-    i = i + 1
-    worksheet.cell(row = i, column = 1).value = elem_physical_path.get_name()
-    involved_physical_links = elem_physical_path.get_involved_physical_links()
-    for elem_physical_link in involved_physical_links:
-        i = i + 1    
-        worksheet.cell(row = i, column = 2).value = elem_physical_link.get_name()
 # Save the xlsx file
-workbook.save(xlsx_file_name)
+export.save(xlsx_file_name)
 
 print('saving excel file')
 
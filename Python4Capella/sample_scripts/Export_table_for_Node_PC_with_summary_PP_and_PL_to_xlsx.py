@@ -33,8 +33,10 @@ include('workspace://Python4Capella/utilities/CapellaPlatform.py')
 if False:
     from utilities.CapellaPlatform import *
 
-# include needed to read/write xlsx files
-from openpyxl import *
+# include needed to write xlsx files
+include('workspace://Python4Capella/utilities/XlsxExport.py')
+if False:
+    from utilities.XlsxExport import *
 
 # change this path to execute the script on your model (here is the IFE sample). 
 # comment it if you want to use the "Run configuration" instead
@@ -65,43 +67,31 @@ project = CapellaPlatform.getProject(project_name)
 folder = CapellaPlatform.getFolder(project, 'results')
 CapellaPlatform.getAbsolutePath(folder)
 xlsx_file_name = CapellaPlatform.getAbsolutePath(folder) + '/' + 'Export_table_for_Node_PC_with_summary_PP_and_PL_to_xlsx.xlsx'
-# create a workbook
-workbook = Workbook()
-
-
-# writing excel file header
-worksheet = workbook.active
-worksheet.title = 'PA export'
-worksheet["A1"] = 'NodePC name'
-worksheet["B1"] = 'NodePC summary'
-worksheet["C1"] = 'ComponentPort name'
-worksheet["D1"] = 'direction'
-worksheet["E1"] = 'PhysicalLink name'
-
-i=2
-
-# retrieving elements from the model
-for npc in se.get_all_contents_by_type(NodePC):
-    #: :type npc: NodePC
-    for pp in npc.get_contained_physical_ports():
-        #: :type pp: PhysicalPort
-        # for this script, we consider only the first component port allocated to the physical port
-        cp = None
-        if len(pp.get_allocated_component_ports()) > 0:
-            cp = pp.get_allocated_component_ports()[0]
-        for pl in pp.get_physical_links():
-            #: :type pl: PhysicalLink
-            worksheet["A" + str(i)] = npc.get_name()
-            worksheet["B" + str(i)] = npc.get_summary()
-            worksheet["C" + str(i)] = pp.get_name()
-            if cp is not None:
-                worksheet["D" + str(i)] = cp.get_orientation()
-            worksheet["E" + str(i)] = pl.get_name()
-            i = i + 1
-        
+# retrieving elements from the model, a row per physical link of a physical port of a NodePC
+# the ports of all the NodePCs are collected first to query their component ports and links at once
+def iter_rows():
+    npc_pps = [(npc, npc.get_contained_physical_ports()) for npc in se.iter_all_contents_by_type(NodePC)]
+    all_pps = [pp for npc, pps in npc_pps for pp in pps]
+    allocated_cps = capella_query_by_name_many(all_pps, "Allocated Component Ports")
+    pls = capella_query_by_name_many(all_pps, "Physical Links")
+    for npc, pps in npc_pps:
+        #: :type npc: NodePC
+        for pp in pps:
+            #: :type pp: PhysicalPort
+            # for this script, we consider only the first component port allocated to the physical port
+            cp = None
+            if len(allocated_cps[pp]) > 0:
+                cp = allocated_cps[pp][0]
+            for pl in pls[pp]:
+                #: :type pl: PhysicalLink
+                yield npc.get_name(), npc.get_summary(), pp.get_name(), cp.get_orientation() if cp is not None else None, pl.get_name()
+
+export = XlsxExport()
+export.add_sheet('PA export', [XlsxColumn('NodePC name'), XlsxColumn('NodePC summary'), XlsxColumn('ComponentPort name'), XlsxColumn('direction'), XlsxColumn('PhysicalLink name')],
+                 iter_rows())
 
 # Save the xlsx file
-workbook.save(xlsx_file_name)
+export.save(xlsx_file_name)
 
 print('saving excel file')
 
@@ -25,8 +25,10 @@ include('workspace://Python4Capella/utilities/CapellaPlatform.py')
 if False:
     from utilities.CapellaPlatform import *
 
-# include needed to read/write xlsx files
-from openpyxl import *
+# include needed to write xlsx files
+include('workspace://Python4Capella/utilities/XlsxExport.py')
+if False:
+    from utilities.XlsxExport import *
 
 # change this path to execute the script on your model (here is the IFE sample). 
 # comment it if you want to use the "Run configuration" instead
@@ -60,21 +62,13 @@ xlsx_file_name = CapellaPlatform.getAbsolutePath(folder) + "/" + se.get_name() +
 
 print("writing " + xlsx_file_name)
 
-# create a workbook
-wb = Workbook()
-
-# grab the active worksheet
-ws = wb.active
-
+# list the name of physical components in a sheet without header
+pcs = se.get_physical_architecture().get_physical_component_pkg().get_owned_physical_components()
+export = XlsxExport()
+export.add_sheet('Sheet', [XlsxColumn('Name')], project_elements(pcs, ["name"]), header = False)
 
-# list the name of physical components
-for index, pc in enumerate(se.get_physical_architecture().get_physical_component_pkg().get_owned_physical_components(), start=1):
-    #: :type pc: PhysicalComponent
-    # append the names in the worksheet
-    ws["A" + str(index)] = pc.get_name()
-    
 # Save the xlsx file
-wb.save(xlsx_file_name)
+export.save(xlsx_file_name)
 
 # refresh 
 CapellaPlatform.refresh(folder)
@@ -131,6 +131,13 @@ class SismicParser(AbstractParser):
 
         return states
 
+    def _get_targets(self, transitions):
+        # in Capella the targets of all the transitions are queried at once, the mocks of the tests only have get_target()
+        query_many = globals().get('capella_query_by_name_many')
+        if query_many is None:
+            return dict((transition, transition.get_target()) for transition in transitions)
+        return query_many(transitions, 'Target')
+
     def _region_to_sismic(self, regions):
         parallel_states = {}
         for region in regions:
@@ -138,6 +145,7 @@ class SismicParser(AbstractParser):
             states = {}
             parallels = []
             states_transitions = []
+            targets_by_transition = self._get_targets([transition for state in region['states'] for transition in state['outgoing']])
 
             # Fazer uma busca recursiva começando do primeiro region['states']
             # e ir pegando os próximos estados a partir do outgoing
@@ -149,7 +157,7 @@ class SismicParser(AbstractParser):
                 transitions = {}
                 has_parallel = len(state['outgoing']) > 1
                 for transition in state['outgoing']:
-                    targets = transition.get_target()
+                    targets = targets_by_transition[transition]
 
                     # triggers = [trigger.get_name()
                     #             for trigger in transition.get_triggers()]
@@ -16,18 +16,75 @@ class CapellaModel():
     """
     A Capella model. Used to defined the content of a model, and how to read a model
     """
+    # the number of transactions started and not ended yet on each Sirius session, by all the CapellaModels
+    transaction_depths = {}
     def start_transaction(self):
         """
         """
+        # the caches are only suspended once the transaction is started: nothing is left to end if Sirius refuses it
         Sirius.start_transaction(self.session)
+        CapellaModel.transaction_depths[self.session] = CapellaModel.transaction_depths.get(self.session, 0) + 1
+        query_cache.start_transaction()
+        inverse_reference_index.start_transaction()
+        property_value_index.start_transaction()
+        requirement_attribute_index.start_transaction()
+        container_chain_cache.start_transaction()
+        element_index.start_transaction()
     def commit_transaction(self):
         """
         """
-        Sirius.commit_transaction(self.session)
+        try:
+            Sirius.commit_transaction(self.session)
+        finally:
+            self.count_ended_transaction()
+            query_cache.end_transaction()
+            inverse_reference_index.end_transaction()
+            property_value_index.end_transaction()
+            requirement_attribute_index.end_transaction()
+            container_chain_cache.end_transaction()
+            element_index.end_transaction()
     def rollback_transaction(self):
         """
         """
-        Sirius.rollback_transaction(self.session)
+        try:
+            Sirius.rollback_transaction(self.session)
+        finally:
+            self.count_ended_transaction()
+            query_cache.end_transaction()
+            inverse_reference_index.end_transaction(False)
+            property_value_index.end_transaction()
+            requirement_attribute_index.end_transaction()
+            container_chain_cache.end_transaction()
+            element_index.end_transaction(False)
+    def count_ended_transaction(self):
+        """
+        Counts the end of a transaction of the session of this model, see is_in_transaction()
+        """
+        depth = CapellaModel.transaction_depths.get(self.session, 0) - 1
+        if depth > 0:
+            CapellaModel.transaction_depths[self.session] = depth
+        else:
+            CapellaModel.transaction_depths.pop(self.session, None)
+    def is_in_transaction(self):
+        """
+        Tells if a transaction started on the session of this model (by this CapellaModel or another one) is not committed or rolled back yet
+        """
+        return CapellaModel.transaction_depths.get(self.session, 0) > 0
+    def get_element_by_id(self, element_id):
+        """
+        Gets the element with the given id, None if there is no such element
+        """
+        return self.get_elements_by_ids([element_id])[0]
+    def get_elements_by_ids(self, element_ids):
+        """
+        Gets the elements with the given ids, in the same order (None for ids without element)
+        """
+        return wrap_java_objects([element_index.get_by_id(self.session, element_id) for element_id in element_ids])
+    def get_element_by_sid(self, element_sid):
+        """
+        Gets the element with the given sid, None if there is no such element
+        """
+        return wrap_java_objects([element_index.get_by_sid(self.session, element_sid)])[0]
     def get_system_engineering(self):
         """
         """
@@ -69,12 +126,12 @@ class CapellaModel():
         status: KO
         """
         # obj can be a path to the .aird file or an EObject
-        if isinstance(obj, str) or isinstance(obj, unicode):
+        if isinstance(obj, str) or (sys.version_info[0] < 3 and isinstance(obj, unicode)):
             if CapellaPlatform.getWorkspaceFile(obj) is None:
                 raise AttributeError("the .aird file doesn't exist: " + obj)
             self.session = Sirius.load_session(obj)
         elif isinstance(obj, EObject):
-            self.session = Sirius.get_session(obj)
+            self.session = Sirius.get_session(obj.get_java_object())
         else:
             raise AttributeError("You can pass a path to the .aird file or an EObject.")
     def create(self, path):
@@ -102,63 +159,298 @@ class CapellaLibrary(CapellaModel):
         else:
             JavaObject.__init__(self, java_object)
 
+class EClassResolver():
+    """
+    Resolves the simplified API class used to wrap a Java EObject.
+    The class is computed once per EClass name, only a few EClasses need a per instance discriminator (actor, system, nature, kind)
+    """
+    # EClasses wrapped by a simplified API class with a different name
+    ALIASES = {
+        "InteractionOperand": "Operand",
+        "Service": "Operation",
+        "BooleanPropertyValue": "PropertyValue",
+        "EnumerationPropertyValue": "PropertyValue",
+        "FloatPropertyValue": "PropertyValue",
+        "IntegerPropertyValue": "PropertyValue",
+        "StringPropertyValue": "PropertyValue",
+        "ChoicePseudoState": "Pseudostate",
+        "DeepHistoryPseudoState": "Pseudostate",
+        "EntryPointPseudoState": "Pseudostate",
+        "ExitPointPseudoState": "Pseudostate",
+        "ForkPseudoState": "Pseudostate",
+        "InitialPseudoState": "Pseudostate",
+        "JoinPseudoState": "Pseudostate",
+        "ShallowHistoryPseudoState": "Pseudostate",
+        "TerminatePseudoState": "Pseudostate",
+        "FinalState": "Pseudostate",
+    }
+    # EClasses wrapped by a class chosen per instance, with all the classes they can be wrapped by
+    DISCRIMINATED = {
+        "LogicalComponent": ["LogicalComponent", "LogicalActor", "LogicalSystem"],
+        "PhysicalComponent": ["PhysicalComponent", "PhysicalActor", "PhysicalSystem", "BehaviorPC", "NodePC"],
+        "Entity": ["OperationalActor", "OperationalEntity"],
+        "CatalogElement": ["REC", "RPL"],
+        "SystemComponent": ["SystemActor", "System"],
+    }
+    # the EClass of each class chosen per instance
+    DISCRIMINATED_E_CLASSES = dict((class_name, e_class_name) for e_class_name, candidates in DISCRIMINATED.items() for class_name in candidates)
+    # EClasses which can only be contained in a given architecture layer
+    LAYER_CONTENTS = {
+        "OperationalAnalysis": ["OperationalActivityPkg", "OperationalActivity", "OperationalProcess", "OperationalCapabilityPkg", "OperationalCapability", "EntityPkg", "Entity", "CommunicationMean"],
+        "SystemAnalysis": ["SystemFunctionPkg", "SystemFunction", "CapabilityPkg", "Capability", "MissionPkg", "Mission", "SystemComponentPkg", "SystemComponent"],
+        "LogicalArchitecture": ["LogicalFunctionPkg", "LogicalFunction", "LogicalComponentPkg", "LogicalComponent"],
+        "PhysicalArchitecture": ["PhysicalFunctionPkg", "PhysicalFunction", "PhysicalComponentPkg", "PhysicalComponent"],
+        "EPBSArchitecture": ["ConfigurationItemPkg", "ConfigurationItem"],
+    }
+    def __init__(self):
+        self.cache = {}
+        self.e_class_names_cache = {}
+        # number of globals of __main__ when e_class_names_cache was filled, an include defining new classes changes it
+        self.main_size = 0
+        self.hits = 0
+        self.misses = 0
+        # lookups of EClasses discriminated per instance, never cached
+        self.discriminated = 0
+        self.discriminators = {
+            "LogicalComponent": EClassResolver.discriminate_logical_component,
+            "PhysicalComponent": EClassResolver.discriminate_physical_component,
+            "Entity": EClassResolver.discriminate_entity,
+            "CatalogElement": EClassResolver.discriminate_catalog_element,
+            "SystemComponent": EClassResolver.discriminate_system_component,
+        }
+    def resolve(self, e_object):
+        """
+        Gets the simplified API class for the given Java EObject, None if there is no matching class
+        """
+        return self.resolve_by_name(e_object, e_object.eClass().getName())
+    def resolve_by_name(self, e_object, e_class_name):
+        """
+        Gets the simplified API class for the given Java EObject when its EClass name is already known
+        """
+        discriminator = self.discriminators.get(e_class_name)
+        if discriminator is not None:
+            self.discriminated += 1
+            return discriminator(e_object)
+        try:
+            res = self.cache[e_class_name]
+            self.hits += 1
+        except KeyError:
+            self.misses += 1
+            res = self.compute(e_class_name)
+            if res is not None:
+                # a missing class is not cached: it may be defined by a later include
+                self.cache[e_class_name] = res
+        return res
+    def compute(self, e_class_name):
+        """
+        Computes the class to use for the given EClass name
+        """
+        main = sys.modules["__main__"]
+        res = getattr(main, e_class_name, None)
+        if res is None and e_class_name in EClassResolver.ALIASES:
+            res = getattr(main, EClassResolver.ALIASES[e_class_name], None)
+        return res
+    def get_e_class_names(self, cls):
+        """
+        Gets the names of the EClasses whose instances can be wrapped by the given class or one of its subclasses
+        """
+        main_size = len(sys.modules["__main__"].__dict__)
+        if main_size != self.main_size:
+            # the subclasses may have changed
+            self.e_class_names_cache.clear()
+            self.main_size = main_size
+        try:
+            return self.e_class_names_cache[cls]
+        except KeyError:
+            pass
+        class_names = set()
+        classes = [cls]
+        while len(classes) > 0:
+            current = classes.pop()
+            if current.__name__ not in class_names:
+                class_names.add(current.__name__)
+                classes.extend(current.__subclasses__())
+        res = set(class_names)
+        for e_class_name, class_name in EClassResolver.ALIASES.items():
+            if class_name in class_names:
+                res.add(e_class_name)
+        for e_class_name, candidates in EClassResolver.DISCRIMINATED.items():
+            for class_name in candidates:
+                if class_name in class_names:
+                    res.add(e_class_name)
+        self.e_class_names_cache[cls] = res
+        return res
+    def get_pruned_e_class_names(self, e_class_names):
+        """
+        Gets the names of the architecture layer EClasses which can't contain any instance of the given EClass names
+        """
+        layers = set()
+        for e_class_name in e_class_names:
+            e_class_name = EClassResolver.DISCRIMINATED_E_CLASSES.get(e_class_name, e_class_name)
+            layer = None
+            for layer_name, contents in EClassResolver.LAYER_CONTENTS.items():
+                if e_class_name in contents:
+                    layer = layer_name
+                    break
+            if layer is None:
+                # can be contained anywhere
+                return set()
+            layers.add(layer)
+        return set(EClassResolver.LAYER_CONTENTS.keys()) - layers
+    def cache_info(self):
+        """
+        Gets the hits, misses, discriminated lookups and number of cached EClasses
+        """
+        return {"hits": self.hits, "misses": self.misses, "discriminated": self.discriminated, "size": len(self.cache)}
+    def cache_clear(self):
+        """
+        Clears the cache and its counters
+        """
+        self.cache.clear()
+        self.e_class_names_cache.clear()
+        self.hits = 0
+        self.misses = 0
+        self.discriminated = 0
+    @staticmethod
+    def discriminate_logical_component(e_object):
+        if e_object.isActor():
+            return LogicalActor
+        elif is_system(e_object):
+            return LogicalSystem
+        return LogicalComponent
+    @staticmethod
+    def discriminate_physical_component(e_object):
+        if e_object.isActor():
+            return PhysicalActor
+        elif is_system(e_object):
+            return PhysicalSystem
+        nature = e_object.getNature().getName()
+        if nature == "UNSET":
+            return PhysicalComponent
+        elif nature == "BEHAVIOR":
+            return BehaviorPC
+        elif nature == "NODE":
+            return NodePC
+        else:
+            raise AttributeError("Passed physical component has unexpected nature.")
+    @staticmethod
+    def discriminate_entity(e_object):
+        if e_object.isActor():
+            return OperationalActor
+        return OperationalEntity
+    @staticmethod
+    def discriminate_catalog_element(e_object):
+        kind = e_object.getKind().getName()
+        if kind == "REC":
+            return REC
+        elif kind == "RPL":
+            return RPL
+        else:
+            raise AttributeError("Passed catalog element has unexpected kind.")
+    @staticmethod
+    def discriminate_system_component(e_object):
+        if e_object.isActor():
+            return SystemActor
+        elif is_system(e_object):
+            return System
+        return None
+
+e_class_resolver = EClassResolver()
+
+class Projection():
+    """
+    Reads the same attributes for many elements, the accessors are resolved once per class instead of once per element.
+    Each value is still read with its own Java call. An attribute is either a name read with the matching get_ method (None if the class has no such method),
+    or a (name, function) pair where the function is called with the element
+    """
+    def __init__(self, attributes):
+        self.names = []
+        self.functions = []
+        for attribute in attributes:
+            if isinstance(attribute, tuple):
+                self.names.append(attribute[0])
+                self.functions.append(attribute[1])
+            else:
+                self.names.append(attribute)
+                self.functions.append(None)
+        self.accessors = {}
+    def get_accessors(self, cls):
+        """
+        Gets the accessor of each attribute for the given class
+        """
+        try:
+            return self.accessors[cls]
+        except KeyError:
+            accessors = []
+            for name, function in zip(self.names, self.functions):
+                if function is None:
+                    function = getattr(cls, "get_" + name, None)
+                accessors.append(function)
+            accessors = tuple(accessors)
+            self.accessors[cls] = accessors
+            return accessors
+    def iter_rows(self, elements):
+        """
+        Lazily yields a tuple of attribute values for each element
+        """
+        for element in elements:
+            if element is None:
+                yield (None,) * len(self.names)
+            else:
+                yield tuple([None if accessor is None else accessor(element) for accessor in self.get_accessors(element.__class__)])
+    def rows(self, elements):
+        """
+        Gets a list of tuples of attribute values, one per element
+        """
+        return list(self.iter_rows(elements))
+    def columns(self, elements):
+        """
+        Gets a dict mapping each attribute name to the list of its values
+        """
+        values = [[] for name in self.names]
+        for row in self.iter_rows(elements):
+            for column, value in zip(values, row):
+                column.append(value)
+        return dict(zip(self.names, values))
+
+def project_elements(elements, attributes, columns = False):
+    """
+    Reads the given attributes for all the given elements, see Projection.
+    Returns a list of rows, or a dict of columns if columns is True
+    """
+    projection = Projection(attributes)
+    if columns:
+        return projection.columns(elements)
+    return projection.rows(elements)
+
 class EObject(JavaObject):
     """
     A generic object. Defines generic relations which are available for all elements
     """
+    __slots__ = ()
     @staticmethod
     def get_class(e_object):
         """
         """
-        try:
-            res = getattr(sys.modules["__main__"], e_object.eClass().getName())
-        except AttributeError:
-            res = None
-        if res == LogicalComponent:
-            if e_object.isActor():
-                res = LogicalActor
-            elif is_system(e_object):
-                res = LogicalSystem
-        if res == PhysicalComponent:
-            if e_object.isActor():
-                res = PhysicalActor
-            elif is_system(e_object):
-                res = PhysicalSystem
-            else:
-                if e_object.getNature().getName() == "UNSET":
-                    res = PhysicalComponent
-                elif e_object.getNature().getName() == "BEHAVIOR":
-                    res = BehaviorPC
-                elif e_object.getNature().getName() == "NODE":
-                    res = NodePC
-                else:
-                    raise AttributeError("Passed physical component has unexpected nature.")
-        if res == None and e_object.eClass().getName() == "Entity":
-            if e_object.isActor():
-                res = OperationalActor
-            else:
-                res = OperationalEntity
-        if res == None and e_object.eClass().getName() == "CatalogElement":
-            if e_object.getKind().getName() == "REC":
-                res = REC
-            elif e_object.getKind().getName() == "RPL":
-                res = RPL
-            else:
-                raise AttributeError("Passed catalog element has unexpected kind.")
-        if res == None and e_object.eClass().getName() == "InteractionOperand":
-            res = Operand
-        if res == None and e_object.eClass().getName() == "Service":
-            res = Operation
-        if res == None and e_object.eClass().getName() == "SystemComponent":
-            if e_object.isActor():
-                res = SystemActor
-            elif is_system(e_object):
-                res = System
-        if res == None and e_object.eClass().getName() in ["BooleanPropertyValue", "EnumerationPropertyValue", "FloatPropertyValue", "IntegerPropertyValue", "StringPropertyValue"]:
-            res = PropertyValue
-        if res == None and e_object.eClass().getName() in ["ChoicePseudoState", "DeepHistoryPseudoState", "EntryPointPseudoState", "ExitPointPseudoState", "ForkPseudoState", "InitialPseudoState", "JoinPseudoState", "ShallowHistoryPseudoState", "TerminatePseudoState", "FinalState"]:
-            res = Pseudostate
-        return res
+        return e_class_resolver.resolve(e_object)
+    @staticmethod
+    def get_class_cache_info():
+        """
+        Gets the statistics of the EClass to class resolution cache
+        """
+        return e_class_resolver.cache_info()
+    def get_architecture(self):
+        """
+        Gets the OperationalAnalysis, SystemAnalysis, LogicalArchitecture, PhysicalArchitecture or EPBSArchitecture containing this element
+        (or being this element), None if there is no such architecture
+        """
+        value = container_chain_cache.get_architecture(self.get_java_object())
+        if value is None:
+            return value
+        else:
+            e_object_class = getattr(sys.modules["__main__"], "EObject")
+            specific_cls = e_object_class.get_class(value)
+            return specific_cls(value)
     def get_owned_diagrams(self):
         """
         """
@@ -223,21 +515,49 @@ class EObject(JavaObject):
     def get_all_contents(self):
         """
         """
-        res = []
-        for value in e_all_contents(self.get_java_object()):
-            e_object_class = getattr(sys.modules["__main__"], "EObject")
-            specific_cls = e_object_class.get_class(value)
-            if specific_cls is not None:
-                res.append(specific_cls(value))
-        return res
+        return list(self.iter_all_contents())
     def get_all_contents_by_type(self, cls):
         """
         """
-        res = []
-        for value in self.get_all_contents():
-            if isinstance(value, cls):
-                res.append(value)
-        return res
+        return list(self.iter_all_contents_by_type(cls))
+    def iter_all_contents(self, prune = None):
+        """
+        Lazily yields the elements contained directly and indirectly in this element, as the EMF tree iterator advances.
+        If a prune function is given, the content of each yielded element for which it returns True is skipped
+        """
+        tree_iterator = self.get_java_object().eAllContents()
+        e_object_class = getattr(sys.modules["__main__"], "EObject")
+        while iteratorHasNext(tree_iterator):
+            value = iteratorNext(tree_iterator)
+            specific_cls = e_object_class.get_class(value)
+            if specific_cls is not None:
+                element = specific_cls(value)
+                if prune is not None and prune(element):
+                    tree_iterator.prune()
+                yield element
+    def iter_all_contents_by_type(self, cls, prune = None):
+        """
+        Lazily yields the elements of the given type contained directly and indirectly in this element.
+        Elements are filtered by EClass name before being wrapped, and architecture layers which can't contain
+        the given type are not visited. If a prune function is given, it is called with every wrapped element instead
+        """
+        if prune is not None:
+            for value in self.iter_all_contents(prune):
+                if isinstance(value, cls):
+                    yield value
+            return
+        e_class_names = e_class_resolver.get_e_class_names(cls)
+        pruned_e_class_names = e_class_resolver.get_pruned_e_class_names(e_class_names)
+        tree_iterator = self.get_java_object().eAllContents()
+        while iteratorHasNext(tree_iterator):
+            value = iteratorNext(tree_iterator)
+            e_class_name = value.eClass().getName()
+            if e_class_name in e_class_names:
+                specific_cls = e_class_resolver.resolve_by_name(value, e_class_name)
+                if specific_cls is not None and issubclass(specific_cls, cls):
+                    yield specific_cls(value)
+            elif e_class_name in pruned_e_class_names:
+                tree_iterator.prune()
     def get_available_s_b_queries(self):
         """
         """
@@ -251,6 +571,7 @@ class CapellaElement(EObject):
     """
     A generic Capella model Element. Used to define generic attributes and relations inherited by most Capella elements
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/core/" + capella_version(), "CapellaElement"))
@@ -266,6 +587,7 @@ class CapellaElement(EObject):
         """
         """
         self.get_java_object().setId(value)
+        element_index.add(self.get_java_object(), False)
     def get_sid(self):
         """
         """
@@ -274,6 +596,7 @@ class CapellaElement(EObject):
         """
         """
         self.get_java_object().setSid(value)
+        element_index.add(self.get_java_object(), False)
     def get_name(self):
         """
         """
@@ -363,6 +686,7 @@ class Constraint(CapellaElement):
     """
     A generic constraint which can be defined on Capella elements
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/core/" + capella_version(), "Constraint"))
@@ -387,6 +711,7 @@ class PropertyValue(CapellaElement):
     """
     A generic property with a name and value&nbsp;which can be added to Capella elements
     """
+    __slots__ = ()
     def __init__(self, java_object = None, kind = "StringPropertyValue"):
         """
         """
@@ -407,6 +732,14 @@ class PropertyValue(CapellaElement):
         """
         """
         return self.get_java_object().getValue()
+    def get_typed_value(self):
+        """
+        Gets the value as a bool, int, float, str or EnumerationPropertyLiteral depending on the kind of this property value
+        """
+        value = property_value_decoder.decode(self.get_java_object())
+        if value is not None and hasattr(value, "eClass"):
+            return EnumerationPropertyLiteral(value)
+        return value
     def set_value(self, value):
         """
         """
@@ -430,6 +763,7 @@ class PropertyValueGroup(CapellaElement):
     """
     A group which can contain several PropertyValue and be applied to CapellaElements
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/core/" + capella_version(), "PropertyValueGroup"))
@@ -446,6 +780,7 @@ class EnumerationPropertyType(CapellaElement):
     """
     The definition of an Enumeration to type a PropertyValue
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/core/" + capella_version(), "EnumerationPropertyType"))
@@ -462,6 +797,7 @@ class EnumerationPropertyLiteral(CapellaElement):
     """
     A value defined in an EnumerationPropertyType
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/core/" + capella_version(), "EnumerationPropertyLiteral"))
@@ -474,6 +810,7 @@ class PropertyValuePkgContainer(CapellaElement):
     """
     An abstract type to define all elements which can contain PropertyValuePkg
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             raise ValueError("No matching EClass for this type")
@@ -490,6 +827,7 @@ class Diagram(JavaObject):
     """
     A generic Capella diagram
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -599,6 +937,7 @@ class AbstractReElement(EObject):
     """
     An abstract type to define the generic attributes of REC / RPL and packages&nbsp;elements
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             raise ValueError("No matching EClass for this type")
@@ -614,6 +953,7 @@ class AbstractReElement(EObject):
         """
         """
         self.get_java_object().setId(value)
+        element_index.add(self.get_java_object(), False)
     def get_name(self):
         """
         """
@@ -627,6 +967,7 @@ class AbstractCatalogElement(AbstractReElement):
     """
     An abstract type to define the generic attributes and relations&nbsp;of REC / RPL elements
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             raise ValueError("No matching EClass for this type")
@@ -671,6 +1012,7 @@ class REC(AbstractCatalogElement):
     """
     A Record element is the definition of a set of elements to be replicated together
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -711,6 +1053,7 @@ class RPL(AbstractCatalogElement):
     """
     A replay element is the instantiation of a record element
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -777,6 +1120,7 @@ class CatalogElementPkg(AbstractReElement):
     """
     A package to structure the definition of REC / RPL elements
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/common/re/" + capella_version(), "CatalogElementPkg"))
@@ -801,6 +1145,7 @@ class RecCatalog(CatalogElementPkg):
     """
     The root package which contains the REC / RPL definitions
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/common/re/" + capella_version(), "RecCatalog"))
@@ -823,6 +1168,7 @@ class CompliancyDefinitionPkg(AbstractReElement):
     """
     A package to contain CompliancyDefinitions
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/common/re/" + capella_version(), "CompliancyDefinitionPkg"))
@@ -842,6 +1188,7 @@ class CompliancyDefinition(AbstractReElement):
     CONSTRAINT_REUSE
     INHERITANCY_REUSE
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/common/re/" + capella_version(), "CompliancyDefinition"))
@@ -863,6 +1210,7 @@ class OperationalAnalysis(PropertyValuePkgContainer):
     The element containing all definitions from the Operational Analysis.
     The Operational Analysis aims at defining what the users of the system need to accomplish
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/oa/" + capella_version(), "OperationalAnalysis"))
@@ -925,6 +1273,7 @@ class OperationalActivityPkg(PropertyValuePkgContainer):
     """
     A package to contain OperationalActivity
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/oa/" + capella_version(), "OperationalActivityPkg"))
@@ -945,6 +1294,7 @@ class OperationalProcess(CapellaElement):
     """
     An operational process is used to describe a particular context for performing operational activities to contribute to one or more operational capabilities
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/oa/" + capella_version(), "OperationalProcess"))
@@ -1021,6 +1371,7 @@ class OperationalCapabilityPkg(PropertyValuePkgContainer):
     """
     A package to contain OperationalCapabilities
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/oa/" + capella_version(), "OperationalCapabilityPkg"))
@@ -1041,6 +1392,7 @@ class EntityPkg(PropertyValuePkgContainer):
     """
     A package to define Operational entities / actors
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/oa/" + capella_version(), "EntityPkg"))
@@ -1061,6 +1413,7 @@ class OperationalActor(CapellaElement):
     """
     An Operational Actor is a kind of Operational Entity, usually human. It cannot be broken down
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -1103,6 +1456,7 @@ class CommunicationMean(CapellaElement):
     """
     Describes the media between the Operational Entities / Actors&nbsp;to support the Operational Interactions
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/oa/" + capella_version(), "CommunicationMean"))
@@ -1156,6 +1510,7 @@ class SystemAnalysis(PropertyValuePkgContainer):
     The element containing all definitions from the System Analysis.
     The System Analysis aims at defining what the system has to accomplish for the users
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/ctx/" + capella_version(), "SystemAnalysis"))
@@ -1238,6 +1593,7 @@ class SystemFunctionPkg(PropertyValuePkgContainer):
     """
     A package to contain SystemFunctions
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/ctx/" + capella_version(), "SystemFunctionPkg"))
@@ -1262,6 +1618,7 @@ class CapabilityPkg(PropertyValuePkgContainer):
     """
     A package to contain Capabilities
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/ctx/" + capella_version(), "CapabilityPkg"))
@@ -1282,6 +1639,7 @@ class SystemComponentPkg(PropertyValuePkgContainer):
     """
     A package to contain the System and the Actors
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/ctx/" + capella_version(), "SystemComponentPkg"))
@@ -1320,6 +1678,7 @@ class MissionPkg(PropertyValuePkgContainer):
     """
     A package to contain Missions
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/ctx/" + capella_version(), "MissionPkg"))
@@ -1340,6 +1699,7 @@ class Mission(CapellaElement):
     """
     High-level goal to which the System should contribute. To be fulfilled, a Mission should use a number of system Functions regrouped within one or more Capabilities
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/ctx/" + capella_version(), "Mission"))
@@ -1368,6 +1728,7 @@ class LogicalArchitecture(PropertyValuePkgContainer):
     The element containing all definitions from the Logical Architecture.
     The Logical Architecture (or conceptual solution)&nbsp;aims at defining how the system will work in order to fulfil expectations
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/la/" + capella_version(), "LogicalArchitecture"))
@@ -1440,6 +1801,7 @@ class LogicalFunctionPkg(PropertyValuePkgContainer):
     """
     A package to contain LogicalFunctions
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/la/" + capella_version(), "LogicalFunctionPkg"))
@@ -1464,6 +1826,7 @@ class CapabilityRealizationPkg(PropertyValuePkgContainer):
     """
     A package to contain CapabilityRealizations
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/la/" + capella_version(), "CapabilityRealizationPkg"))
@@ -1484,6 +1847,7 @@ class LogicalComponentPkg(PropertyValuePkgContainer):
     """
     A package to contain the LogicalSystem, LogicalComponents and LogicalActors
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/la/" + capella_version(), "LogicalComponentPkg"))
@@ -1533,6 +1897,7 @@ class PhysicalArchitecture(PropertyValuePkgContainer):
     The element containing all definitions from the Physical Architecture.
     The Physical Architecture (or finalized solution)&nbsp;aims at defining how the system will be developed and built
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/pa/" + capella_version(), "PhysicalArchitecture"))
@@ -1599,6 +1964,7 @@ class PhysicalFunctionPkg(PropertyValuePkgContainer):
     """
     A package to contain PhysicalFunctions
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/pa/" + capella_version(), "PhysicalFunctionPkg"))
@@ -1623,6 +1989,7 @@ class PhysicalComponentPkg(PropertyValuePkgContainer):
     """
     A package to contain the PhysicalSystem, PhysicalComponents and PhysicalActors
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/pa/" + capella_version(), "PhysicalComponentPkg"))
@@ -1662,6 +2029,7 @@ class AbstractPhysicalArtifact(CapellaElement):
     """
     An abstract type to defined the relation between elements of the Physical Architecture and ConfigurationItems
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/cs/" + capella_version(), "AbstractPhysicalArtifact"))
@@ -1678,6 +2046,7 @@ class PhysicalComponent(AbstractPhysicalArtifact):
     """
     A generic Physical Component which can be either a BehaviorPC or a NodePC
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -1735,6 +2104,7 @@ class EPBSArchitecture(PropertyValuePkgContainer):
     The element containing all definitions from the End-Product Breakdown Structure.
     The End-Product Breakdown Structure aims at defining the construction strategy of the product, taking into account industrial and subcontracting constraints
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/epbs/" + capella_version(), "EPBSArchitecture"))
@@ -1777,6 +2147,7 @@ class ConfigurationItemPkg(PropertyValuePkgContainer):
     """
     A package to contain ConfigurationItems
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/epbs/" + capella_version(), "ConfigurationItemPkg"))
@@ -1797,6 +2168,7 @@ class ConfigurationItem(CapellaElement):
     """
     System part to be acquired or produced, in as many copies as the physical architecture requires
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/epbs/" + capella_version(), "ConfigurationItem"))
@@ -1843,6 +2215,7 @@ class StateMachine(CapellaElement):
     """
     State Machine is a way to define some of&nbsp;the expected behavior of the System, a Component or an external Actor
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/common/" + capella_version(), "StateMachine"))
@@ -1859,6 +2232,7 @@ class AbstractState(CapellaElement):
     """
     An abstract type to define the generic relation of modes and states
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/common/" + capella_version(), "AbstractState"))
@@ -1887,6 +2261,7 @@ class State(AbstractState):
     """
     A State is a context undergone by the system, an actor or a component in specific circumstances (for example imposed by the environment)
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/common/" + capella_version(), "State"))
@@ -1931,6 +2306,7 @@ class Mode(State):
     """
     A Mode is a behavior expected from the system,&nbsp;an Actor or a component&nbsp;in chosen conditions
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/common/" + capella_version(), "Mode"))
@@ -1943,6 +2319,7 @@ class Pseudostate(AbstractState):
     """
     A pseudo states are transitive states (meaning they don't remain active). They are used to define entry / exit point of a state machine, and to connect multiple transitions into more complex transition paths
     """
+    __slots__ = ()
     def __init__(self, java_object = None, kind = "InitialPseudoState"):
         """
         """
@@ -1965,6 +2342,7 @@ class Region(CapellaElement):
     A region is an orthogonal part of either a composite state or a state machine.
     Inside of a region, only one more or state can be active at a time
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/common/" + capella_version(), "Region"))
@@ -1981,6 +2359,7 @@ class StateTransition(CapellaElement):
     """
     A possible transition between 2 modes or 2 states
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/common/" + capella_version(), "StateTransition"))
@@ -2039,6 +2418,7 @@ class AbstractAction(JavaObject):
     """
     A generic action which can be triggered by a Mode / State or a StateTransition
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/common/activity/" + capella_version(), "AbstractAction"))
@@ -2051,6 +2431,7 @@ class AbstractEvent(CapellaElement):
     """
     An generic event which can trigger a transition
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/common/behavior/" + capella_version(), "AbstractEvent"))
@@ -2063,6 +2444,7 @@ class Scenario(CapellaElement):
     """
     A scenario of use of the system defined by a specific sequence
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/interaction/" + capella_version(), "Scenario"))
@@ -2145,6 +2527,7 @@ class InstanceRole(CapellaElement):
     """
     The involvement of an element (function, system, component or actor)&nbsp;in a scenario
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/interaction/" + capella_version(), "InstanceRole"))
@@ -2161,6 +2544,7 @@ class AbstractInstance(JavaObject):
     """
     A generic element which can be involved in a scenario as an InstanceRole
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/" + capella_version(), "AbstractInstance"))
@@ -2173,6 +2557,7 @@ class SequenceMessage(CapellaElement):
     """
     An exchange between InstanceRole performed in the frame of a scenario
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/interaction/" + capella_version(), "SequenceMessage"))
@@ -2243,6 +2628,7 @@ class AbstractExchange(JavaObject):
     """
     A generic exchange which can be used in a scenario as a sequence message
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             raise ValueError("No matching EClass for this type")
@@ -2259,6 +2645,7 @@ class StateFragment(CapellaElement):
     """
     The call of a function or mode / state&nbsp;by an InstanceRole in the context of a scenario
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/interaction/" + capella_version(), "StateFragment"))
@@ -2295,6 +2682,7 @@ class CombinedFragment(CapellaElement):
     """
     The identification of a specific operator (ALT, OPT, LOOP...)&nbsp;in the sequence of a scenario
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/interaction/" + capella_version(), "CombinedFragment"))
@@ -2326,6 +2714,7 @@ class Operand(CapellaElement):
     A specific "region" in a Combined Fragment
     For example, an ALTERNATIVE contains one operand for each of the alternative conditions
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -2362,6 +2751,7 @@ class ConstraintDuration(CapellaElement):
     """
     A constraint about the execution time of a scenario defined between 2 points
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/interaction/" + capella_version(), "ConstraintDuration"))
@@ -2382,6 +2772,7 @@ class Node(AbstractInstance):
     """
     An abstract type defining the generic relation of a Node (implementation ressource)&nbsp;element
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             raise ValueError("No matching EClass for this type")
@@ -2414,6 +2805,7 @@ class PhysicalPort(AbstractPhysicalArtifact):
     """
     A port on a Node component defining a physical interaction point
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/cs/" + capella_version(), "PhysicalPort"))
@@ -2442,6 +2834,7 @@ class PhysicalLink(AbstractPhysicalArtifact):
     """
     Means of communication, transport or routing between two Node components, used as a support for behavioral exchanges
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/cs/" + capella_version(), "PhysicalLink"))
@@ -2482,6 +2875,7 @@ class PhysicalLinkCategory(CapellaElement):
     """
     A regroupement of PhysicalLinks for graphical simplification of diagrams
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/cs/" + capella_version(), "PhysicalLinkCategory"))
@@ -2498,6 +2892,7 @@ class PhysicalPath(CapellaElement):
     """
     Set of Physical Links defining a continuous path likely to route one or more behavioral exchanges
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/cs/" + capella_version(), "PhysicalPath"))
@@ -2530,6 +2925,7 @@ class InterfacePkg(PropertyValuePkgContainer):
     """
     A package to contain Interfaces
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/cs/" + capella_version(), "InterfacePkg"))
@@ -2554,6 +2950,7 @@ class Interface(CapellaElement):
     """
     The definition of ExchangeItems which can be send / received by a ComponentPort
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/cs/" + capella_version(), "Interface"))
@@ -2613,6 +3010,7 @@ class ExchangeItemAllocation(CapellaElement):
     The involvement of an ExchangeItem by an Interface.
     Mainly used for the involvement of ExchangeItems in Interface Scenarios based on the definition of Interfaces between components
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/cs/" + capella_version(), "ExchangeItemAllocation"))
@@ -2671,6 +3069,7 @@ class ExchangeItem(AbstractAction, AbstractEvent, AbstractInstance):
     """
     Ordered set of references to elements carried together during an interaction or exchange between functions, components and actors. The elements are carried simultaneously, in the same conditions, with the same non-functional properties. The “elements” are called data
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/" + capella_version(), "ExchangeItem"))
@@ -2741,6 +3140,7 @@ class ExchangeItemElement(CapellaElement):
     """
     A part of the information contained by an ExchangeItem
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/" + capella_version(), "ExchangeItemElement"))
@@ -2758,6 +3158,7 @@ class FunctionPort(CapellaElement):
     An generic FunctionPort to define the allocation with ComponentPorts
     A Function Port specify what a Function is capable of producing or is requiring
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/fa/" + capella_version(), "FunctionPort"))
@@ -2784,6 +3185,7 @@ class FunctionInputPort(FunctionPort):
     """
     An FunctionInputPort defines what a Function is requiring
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/fa/" + capella_version(), "FunctionInputPort"))
@@ -2812,6 +3214,7 @@ class FunctionOutputPort(FunctionPort):
     """
     A FunctionOutputPort defines what a Function is capable of producing
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/fa/" + capella_version(), "FunctionOutputPort"))
@@ -2840,6 +3243,7 @@ class FunctionalExchange(AbstractEvent, AbstractExchange):
     """
     A functional exchange represents a dependency between a source function and a target one. Exchanges connect Function Ports, which specify what a Function is capable of producing or is requiring.
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/fa/" + capella_version(), "FunctionalExchange"))
@@ -2940,6 +3344,7 @@ class ExchangeCategory(CapellaElement):
     """
     A regroupement of FunctionalExchanges for graphical simplification of diagrams
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/fa/" + capella_version(), "ExchangeCategory"))
@@ -2956,6 +3361,7 @@ class FunctionalChain(CapellaElement):
     """
     Describe the system behaviour in a particular usage context with references towards Functions and Functional Exchanges
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/fa/" + capella_version(), "FunctionalChain"))
@@ -3036,6 +3442,7 @@ class BehavioralComponent(CapellaElement, AbstractInstance):
     """
     An abstract type to define the generic relation of behavioral elements
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             raise ValueError("No matching EClass for this type")
@@ -3084,6 +3491,7 @@ class ComponentPort(CapellaElement):
     """
     A port on a BehavioralComponent defining a logical interaction point
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/fa/" + capella_version(), "ComponentPort"))
@@ -3132,6 +3540,7 @@ class ComponentExchange(CapellaElement, AbstractExchange):
     """
     Represent the interactions between Logical / Behavioral&nbsp;Components. Exchanges connects Component Ports.
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/fa/" + capella_version(), "ComponentExchange"))
@@ -3198,6 +3607,7 @@ class ComponentExchangeCategory(CapellaElement):
     """
     A regroupement of ComponentExchanges for graphical simplification of diagrams
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/fa/" + capella_version(), "ComponentExchangeCategory"))
@@ -3214,6 +3624,7 @@ class AbstractCapability(PropertyValuePkgContainer):
     """
     An abstract type to define the generic relations of all capabilities (operational and system)
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/interaction/" + capella_version(), "AbstractCapability"))
@@ -3286,6 +3697,7 @@ class AbstractSystemCapability(AbstractCapability):
     """
     An abstract type to define the generic relation of system capabilities (as defined in SA, LA and PA)
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             raise ValueError("No matching EClass for this type")
@@ -3309,6 +3721,7 @@ class AbstractSystemCapability(AbstractCapability):
 class DataValue(JavaObject):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/datavalue/" + capella_version(), "DataValue"))
@@ -3320,6 +3733,7 @@ class DataValue(JavaObject):
 class LiteralBooleanValue(DataValue):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/datavalue/" + capella_version(), "LiteralBooleanValue"))
@@ -3331,6 +3745,7 @@ class LiteralBooleanValue(DataValue):
 class BooleanReference(DataValue):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/datavalue/" + capella_version(), "BooleanReference"))
@@ -3342,6 +3757,7 @@ class BooleanReference(DataValue):
 class EnumerationReference(DataValue):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/datavalue/" + capella_version(), "EnumerationReference"))
@@ -3353,6 +3769,7 @@ class EnumerationReference(DataValue):
 class LiteralStringValue(DataValue):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/datavalue/" + capella_version(), "LiteralStringValue"))
@@ -3364,6 +3781,7 @@ class LiteralStringValue(DataValue):
 class StringReference(DataValue):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/datavalue/" + capella_version(), "StringReference"))
@@ -3375,6 +3793,7 @@ class StringReference(DataValue):
 class LiteralNumericValue(DataValue):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/datavalue/" + capella_version(), "LiteralNumericValue"))
@@ -3386,6 +3805,7 @@ class LiteralNumericValue(DataValue):
 class NumericReference(DataValue):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/datavalue/" + capella_version(), "NumericReference"))
@@ -3397,6 +3817,7 @@ class NumericReference(DataValue):
 class ComplexValue(DataValue):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/datavalue/" + capella_version(), "ComplexValue"))
@@ -3408,6 +3829,7 @@ class ComplexValue(DataValue):
 class ComplexValueReference(DataValue):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/datavalue/" + capella_version(), "ComplexValueReference"))
@@ -3419,6 +3841,7 @@ class ComplexValueReference(DataValue):
 class BinaryExpression(DataValue):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/datavalue/" + capella_version(), "BinaryExpression"))
@@ -3430,6 +3853,7 @@ class BinaryExpression(DataValue):
 class UnaryExpression(DataValue):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/datavalue/" + capella_version(), "UnaryExpression"))
@@ -3441,6 +3865,7 @@ class UnaryExpression(DataValue):
 class CollectionValueReference(DataValue):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/" + capella_version(), "CollectionValueReference"))
@@ -3452,6 +3877,7 @@ class CollectionValueReference(DataValue):
 class CollectionValue(DataValue):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/" + capella_version(), "CollectionValue"))
@@ -3463,6 +3889,7 @@ class CollectionValue(DataValue):
 class DataPkg(JavaObject):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/" + capella_version(), "DataPkg"))
@@ -3474,6 +3901,7 @@ class DataPkg(JavaObject):
 class DataType(JavaObject):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/datatype/" + capella_version(), "DataType"))
@@ -3485,6 +3913,7 @@ class DataType(JavaObject):
 class Class(DataType):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/" + capella_version(), "Class"))
@@ -3542,6 +3971,7 @@ class Class(DataType):
 class Collection(DataType):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/" + capella_version(), "Collection"))
@@ -3675,6 +4105,7 @@ class Collection(DataType):
 class Union(DataType):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/" + capella_version(), "Union"))
@@ -3744,6 +4175,7 @@ class Union(DataType):
 class Association(JavaObject):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/" + capella_version(), "Association"))
@@ -3755,6 +4187,7 @@ class Association(JavaObject):
 class Property(JavaObject):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/" + capella_version(), "Property"))
@@ -3770,6 +4203,7 @@ class Property(JavaObject):
 class UnionProperty(Property):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/" + capella_version(), "UnionProperty"))
@@ -3781,6 +4215,7 @@ class UnionProperty(Property):
 class Operation(JavaObject):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -3820,6 +4255,7 @@ class Operation(JavaObject):
 class Parameter(JavaObject):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/" + capella_version(), "Parameter"))
@@ -3831,6 +4267,7 @@ class Parameter(JavaObject):
 class Exception(JavaObject):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/communication/" + capella_version(), "Exception"))
@@ -3872,6 +4309,7 @@ class Exception(JavaObject):
 class PrimitiveDataType(PropertyValuePkgContainer, DataType):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             raise ValueError("No matching EClass for this type")
@@ -3937,6 +4375,7 @@ class PrimitiveDataType(PropertyValuePkgContainer, DataType):
 class Enumeration(PrimitiveDataType):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/datatype/" + capella_version(), "Enumeration"))
@@ -4046,6 +4485,7 @@ class Enumeration(PrimitiveDataType):
 class EnumerationLiteral(DataValue):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/datavalue/" + capella_version(), "EnumerationLiteral"))
@@ -4057,6 +4497,7 @@ class EnumerationLiteral(DataValue):
 class BooleanType(PrimitiveDataType):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/datatype/" + capella_version(), "BooleanType"))
@@ -4086,6 +4527,7 @@ class BooleanType(PrimitiveDataType):
 class StringType(PrimitiveDataType):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/datatype/" + capella_version(), "StringType"))
@@ -4161,6 +4603,7 @@ class StringType(PrimitiveDataType):
 class NumericType(PrimitiveDataType):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/datatype/" + capella_version(), "NumericType"))
@@ -4250,6 +4693,7 @@ class NumericType(PrimitiveDataType):
 class PhysicalQuantity(NumericType):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/datatype/" + capella_version(), "PhysicalQuantity"))
@@ -4275,6 +4719,7 @@ class PhysicalQuantity(NumericType):
 class Unit(CapellaElement):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/information/" + capella_version(), "Unit"))
@@ -4287,6 +4732,7 @@ class SystemEngineering(PropertyValuePkgContainer):
     """
     The main element in the definition of a Capella model. Contains the perspectives of the Arcadia methodology
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/modeller/" + capella_version(), "SystemEngineering"))
@@ -4332,6 +4778,7 @@ class PropertyValuePkg(PropertyValuePkgContainer):
     """
     A package to contain PropertyValues&nbsp;and/or&nbsp;PropertyValueGroups
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/core/" + capella_version(), "PropertyValuePkg"))
@@ -4344,6 +4791,7 @@ class Interaction(AbstractEvent):
     """
     Oriented dependency between Operational Activities
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -4412,6 +4860,7 @@ class OperationalCapability(AbstractCapability):
     """
     An operational capability is an ability, expected of one or more operational entities / actors. An operational capability is characterized by a set of operational processes and scenarios
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/oa/" + capella_version(), "OperationalCapability"))
@@ -4444,6 +4893,7 @@ class OperationalEntity(OperationalActor):
     """
     An Operational Entity is a real world entity (other system, device, group or organisation…) carrying Operational Activities to which the system is likely to contribute
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -4465,6 +4915,7 @@ class Capability(AbstractSystemCapability):
     """
     The ability of the system to supply a service contributing to fulfilling one or more Missions. A Capability represents a system usage context. It is characterized by a set of Functional Chains and Scenarios it references.
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/ctx/" + capella_version(), "Capability"))
@@ -4494,6 +4945,7 @@ class System(BehavioralComponent, Node):
     Set of elements functioning as a whole, responding to customer and user demand and needs
     The System defined in the SystemAnalysis is seen as a black box
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -4511,6 +4963,7 @@ class SystemActor(BehavioralComponent, Node):
     """
     Entity (human or not) that is external to the System (in term of responsibility), interacting with it, via its interfaces
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -4567,6 +5020,7 @@ class CapabilityRealization(AbstractSystemCapability):
     """
     The implementation of the system Capabilities in Logical Architecture and Physical Architecture
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/la/" + capella_version(), "CapabilityRealization"))
@@ -4607,6 +5061,7 @@ class LogicalSystem(BehavioralComponent, Node):
     """
     The definition of the system in Logical Architecture
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -4633,6 +5088,7 @@ class LogicalComponent(BehavioralComponent):
     Logical Components are the artefacts enabling a notional decomposition of the system as a "white box", independently from any technological solutions, but dealing with major system decomposition constraints
     Logical components are identified according to logical abstractions (i.e. functional grouping, logical interfaces)
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -4674,6 +5130,7 @@ class LogicalActor(BehavioralComponent, Node):
     """
     An external Actor defined in the Logical Architecture
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -4720,6 +5177,7 @@ class PhysicalSystem(CapellaElement, Node):
     """
     The definition of the system in Physical Architecture
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -4746,6 +5204,7 @@ class BehaviorPC(PhysicalComponent, BehavioralComponent):
     """
     System component in charge of implementing / realizing some of the functions devoted to the system
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -4789,6 +5248,7 @@ class NodePC(PhysicalComponent, Node):
     """
     Component hosting a number of behavioral components, providing them with the resource they require to function and to interact with their environment
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -4828,6 +5288,7 @@ class PhysicalActor(BehavioralComponent, Node):
     """
     An external Actor defined in the Physical Architecture
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -4870,6 +5331,7 @@ class ChangeEvent(AbstractEvent):
     """
     An event defined by WHEN something occurs
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/common/" + capella_version(), "ChangeEvent"))
@@ -4890,6 +5352,7 @@ class TimeEvent(AbstractEvent):
     """
     An event defined by AT a given time, or AFTER a certain time
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/common/" + capella_version(), "TimeEvent"))
@@ -4924,6 +5387,7 @@ class AbstractActivityFunction(AbstractAction, AbstractEvent, AbstractInstance):
     """
     An abstract type to define the link between mode / state and activity / function (available in states)
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             raise ValueError("No matching EClass for this type")
@@ -4940,6 +5404,7 @@ class Function(AbstractActivityFunction):
     """
     Action performed by the System, an Actor or a component, in order to realize a Capability
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             raise ValueError("No matching EClass for this type")
@@ -5020,6 +5485,7 @@ class OperationalActivity(AbstractActivityFunction):
     """
     Process step or action/operation/service performed by an Operational entity / actor&nbsp;and likely to influence the system definition or usage. Implementing operational activities generally produces elements of interactions expected by other activities
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/oa/" + capella_version(), "OperationalActivity"))
@@ -5068,6 +5534,7 @@ class SystemFunction(Function):
     """
     The definition of a Function in the System Analysis
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/ctx/" + capella_version(), "SystemFunction"))
@@ -5096,6 +5563,7 @@ class LogicalFunction(Function):
     """
     The definition of a Function in the Logical Architecture
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/la/" + capella_version(), "LogicalFunction"))
@@ -5124,6 +5592,7 @@ class PhysicalFunction(Function):
     """
     The definition of a Function in the Physical Architecture
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/pa/" + capella_version(), "PhysicalFunction"))
@@ -5145,6 +5614,7 @@ class PhysicalFunction(Function):
         return capella_query_by_name(self, "Realized Logical Functions")
 
 class Status(EObject):
+    __slots__ = ()
     def __init__(self, java_object = None):
         if java_object is None:
             JavaObject.__init__(self, create_e_object("http://www.polarsys.org/capella/core/core/" + capella_version(), "EnumerationPropertyLiteral"))
@@ -2,10 +2,32 @@ include('workspace://Python4Capella/simplified_api/capella.py')
 if False:
     from simplified_api.capella import *
 
+import numbers
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+try:
+    import numpy
+except ImportError:
+    # PVMT tables are made of lists without NumPy
+    numpy = None
+
+# the statistics of a column without values
+NO_STATISTICS = {"count": 0, "sum": None, "min": None, "max": None, "mean": None}
+
 
 class PVMT(JavaObject):
     """
     """
+    __slots__ = ()
+    # the conversion of a value to the kind of an existing property value, see set_p_v_values()
+    KIND_ENCODERS = {
+        "BooleanPropertyValue": lambda value: value.lower() == "true" if isinstance(value, str) else bool(value),
+        "IntegerPropertyValue": lambda value: PVMT.encode_integer(value),
+        "FloatPropertyValue": float,
+        "StringPropertyValue": str,
+    }
     def __init__(self, java_object = None):
         """
         """
@@ -26,19 +48,233 @@ class PVMT(JavaObject):
         """
         status: OK
         """
-        return PVName in PVMT.get_p_v_names(elem)
+        return PVName in property_value_index.get(elem.get_java_object())[0]
     @staticmethod
     def get_p_v_value(elem, PVName):
         """
         status: OK
         """
-        for group in elem.get_java_object().getOwnedPropertyValueGroups():
-            for pv in group.getOwnedPropertyValues():
-                if PVName == pv.getName():
-                    if pv.eClass().getName() == "BooleanPropertyValue":
-                        return str(pv.isValue())
-                    else:
-                        return str(pv.getValue())
+        values = property_value_index.get(elem.get_java_object())[0]
+        if PVName in values:
+            return str(values[PVName])
         return None
-
-
+    @staticmethod
+    def get_typed_p_v_value(elem, PVName):
+        """
+        Gets the value of the given property value without converting it to a string:
+        a bool, int, float, str or EnumerationPropertyLiteral depending on its kind, None if it is not defined
+        """
+        return PVMT.to_typed_value(property_value_index.get(elem.get_java_object())[0].get(PVName))
+    @staticmethod
+    def get_p_v_values(elem, PVGroupName = None):
+        """
+        Gets the typed values of the property values of the given element by name, or the ones of the given group, see get_typed_p_v_value().
+        A name used twice gets the first value
+        """
+        entry = property_value_index.get(elem.get_java_object())
+        values = entry[0] if PVGroupName is None else entry[1].get(PVGroupName, {})
+        return OrderedDict((name, PVMT.to_typed_value(value)) for name, value in values.items())
+    @staticmethod
+    def to_typed_value(value):
+        """
+        Wraps the EnumerationPropertyLiteral EObjects decoded by property_value_decoder, other values are returned as is
+        """
+        if value is not None and hasattr(value, "eClass"):
+            return EnumerationPropertyLiteral(value)
+        return value
+    @staticmethod
+    def get_p_v_attribute(PVName):
+        """
+        Gets a projection attribute reading the given property value, see Projection
+        """
+        return (PVName, lambda elem: PVMT.get_p_v_value(elem, PVName))
+    @staticmethod
+    def get_typed_p_v_attribute(PVName):
+        """
+        Gets a projection attribute reading the typed value of the given property value, see Projection
+        """
+        return (PVName, lambda elem: PVMT.get_typed_p_v_value(elem, PVName))
+    @staticmethod
+    def set_p_v_values(values, PVGroupName = "PVMT", model = None):
+        """
+        Sets the property values of many elements, values maps each element to a dict mapping property value names to their values.
+        An existing property value is updated with the value converted to its kind, a ValueError is raised if the value can't be converted
+        without loss (for instance a float with a fractional part for an IntegerPropertyValue, or a name matching no literal of the type of
+        an EnumerationPropertyValue). A missing one is created with the kind of its value
+        (see get_p_v_kind()) in the group of the element with the given name, the group is created if needed.
+        The values are set in one transaction of the given model (a model opened on the first element by default),
+        or in the transaction already started on its session if there is one.
+        Returns the number of created property values, of updated property values, of elements with written property values and of created groups
+        """
+        # the property values and groups of the elements are read from the index before the transaction suspends it
+        targets = []
+        for elem, elem_values in values.items():
+            entry = property_value_index.get(elem.get_java_object())
+            targets.append((elem.get_java_object(), entry[2], entry[3].get(PVGroupName), elem_values))
+        if len(targets) == 0:
+            return {"created": 0, "updated": 0, "elements": 0, "groups": 0}
+        if model is None:
+            model = CapellaModel()
+            model.open(EObject(targets[0][0]))
+        if model.is_in_transaction():
+            return PVMT.write_p_v_values(targets, PVGroupName)
+        model.start_transaction()
+        try:
+            res = PVMT.write_p_v_values(targets, PVGroupName)
+        # Exception is the simplified API class of the Capella metamodel
+        except builtins.Exception:
+            model.rollback_transaction()
+            raise
+        model.commit_transaction()
+        return res
+    @staticmethod
+    def write_p_v_values(targets, PVGroupName):
+        """
+        Writes the property values of set_p_v_values() in the current transaction
+        """
+        ns_uri = "http://www.polarsys.org/capella/core/core/" + capella_version()
+        res = {"created": 0, "updated": 0, "elements": 0, "groups": 0}
+        for java_object, property_values, group, elem_values in targets:
+            if len(elem_values) > 0:
+                res["elements"] += 1
+            for name, value in elem_values.items():
+                property_value = property_values.get(name)
+                if property_value is None:
+                    if group is None:
+                        group = create_e_object(ns_uri, "PropertyValueGroup")
+                        group.setName(PVGroupName)
+                        java_object.getOwnedPropertyValueGroups().add(group)
+                        index_list_change(group, True)
+                        res["groups"] += 1
+                    property_value = create_e_object(ns_uri, PVMT.get_p_v_kind(value))
+                    property_value.setName(name)
+                    if isinstance(value, EnumerationPropertyLiteral):
+                        # the value is typed by the enumeration defining the literal
+                        property_value.setType(value.get_java_object().eContainer())
+                    group.getOwnedPropertyValues().add(property_value)
+                    index_list_change(property_value, True)
+                    res["created"] += 1
+                else:
+                    res["updated"] += 1
+                kind = property_value.eClass().getName()
+                if kind == "EnumerationPropertyValue":
+                    property_value.setValue(PVMT.encode_literal(property_value, value))
+                else:
+                    property_value.setValue(PVMT.KIND_ENCODERS.get(kind, str)(value))
+        return res
+    @staticmethod
+    def encode_integer(value):
+        """
+        Converts a value to the value of an IntegerPropertyValue, raises a ValueError instead of truncating a number with a fractional part
+        """
+        if isinstance(value, numbers.Real) and not isinstance(value, numbers.Integral) and value != int(value):
+            raise ValueError("The value " + repr(value) + " is not an integer")
+        return int(value)
+    @staticmethod
+    def get_p_v_kind(value):
+        """
+        Gets the kind of property value created for the given value: BooleanPropertyValue, IntegerPropertyValue, FloatPropertyValue,
+        EnumerationPropertyValue for an EnumerationPropertyLiteral, or StringPropertyValue
+        """
+        if isinstance(value, bool):
+            return "BooleanPropertyValue"
+        elif isinstance(value, numbers.Integral):
+            return "IntegerPropertyValue"
+        elif isinstance(value, numbers.Real):
+            return "FloatPropertyValue"
+        elif isinstance(value, EnumerationPropertyLiteral):
+            return "EnumerationPropertyValue"
+        return "StringPropertyValue"
+    @staticmethod
+    def encode_literal(property_value, value):
+        """
+        Converts a value to the value of the given EnumerationPropertyValue: the EObject of an EnumerationPropertyLiteral,
+        or the literal of the type of the property value with the given name. Raises a ValueError if there is no such literal
+        """
+        if isinstance(value, JavaObject):
+            return value.get_java_object()
+        enumeration = property_value.getType()
+        if enumeration is not None:
+            for literal in enumeration.getOwnedLiterals():
+                if literal.getName() == value:
+                    return literal
+        raise ValueError("The value " + repr(value) + " is not a literal of the enumeration of " + property_value.getName())
+    @staticmethod
+    def extract_table(elems, PVNames, types = None):
+        """
+        Reads the given property values of all the given elements, returns a dict mapping each name to its column of values.
+        With NumPy a column is a masked array (missing values are masked) of bool, int64, float64 or object depending on the values,
+        otherwise it is a list with None for missing values. The types dict can give the type converting the values of a name (for instance int)
+        """
+        columns = [[] for name in PVNames]
+        converters = [None if types is None else types.get(name) for name in PVNames]
+        for elem in elems:
+            values = property_value_index.get(elem.get_java_object())[0]
+            for name, column, converter in zip(PVNames, columns, converters):
+                value = PVMT.to_typed_value(values.get(name))
+                if value is not None and converter is not None:
+                    value = converter(value)
+                column.append(value)
+        return OrderedDict((name, PVMT.to_column(column)) for name, column in zip(PVNames, columns))
+    @staticmethod
+    def to_column(values):
+        """
+        Converts a list of values with None for missing values to a table column, see extract_table()
+        """
+        if numpy is None:
+            return values
+        present = [value for value in values if value is not None]
+        if all(isinstance(value, bool) for value in present):
+            dtype, missing = bool, False
+        elif all(isinstance(value, numbers.Integral) and not isinstance(value, bool) for value in present):
+            dtype, missing = numpy.int64, 0
+        elif all(isinstance(value, numbers.Real) and not isinstance(value, bool) for value in present):
+            dtype, missing = numpy.float64, 0.0
+        else:
+            dtype, missing = object, None
+        mask = numpy.fromiter((value is None for value in values), dtype = bool, count = len(values))
+        data = numpy.array([missing if value is None else value for value in values], dtype = dtype)
+        return numpy.ma.masked_array(data, mask = mask)
+    @staticmethod
+    def get_statistics(column):
+        """
+        Gets the count, sum, min, max and mean of the values of a numeric column, ignoring missing values
+        """
+        if numpy is not None and isinstance(column, numpy.ma.MaskedArray):
+            count = int(column.count())
+            if count == 0:
+                return dict(NO_STATISTICS)
+            return {"count": count, "sum": column.sum(), "min": column.min(), "max": column.max(), "mean": float(column.mean())}
+        present = [value for value in column if value is not None]
+        if len(present) == 0:
+            return dict(NO_STATISTICS)
+        return {"count": len(present), "sum": sum(present), "min": min(present), "max": max(present), "mean": float(sum(present)) / len(present)}
+    @staticmethod
+    def rollup(column, keys):
+        """
+        Gets the statistics of the values of a numeric column for each key, the keys being given for each row (for instance the owner name)
+        """
+        if numpy is None or not isinstance(column, numpy.ma.MaskedArray):
+            groups = OrderedDict()
+            for key, value in zip(keys, column):
+                groups.setdefault(key, []).append(value)
+            return OrderedDict((key, PVMT.get_statistics(values)) for key, values in groups.items())
+        # the index of each key in order of first appearance
+        key_indexes = OrderedDict()
+        inverse = numpy.fromiter((key_indexes.setdefault(key, len(key_indexes)) for key in keys), dtype = numpy.intp, count = len(keys))
+        unique_keys = list(key_indexes)
+        present = ~numpy.ma.getmaskarray(column)
+        data = column.filled(0).astype(numpy.float64)
+        counts = numpy.bincount(inverse[present], minlength = len(unique_keys))
+        sums = numpy.bincount(inverse[present], weights = data[present], minlength = len(unique_keys))
+        minimums = numpy.full(len(unique_keys), numpy.inf)
+        maximums = numpy.full(len(unique_keys), -numpy.inf)
+        numpy.minimum.at(minimums, inverse[present], data[present])
+        numpy.maximum.at(maximums, inverse[present], data[present])
+        res = OrderedDict()
+        for index, key in enumerate(unique_keys):
+            if counts[index] == 0:
+                res[key] = dict(NO_STATISTICS)
+            else:
+                res[key] = {"count": int(counts[index]), "sum": sums[index], "min": minimums[index], "max": maximums[index], "mean": sums[index] / counts[index]}
+        return res
@@ -2,10 +2,26 @@ include('workspace://Python4Capella/simplified_api/capella.py')
 if False:
     from simplified_api.capella import *
 
+import bisect
+import numbers
+import time
+import xml.etree.ElementTree as ElementTree
+from xml.sax.saxutils import XMLGenerator
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+try:
+    import scipy.sparse as scipy_sparse
+except ImportError:
+    # TraceabilityMatrix.to_sparse() needs SciPy
+    scipy_sparse = None
+
 
 class RequirementAddOn(JavaObject):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -14,14 +30,11 @@ class RequirementAddOn(JavaObject):
     def get_system_engineering(capellaElement):
         """
         """
-        container = capellaElement.get_java_object().eContainer()
-        if container is None:
-            return container
+        system_engineering = container_chain_cache.get_system_engineering(capellaElement.get_java_object())
+        if system_engineering is None:
+            return system_engineering
         else:
-            if container.eClass().getName() == "SystemEngineering" and container.eClass().getEPackage().getNsURI().startswith("http://www.polarsys.org/capella/core/modeller"):
-                return SystemEngineering(container)
-            else:
-                return RequirementAddOn.get_system_engineering(JavaObject(container))
+            return SystemEngineering(system_engineering)
     @staticmethod
     def get_requirement_modules(capellaElement):
         """
@@ -42,7 +55,7 @@ class RequirementAddOn(JavaObject):
         """
         res = []
         #: :type capellaElement: CapellaElement
-        for relation in e_inverse(capellaElement.get_java_object(), "target"):
+        for relation in capella_inverse(capellaElement.get_java_object(), "target"):
             if relation.eClass().getName() == "CapellaIncomingRelation" and relation.eClass().getEPackage().getNsURI().startswith("http://www.polarsys.org/capella/requirements"):
                 capella_element = relation.getSource()
                 if capella_element is not None:
@@ -62,6 +75,52 @@ class RequirementAddOn(JavaObject):
             if extension.eClass().getName() == "CapellaOutgoingRelation" and extension.eClass().getEPackage().getNsURI().startswith("http://www.polarsys.org/capella/requirements"):
                 res.append(Requirement(extension.getTarget()))
         return res
+    @staticmethod
+    def build_traceability_matrix(systemEngineering, cls = None):
+        """
+        Builds the TraceabilityMatrix of the requirements (not the folders) and the elements of the given SystemEngineering in one pass over its content.
+        The columns are the elements linked to a requirement, and all the elements of the given class (or tuple of classes) when it is given,
+        so they can be found by get_untraced_elements()
+        """
+        matrix = TraceabilityMatrix()
+        e_object_class = getattr(sys.modules["__main__"], "EObject")
+        # the kind of the EObjects of each EClass: "requirement", "incoming", "outgoing" or None
+        kinds = {}
+        # (requirement, element) EObjects
+        links = []
+        tree_iterator = systemEngineering.get_java_object().eAllContents()
+        while iteratorHasNext(tree_iterator):
+            e_object = iteratorNext(tree_iterator)
+            e_class = e_object.eClass()
+            kind = kinds.get(e_class, False)
+            if kind is False:
+                kind = kinds[e_class] = RequirementAddOn.get_traceability_kind(e_class)
+            if kind == "requirement":
+                matrix.add_requirement(e_object)
+            elif kind == "incoming":
+                links.append((e_object.getSource(), e_object.getTarget()))
+            elif kind == "outgoing":
+                links.append((e_object.getTarget(), e_object.getSource()))
+            elif cls is not None:
+                specific_cls = e_object_class.get_class(e_object)
+                if specific_cls is not None and issubclass(specific_cls, cls):
+                    matrix.add_element(e_object)
+        for requirement, element in links:
+            if requirement is not None and element is not None:
+                matrix.add_link(requirement, element)
+        matrix.build_index()
+        return matrix
+    @staticmethod
+    def get_traceability_kind(e_class):
+        """
+        Gets "requirement", "incoming" or "outgoing" for the Requirement, CapellaIncomingRelation and CapellaOutgoingRelation EClasses, None otherwise
+        """
+        e_class_name = e_class.getName()
+        if e_class_name == "Requirement" and e_class.getEPackage().getNsURI().startswith("http://www.polarsys.org/kitalpha/requirements"):
+            return "requirement"
+        elif e_class_name in ("CapellaIncomingRelation", "CapellaOutgoingRelation") and e_class.getEPackage().getNsURI().startswith("http://www.polarsys.org/capella/requirements"):
+            return "incoming" if e_class_name == "CapellaIncomingRelation" else "outgoing"
+        return None
     def get_relation_type(self, elem1, elem2):
         """
         status: KO
@@ -71,6 +130,7 @@ class RequirementAddOn(JavaObject):
 class CapellaModule(EObject):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -116,10 +176,22 @@ class CapellaModule(EObject):
         """
         """
         self.get_java_object().setReqIFPrefix(value)
+    def import_reqif(self, path, model = None, chunk_size = 1000):
+        """
+        Reads the requirements of the given ReqIF file in this module in transactions of chunk_size requirements (see ReqIFReader),
+        returns the number of created requirements, folders and attributes and of committed transactions
+        """
+        return ReqIFReader(self, model, chunk_size).read(path)
+    def export_reqif(self, path):
+        """
+        Writes the requirements of this module in the given ReqIF file (see ReqIFWriter)
+        """
+        ReqIFWriter(self).write(path)
 
 class Requirement(EObject):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -179,26 +251,81 @@ class Requirement(EObject):
         self.get_java_object().setReqIFText(value)
     def get_all_attributes(self):
         """
-        status: KO
+        Gets the names of the attributes of this requirement (the ReqIFLongName of their definitions)
+        status: OK
         """
-        raise AttributeError("TODO")
+        return list(requirement_attribute_index.get(self.get_java_object())[0])
     def get_attribute(self, attributeName):
         """
-        status: KO
+        Gets the value of the attribute with the given name, the list of the names of the values of an enumeration attribute,
+        None if this requirement has no such attribute
+        status: OK
         """
-        raise AttributeError("TODO")
+        return requirement_attribute_index.get(self.get_java_object())[0].get(attributeName)
     def set_attribute(self, attributeName, value):
         """
-        status: KO
+        Sets the value of the attribute with the given name, a name or a list of names of values for an enumeration attribute.
+        A missing attribute is created if the requirement type has a definition with the given name
+        status: OK
         """
-        raise AttributeError("TODO")
+        java_object = self.get_java_object()
+        attribute = requirement_attribute_index.get(java_object)[1].get(attributeName)
+        if attribute is None:
+            attribute = Requirement.create_attribute(java_object, attributeName, value)
+        if attribute.eClass().getName() == "EnumerationValueAttribute":
+            names = [value] if isinstance(value, str) else list(value)
+            enum_values = dict((enum_value.getReqIFLongName(), enum_value) for enum_value in attribute.getDefinition().getDefinitionType().getSpecifiedValues())
+            attribute.getValues().clear()
+            for name in names:
+                if name not in enum_values:
+                    raise ValueError("No value " + name + " for the attribute " + attributeName)
+                attribute.getValues().add(enum_values[name])
+            inverse_reference_index.update(attribute)
+        else:
+            attribute.setValue(value)
+        requirement_attribute_index.forget(java_object)
+    @staticmethod
+    def create_attribute(java_object, attributeName, value):
+        """
+        Creates the attribute with the given name of the given requirement EObject from the definition of its requirement type,
+        the kind of a non enumeration attribute is given by the value
+        """
+        requirement_type = java_object.getRequirementType()
+        definitions = requirement_type.getOwnedAttributes() if requirement_type is not None else []
+        for definition in definitions:
+            if definition.getReqIFLongName() == attributeName:
+                break
+        else:
+            raise ValueError("No definition of the attribute " + attributeName)
+        if definition.eClass().getName() == "AttributeDefinitionEnumeration":
+            e_class_name = "EnumerationValueAttribute"
+        elif isinstance(value, bool):
+            e_class_name = "BooleanValueAttribute"
+        elif isinstance(value, numbers.Integral):
+            e_class_name = "IntegerValueAttribute"
+        elif isinstance(value, numbers.Real):
+            e_class_name = "RealValueAttribute"
+        else:
+            e_class_name = "StringValueAttribute"
+        res = create_e_object("http://www.polarsys.org/kitalpha/requirements", e_class_name)
+        res.setDefinition(definition)
+        java_object.getOwnedAttributes().add(res)
+        index_list_change(res, True)
+        return res
+    @staticmethod
+    def get_attributes_table(requirements, names):
+        """
+        Gets the values of the attributes with the given names of all the given requirements (see get_attribute()),
+        as a dict mapping each name to its column of values, with None for a missing attribute
+        """
+        return requirement_attribute_index.get_table([requirement.get_java_object() for requirement in requirements], names)
     def get_incoming_linked_elems(self):
         """
         status: OK
         """
         res = []
         #: :type capellaElement: CapellaElement
-        for relation in e_inverse(self.get_java_object(), "target"):
+        for relation in capella_inverse(self.get_java_object(), "target"):
             if relation.eClass().getName() == "CapellaOutgoingRelation" and relation.eClass().getEPackage().getNsURI().startswith("http://www.polarsys.org/capella/requirements"):
                 capella_element = relation.getSource()
                 if capella_element is not None:
@@ -225,6 +352,7 @@ class Requirement(EObject):
 class Folder(Requirement):
     """
     """
+    __slots__ = ()
     def __init__(self, java_object = None):
         """
         """
@@ -240,3 +368,681 @@ class Folder(Requirement):
         return create_e_list(self.get_java_object().getOwnedRequirements(), Requirement)
 
 
+
+class TraceabilityMatrix():
+    """
+    A sparse matrix of the links between requirements (rows) and elements (columns), see RequirementAddOn.build_traceability_matrix().
+    A link is a CapellaIncomingRelation owned by the requirement or a CapellaOutgoingRelation owned by the element,
+    the value of a cell is its number of links. row_index and column_index map the ids of the requirements and elements to their index
+    """
+    def __init__(self):
+        self.requirements = []
+        self.elements = []
+        self.row_index = {}
+        self.column_index = {}
+        # the index of each requirement and element EObject
+        self.rows_by_e_object = {}
+        self.columns_by_e_object = {}
+        # (row, column) -> number of links
+        self.cells = {}
+        self.data = None
+        self.indices = None
+        self.indptr = None
+        # the rows of each column
+        self.column_rows = None
+    def add_requirement(self, requirement):
+        if requirement not in self.rows_by_e_object:
+            self.rows_by_e_object[requirement] = len(self.requirements)
+            self.row_index[requirement.getId()] = len(self.requirements)
+            self.requirements.append(requirement)
+        return self.rows_by_e_object[requirement]
+    def add_element(self, element):
+        if element not in self.columns_by_e_object:
+            self.columns_by_e_object[element] = len(self.elements)
+            self.column_index[element.getId()] = len(self.elements)
+            self.elements.append(element)
+        return self.columns_by_e_object[element]
+    def add_link(self, requirement, element):
+        key = (self.add_requirement(requirement), self.add_element(element))
+        self.cells[key] = self.cells.get(key, 0) + 1
+    def build_index(self):
+        """
+        Builds the CSR arrays of the matrix
+        """
+        self.data = []
+        self.indices = []
+        self.indptr = [0] * (len(self.requirements) + 1)
+        self.column_rows = [[] for element in self.elements]
+        for (row, column), count in sorted(self.cells.items()):
+            self.data.append(count)
+            self.indices.append(column)
+            self.indptr[row + 1] += 1
+            self.column_rows[column].append(row)
+        for row in range(len(self.requirements)):
+            self.indptr[row + 1] += self.indptr[row]
+    def get_shape(self):
+        """
+        Gets the number of requirements and elements
+        """
+        return (len(self.requirements), len(self.elements))
+    def get_coo(self):
+        """
+        Gets the (data, rows, columns) lists of the matrix in coordinate format
+        """
+        rows = []
+        for row in range(len(self.requirements)):
+            rows.extend([row] * (self.indptr[row + 1] - self.indptr[row]))
+        return list(self.data), rows, list(self.indices)
+    def get_csr(self):
+        """
+        Gets the (data, indices, indptr) lists of the matrix in compressed sparse row format
+        """
+        return list(self.data), list(self.indices), list(self.indptr)
+    def to_sparse(self, format = "csr"):
+        """
+        Gets the matrix as a SciPy sparse matrix in the given format ("csr" or "coo")
+        """
+        if scipy_sparse is None:
+            raise ImportError("SciPy is needed to get a sparse matrix, use get_csr() or get_coo() instead")
+        res = scipy_sparse.csr_matrix((self.data, self.indices, self.indptr), shape = self.get_shape())
+        return res.asformat(format)
+    def get_linked_elements(self, requirement):
+        """
+        Gets the elements linked to the given requirement
+        """
+        row = self.rows_by_e_object.get(requirement.get_java_object())
+        if row is None:
+            return []
+        return wrap_java_objects([self.elements[column] for column in self.indices[self.indptr[row]:self.indptr[row + 1]]])
+    def get_linked_requirements(self, element):
+        """
+        Gets the requirements linked to the given element
+        """
+        column = self.columns_by_e_object.get(element.get_java_object())
+        if column is None:
+            return []
+        return [Requirement(self.requirements[row]) for row in self.column_rows[column]]
+    def get_uncovered_requirements(self):
+        """
+        Gets the requirements without linked elements
+        """
+        return [Requirement(requirement) for row, requirement in enumerate(self.requirements) if self.indptr[row] == self.indptr[row + 1]]
+    def get_untraced_elements(self):
+        """
+        Gets the elements without linked requirements
+        """
+        return wrap_java_objects([element for element, rows in zip(self.elements, self.column_rows) if len(rows) == 0])
+    def get_coverage(self):
+        """
+        Gets the number of requirements, covered requirements, elements and traced elements per architecture name
+        (None for the ones outside of an architecture)
+        """
+        res = {}
+        def get_layer(e_object):
+            architecture = container_chain_cache.get_architecture(e_object)
+            name = None if architecture is None else architecture.getName()
+            if name not in res:
+                res[name] = {"requirements": 0, "covered_requirements": 0, "elements": 0, "traced_elements": 0}
+            return res[name]
+        for row, requirement in enumerate(self.requirements):
+            layer = get_layer(requirement)
+            layer["requirements"] += 1
+            if self.indptr[row] != self.indptr[row + 1]:
+                layer["covered_requirements"] += 1
+        for element, rows in zip(self.elements, self.column_rows):
+            layer = get_layer(element)
+            layer["elements"] += 1
+            if len(rows) > 0:
+                layer["traced_elements"] += 1
+        return res
+
+class ReqIFWriter():
+    """
+    Writes a CapellaModule in a ReqIF file: its requirements and folders are the SPEC-OBJECTs, its hierarchy is the SPECIFICATION.
+    The file is streamed while walking the module twice (for the types, then for the objects), so no document is built in memory.
+    The ReqIFText, ReqIFName, ReqIFChapterName and ReqIFPrefix of the requirements are written as the standard ReqIF.* attributes
+    and the ReqIFIdentifier as ReqIF.ForeignID. Dates are written as strings and the relations are not written
+    """
+    NAMESPACE = "http://www.omg.org/spec/ReqIF/20110401/reqif.xsd"
+    # requirement feature -> standard attribute name
+    STANDARD_ATTRIBUTES = OrderedDict([("ReqIFIdentifier", "ReqIF.ForeignID"), ("ReqIFName", "ReqIF.Name"), ("ReqIFChapterName", "ReqIF.ChapterName"),
+                                       ("ReqIFPrefix", "ReqIF.Prefix"), ("ReqIFText", "ReqIF.Text")])
+    # attribute EClass name -> datatype kind
+    ATTRIBUTE_KINDS = {
+        "StringValueAttribute": "STRING",
+        "IntegerValueAttribute": "INTEGER",
+        "RealValueAttribute": "REAL",
+        "BooleanValueAttribute": "BOOLEAN",
+        "DateValueAttribute": "STRING",
+        "EnumerationValueAttribute": "ENUMERATION",
+    }
+    # datatype kind -> attributes of its DATATYPE-DEFINITION (see start())
+    DATATYPE_ATTRIBUTES = {
+        "STRING": OrderedDict([("MAX_LENGTH", "2147483647")]),
+        "INTEGER": OrderedDict([("MAX", "9223372036854775807"), ("MIN", "-9223372036854775808")]),
+        "REAL": OrderedDict([("ACCURACY", "15"), ("MAX", "1.7976931348623157E308"), ("MIN", "-1.7976931348623157E308")]),
+        "BOOLEAN": OrderedDict(),
+    }
+    def __init__(self, module):
+        self.module = module.get_java_object()
+        self.identifier = ReqIFWriter.get_identifier(self.module)
+        self.last_change = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        # RequirementType EObject (None for the requirements without type) -> OrderedDict of AttributeDefinition EObject -> datatype kind
+        self.spec_types = OrderedDict()
+        # the EnumerationDataTypeDefinition EObjects
+        self.enumerations = OrderedDict()
+        self.kinds = set(["STRING"])
+        self.generator = None
+    @staticmethod
+    def get_identifier(e_object):
+        """
+        Gets the ReqIF IDENTIFIER of the given EObject from its id, an id which is not a valid XML name is prefixed with an underscore
+        """
+        res = e_object.getId()
+        if not (res[0].isalpha() or res[0] == "_"):
+            res = "_" + res
+        return res
+    @staticmethod
+    def iter_requirements(container):
+        """
+        Yields the requirements and folders contained in the given CapellaModule or Folder EObject, parents first
+        """
+        stack = [iter(list(container.getOwnedRequirements()))]
+        while len(stack) > 0:
+            requirement = next(stack[-1], None)
+            if requirement is None:
+                stack.pop()
+                continue
+            yield requirement
+            if requirement.eClass().getName() == "Folder":
+                stack.append(iter(list(requirement.getOwnedRequirements())))
+    def write(self, path):
+        """
+        Writes the module in the file with the given path, or in the given binary stream
+        """
+        self.read_types()
+        if hasattr(path, "write"):
+            self.write_stream(path)
+        else:
+            with open(path, "wb") as stream:
+                self.write_stream(stream)
+    def read_types(self):
+        """
+        Reads the requirement types, attribute definitions and datatype kinds used by the requirements of the module
+        """
+        for requirement in ReqIFWriter.iter_requirements(self.module):
+            definitions = self.spec_types.setdefault(requirement.getRequirementType(), OrderedDict())
+            for attribute in requirement.getOwnedAttributes():
+                definition = attribute.getDefinition()
+                if definition is None or definition in definitions:
+                    continue
+                kind = self.ATTRIBUTE_KINDS.get(attribute.eClass().getName(), "STRING")
+                if kind == "ENUMERATION":
+                    enumeration = definition.getDefinitionType()
+                    if enumeration is None:
+                        continue
+                    self.enumerations[enumeration] = None
+                definitions[definition] = kind
+                self.kinds.add(kind)
+    def write_stream(self, stream):
+        self.generator = XMLGenerator(stream, "utf-8")
+        self.generator.startDocument()
+        self.start("REQ-IF", xmlns = self.NAMESPACE)
+        self.start("THE-HEADER")
+        self.start("REQ-IF-HEADER", IDENTIFIER = self.identifier + "-HEADER")
+        self.element("CREATION-TIME", self.last_change)
+        self.element("REQ-IF-TOOL-ID", "Python4Capella")
+        self.element("REQ-IF-VERSION", "1.0")
+        self.element("SOURCE-TOOL-ID", "Python4Capella")
+        self.element("TITLE", self.module.getReqIFLongName() or "")
+        self.end("REQ-IF-HEADER")
+        self.end("THE-HEADER")
+        self.start("CORE-CONTENT")
+        self.start("REQ-IF-CONTENT")
+        self.write_datatypes()
+        self.write_spec_types()
+        self.start("SPEC-OBJECTS")
+        for requirement in ReqIFWriter.iter_requirements(self.module):
+            self.write_spec_object(requirement)
+        self.end("SPEC-OBJECTS")
+        self.start("SPECIFICATIONS")
+        self.start("SPECIFICATION", IDENTIFIER = self.identifier, LONG_NAME = self.module.getReqIFLongName())
+        self.reference("TYPE", "SPECIFICATION-TYPE", self.identifier + "-SPECIFICATION-TYPE")
+        self.write_hierarchy(self.module)
+        self.end("SPECIFICATION")
+        self.end("SPECIFICATIONS")
+        self.end("REQ-IF-CONTENT")
+        self.end("CORE-CONTENT")
+        self.end("REQ-IF")
+        self.generator.endDocument()
+    def write_datatypes(self):
+        self.start("DATATYPES")
+        for kind in sorted(self.kinds - set(["ENUMERATION"])):
+            self.start("DATATYPE-DEFINITION-" + kind, IDENTIFIER = self.identifier + "-" + kind, LONG_NAME = kind, **self.DATATYPE_ATTRIBUTES[kind])
+            self.end("DATATYPE-DEFINITION-" + kind)
+        for enumeration in self.enumerations:
+            self.start("DATATYPE-DEFINITION-ENUMERATION", IDENTIFIER = ReqIFWriter.get_identifier(enumeration), LONG_NAME = enumeration.getReqIFLongName())
+            self.start("SPECIFIED-VALUES")
+            for index, enum_value in enumerate(enumeration.getSpecifiedValues()):
+                self.start("ENUM-VALUE", IDENTIFIER = ReqIFWriter.get_identifier(enum_value), LONG_NAME = enum_value.getReqIFLongName())
+                self.start("PROPERTIES")
+                self.start("EMBEDDED-VALUE", KEY = str(index), OTHER_CONTENT = "")
+                self.end("EMBEDDED-VALUE")
+                self.end("PROPERTIES")
+                self.end("ENUM-VALUE")
+            self.end("SPECIFIED-VALUES")
+            self.end("DATATYPE-DEFINITION-ENUMERATION")
+        self.end("DATATYPES")
+    def write_spec_types(self):
+        self.start("SPEC-TYPES")
+        for requirement_type, definitions in self.spec_types.items():
+            spec_type_identifier = self.get_spec_type_identifier(requirement_type)
+            self.start("SPEC-OBJECT-TYPE", IDENTIFIER = spec_type_identifier, LONG_NAME = "Requirement" if requirement_type is None else requirement_type.getReqIFLongName())
+            self.start("SPEC-ATTRIBUTES")
+            for name in self.STANDARD_ATTRIBUTES.values():
+                self.start("ATTRIBUTE-DEFINITION-STRING", IDENTIFIER = spec_type_identifier + "-" + name, LONG_NAME = name)
+                self.reference("TYPE", "DATATYPE-DEFINITION-STRING", self.identifier + "-STRING")
+                self.end("ATTRIBUTE-DEFINITION-STRING")
+            for definition, kind in definitions.items():
+                if kind == "ENUMERATION":
+                    self.start("ATTRIBUTE-DEFINITION-ENUMERATION", IDENTIFIER = ReqIFWriter.get_identifier(definition), LONG_NAME = definition.getReqIFLongName(),
+                               MULTI_VALUED = "true" if definition.isMultiValued() else "false")
+                    self.reference("TYPE", "DATATYPE-DEFINITION-ENUMERATION", ReqIFWriter.get_identifier(definition.getDefinitionType()))
+                else:
+                    self.start("ATTRIBUTE-DEFINITION-" + kind, IDENTIFIER = ReqIFWriter.get_identifier(definition), LONG_NAME = definition.getReqIFLongName())
+                    self.reference("TYPE", "DATATYPE-DEFINITION-" + kind, self.identifier + "-" + kind)
+                self.end("ATTRIBUTE-DEFINITION-" + kind)
+            self.end("SPEC-ATTRIBUTES")
+            self.end("SPEC-OBJECT-TYPE")
+        self.start("SPECIFICATION-TYPE", IDENTIFIER = self.identifier + "-SPECIFICATION-TYPE", LONG_NAME = "Module")
+        self.end("SPECIFICATION-TYPE")
+        self.end("SPEC-TYPES")
+    def get_spec_type_identifier(self, requirement_type):
+        if requirement_type is None:
+            return self.identifier + "-REQUIREMENT-TYPE"
+        return ReqIFWriter.get_identifier(requirement_type)
+    def write_spec_object(self, requirement):
+        requirement_type = requirement.getRequirementType()
+        spec_type_identifier = self.get_spec_type_identifier(requirement_type)
+        definitions = self.spec_types[requirement_type]
+        self.start("SPEC-OBJECT", IDENTIFIER = ReqIFWriter.get_identifier(requirement), LONG_NAME = requirement.getReqIFLongName())
+        self.start("VALUES")
+        for feature, name in self.STANDARD_ATTRIBUTES.items():
+            value = getattr(requirement, "get" + feature)()
+            if value is not None:
+                self.start("ATTRIBUTE-VALUE-STRING", THE_VALUE = value)
+                self.reference("DEFINITION", "ATTRIBUTE-DEFINITION-STRING", spec_type_identifier + "-" + name)
+                self.end("ATTRIBUTE-VALUE-STRING")
+        for attribute in requirement.getOwnedAttributes():
+            kind = definitions.get(attribute.getDefinition())
+            if kind is None:
+                continue
+            elif kind == "ENUMERATION":
+                self.start("ATTRIBUTE-VALUE-ENUMERATION")
+                self.reference("DEFINITION", "ATTRIBUTE-DEFINITION-ENUMERATION", ReqIFWriter.get_identifier(attribute.getDefinition()))
+                self.start("VALUES")
+                for enum_value in attribute.getValues():
+                    self.element("ENUM-VALUE-REF", ReqIFWriter.get_identifier(enum_value))
+                self.end("VALUES")
+            else:
+                value = attribute.getValue()
+                if value is None:
+                    continue
+                elif kind == "BOOLEAN":
+                    value = "true" if value else "false"
+                self.start("ATTRIBUTE-VALUE-" + kind, THE_VALUE = repr(value) if kind == "REAL" else str(value))
+                self.reference("DEFINITION", "ATTRIBUTE-DEFINITION-" + kind, ReqIFWriter.get_identifier(attribute.getDefinition()))
+            self.end("ATTRIBUTE-VALUE-" + kind)
+        self.end("VALUES")
+        self.reference("TYPE", "SPEC-OBJECT-TYPE", spec_type_identifier)
+        self.end("SPEC-OBJECT")
+    def write_hierarchy(self, container):
+        """
+        Writes the SPEC-HIERARCHY of the requirements of the given CapellaModule or Folder EObject
+        """
+        requirements = container.getOwnedRequirements()
+        if requirements.size() == 0:
+            return
+        self.start("CHILDREN")
+        for requirement in requirements:
+            identifier = ReqIFWriter.get_identifier(requirement)
+            self.start("SPEC-HIERARCHY", IDENTIFIER = identifier + "-HIERARCHY")
+            self.reference("OBJECT", "SPEC-OBJECT", identifier)
+            if requirement.eClass().getName() == "Folder":
+                self.write_hierarchy(requirement)
+            self.end("SPEC-HIERARCHY")
+        self.end("CHILDREN")
+    def start(self, name, **attributes):
+        """
+        Starts an element, the underscores of the names of the attributes are written as dashes, None values are not written.
+        The identifiable elements get the LAST-CHANGE of the document
+        """
+        xml_attributes = OrderedDict()
+        for attribute_name in sorted(attributes):
+            if attributes[attribute_name] is not None:
+                xml_attributes[attribute_name.replace("_", "-")] = attributes[attribute_name]
+        if "IDENTIFIER" in xml_attributes:
+            xml_attributes["LAST-CHANGE"] = self.last_change
+        self.generator.startElement(name, xml_attributes)
+    def end(self, name):
+        self.generator.endElement(name)
+    def element(self, name, text):
+        self.generator.startElement(name, {})
+        self.generator.characters(text)
+        self.generator.endElement(name)
+    def reference(self, name, referenced_name, identifier):
+        """
+        Writes a reference element like <TYPE><SPEC-OBJECT-TYPE-REF>identifier</SPEC-OBJECT-TYPE-REF></TYPE>
+        """
+        self.start(name)
+        self.element(referenced_name + "-REF", identifier)
+        self.end(name)
+
+class ReqIFReader():
+    """
+    Reads the SPEC-OBJECTs of a ReqIF file as requirements of a CapellaModule, the SPEC-OBJECTs with children in a SPECIFICATION as folders.
+    The file is parsed incrementally twice: for the datatypes, types and hierarchy, then for the SPEC-OBJECTs which are discarded once read.
+    The requirements are written in transactions of chunk_size SPEC-OBJECTs, or in the transaction already started on the session of the model if there is one,
+    the committed chunks are kept when a later one fails. The types are reused by ReqIFLongName, the standard ReqIF.* attributes
+    are read as the ReqIF features of the requirements (see ReqIFWriter), XHTML values as their text and dates as strings
+    """
+    REQUIREMENTS_NS_URI = "http://www.polarsys.org/kitalpha/requirements"
+    CAPELLA_REQUIREMENTS_NS_URI = "http://www.polarsys.org/capella/requirements"
+    # standard attribute name -> requirement feature
+    STANDARD_ATTRIBUTES = dict((name, feature) for feature, name in ReqIFWriter.STANDARD_ATTRIBUTES.items())
+    # datatype kind -> attribute EClass name
+    ATTRIBUTE_CLASSES = {
+        "INTEGER": "IntegerValueAttribute",
+        "REAL": "RealValueAttribute",
+        "BOOLEAN": "BooleanValueAttribute",
+        "ENUMERATION": "EnumerationValueAttribute",
+    }
+    # datatype kind -> decoder of the THE-VALUE strings
+    KIND_DECODERS = {
+        "INTEGER": int,
+        "REAL": float,
+        "BOOLEAN": lambda value: value == "true",
+    }
+    def __init__(self, module, model = None, chunk_size = 1000):
+        self.module = module.get_java_object()
+        self.model = model
+        self.chunk_size = chunk_size
+        # datatype IDENTIFIER -> (kind, LONG-NAME)
+        self.datatypes = {}
+        # enumeration datatype IDENTIFIER -> OrderedDict of ENUM-VALUE IDENTIFIER -> LONG-NAME
+        self.enum_values = {}
+        # SPEC-OBJECT-TYPE IDENTIFIER -> LONG-NAME
+        self.spec_types = OrderedDict()
+        # ATTRIBUTE-DEFINITION IDENTIFIER -> (LONG-NAME, kind, datatype IDENTIFIER, SPEC-OBJECT-TYPE IDENTIFIER, MULTI-VALUED)
+        self.definitions = OrderedDict()
+        # SPEC-OBJECT IDENTIFIER -> (parent SPEC-OBJECT IDENTIFIER or None, position in the hierarchy)
+        self.hierarchy = {}
+        # SPEC-OBJECT IDENTIFIERs with children in the hierarchy
+        self.folders = set()
+        # the Capella EObjects by ReqIF IDENTIFIER
+        self.requirement_types = {}
+        self.attribute_definitions = {}
+        self.enum_value_objects = {}
+        self.requirements = {}
+        # container EObject -> (size before the import, sorted positions of its imported requirements)
+        self.positions = {}
+        # parent SPEC-OBJECT IDENTIFIER -> [(position, requirement EObject)] for the requirements read before their parent
+        self.pending = {}
+        self.counts = {"requirements": 0, "folders": 0, "attributes": 0, "transactions": 0}
+    @staticmethod
+    def get_tag(element):
+        """
+        Gets the tag of the given element without its namespace
+        """
+        return element.tag.rpartition("}")[2]
+    @staticmethod
+    def get_child(element, tag):
+        """
+        Gets the first child of the given element with the given tag, None if there is no such child
+        """
+        for child in element:
+            if ReqIFReader.get_tag(child) == tag:
+                return child
+        return None
+    @staticmethod
+    def get_references(element, tag):
+        """
+        Gets the referenced identifiers of the child of the given element with the given tag (like TYPE or DEFINITION)
+        """
+        child = ReqIFReader.get_child(element, tag)
+        if child is None:
+            return []
+        return [(reference.text or "").strip() for reference in child]
+    @staticmethod
+    def get_reference(element, tag):
+        references = ReqIFReader.get_references(element, tag)
+        return references[0] if len(references) > 0 else None
+    @staticmethod
+    def iter_elements(path, tags):
+        """
+        Parses the given file incrementally and yields the complete elements with the given tags, an element is removed from the tree
+        once the caller has read it so the memory used does not depend on the size of the file
+        """
+        stack = []
+        for event, element in ElementTree.iterparse(path, ("start", "end")):
+            if event == "start":
+                stack.append(element)
+                continue
+            stack.pop()
+            tag = ReqIFReader.get_tag(element)
+            if tag in tags:
+                yield tag, element
+                element.clear()
+                if len(stack) > 0:
+                    stack[-1].remove(element)
+            elif tag in ("SPEC-OBJECT", "SPEC-RELATION", "SPEC-HIERARCHY") and len(stack) > 0:
+                # the elements of the other part of the file
+                element.clear()
+                stack[-1].remove(element)
+    def read(self, path):
+        """
+        Reads the ReqIF file with the given path, returns the number of created requirements, folders
+        and attributes and of committed transactions
+        """
+        self.read_definitions(path)
+        if self.model is None:
+            self.model = CapellaModel()
+            self.model.open(EObject(self.module))
+        # the requirements are created in the transaction already started on the session
+        in_transaction = self.model.is_in_transaction()
+        if not in_transaction:
+            self.model.start_transaction()
+        # tells if a transaction started by this reader is open, nothing is rolled back if committing or starting a chunk failed
+        started = not in_transaction
+        try:
+            self.create_types()
+            count = 0
+            for tag, element in ReqIFReader.iter_elements(path, ("SPEC-OBJECT", "SPEC-OBJECTS")):
+                if tag == "SPEC-OBJECTS":
+                    break
+                self.create_requirement(element)
+                count += 1
+                if not in_transaction and count % self.chunk_size == 0:
+                    started = False
+                    self.model.commit_transaction()
+                    self.counts["transactions"] += 1
+                    self.model.start_transaction()
+                    started = True
+            # the requirements whose parent is not a SPEC-OBJECT of the file
+            for children in self.pending.values():
+                for position, requirement in children:
+                    self.insert(self.module, position, requirement)
+            self.pending.clear()
+        # Exception is the simplified API class of the Capella metamodel
+        except builtins.Exception:
+            if started:
+                self.model.rollback_transaction()
+            raise
+        if not in_transaction:
+            self.model.commit_transaction()
+            self.counts["transactions"] += 1
+        return self.counts
+    def read_definitions(self, path):
+        """
+        Reads the datatypes, the SPEC-OBJECT-TYPEs and the hierarchy of the SPECIFICATIONs
+        """
+        # the SPEC-OBJECT IDENTIFIER of each open SPEC-HIERARCHY
+        parents = []
+        stack = []
+        for event, element in ElementTree.iterparse(path, ("start", "end")):
+            tag = ReqIFReader.get_tag(element)
+            if event == "start":
+                stack.append(element)
+                if tag == "SPEC-HIERARCHY":
+                    parents.append(None)
+                continue
+            stack.pop()
+            if tag.startswith("DATATYPE-DEFINITION-") and not tag.endswith("-REF"):
+                kind = tag[len("DATATYPE-DEFINITION-"):]
+                self.datatypes[element.get("IDENTIFIER")] = (kind, element.get("LONG-NAME"))
+                if kind == "ENUMERATION":
+                    specified_values = ReqIFReader.get_child(element, "SPECIFIED-VALUES")
+                    self.enum_values[element.get("IDENTIFIER")] = OrderedDict((enum_value.get("IDENTIFIER"), enum_value.get("LONG-NAME"))
+                                                                              for enum_value in (specified_values if specified_values is not None else ()))
+            elif tag == "SPEC-OBJECT-TYPE":
+                self.spec_types[element.get("IDENTIFIER")] = element.get("LONG-NAME")
+                spec_attributes = ReqIFReader.get_child(element, "SPEC-ATTRIBUTES")
+                for definition in (spec_attributes if spec_attributes is not None else ()):
+                    kind = ReqIFReader.get_tag(definition)[len("ATTRIBUTE-DEFINITION-"):]
+                    self.definitions[definition.get("IDENTIFIER")] = (definition.get("LONG-NAME"), kind, ReqIFReader.get_reference(definition, "TYPE"),
+                                                                      element.get("IDENTIFIER"), definition.get("MULTI-VALUED") == "true")
+            elif tag == "SPEC-OBJECT-REF" and len(parents) > 0 and parents[-1] is None:
+                # the OBJECT of the current SPEC-HIERARCHY comes before its CHILDREN
+                identifier = (element.text or "").strip()
+                parents[-1] = identifier
+                parent = parents[-2] if len(parents) > 1 else None
+                if parent is not None:
+                    self.folders.add(parent)
+                if identifier not in self.hierarchy:
+                    self.hierarchy[identifier] = (parent, len(self.hierarchy))
+            elif tag == "SPEC-HIERARCHY":
+                parents.pop()
+            if tag in ("SPEC-OBJECT", "SPEC-RELATION", "SPEC-HIERARCHY") and len(stack) > 0:
+                element.clear()
+                stack[-1].remove(element)
+    def create_types(self):
+        """
+        Creates the types missing in the CapellaTypesFolder next to the module (created if needed)
+        """
+        container = self.module.eContainer()
+        types_folder = None
+        if container is not None:
+            for extension in container.getOwnedExtensions():
+                if extension.eClass().getName() == "CapellaTypesFolder":
+                    types_folder = extension
+                    break
+        if types_folder is None:
+            types_folder = create_e_object(self.CAPELLA_REQUIREMENTS_NS_URI, "CapellaTypesFolder")
+            types_folder.setReqIFLongName("Types")
+            if container is not None:
+                container.getOwnedExtensions().add(types_folder)
+                index_list_change(types_folder, True)
+        existing_types = {}
+        for definition_type in types_folder.getOwnedDefinitionTypes():
+            existing_types.setdefault((definition_type.eClass().getName(), definition_type.getReqIFLongName()), definition_type)
+        def get_type(e_class_name, long_name):
+            res = existing_types.get((e_class_name, long_name))
+            if res is None:
+                res = existing_types[(e_class_name, long_name)] = create_e_object(self.REQUIREMENTS_NS_URI, e_class_name)
+                res.setReqIFLongName(long_name)
+                types_folder.getOwnedDefinitionTypes().add(res)
+                index_list_change(res, True)
+            return res
+        enumerations = {}
+        for datatype_identifier, enum_values in self.enum_values.items():
+            enumeration = enumerations[datatype_identifier] = get_type("EnumerationDataTypeDefinition", self.datatypes[datatype_identifier][1])
+            existing_values = dict((enum_value.getReqIFLongName(), enum_value) for enum_value in enumeration.getSpecifiedValues())
+            for enum_value_identifier, long_name in enum_values.items():
+                enum_value = existing_values.get(long_name)
+                if enum_value is None:
+                    enum_value = existing_values[long_name] = create_e_object(self.REQUIREMENTS_NS_URI, "EnumValue")
+                    enum_value.setReqIFLongName(long_name)
+                    enumeration.getSpecifiedValues().add(enum_value)
+                    index_list_change(enum_value, True)
+                self.enum_value_objects[enum_value_identifier] = enum_value
+        for spec_type_identifier, long_name in self.spec_types.items():
+            self.requirement_types[spec_type_identifier] = get_type("RequirementType", long_name)
+        existing_definitions = {}
+        for definition_identifier, (long_name, kind, datatype_identifier, spec_type_identifier, multi_valued) in self.definitions.items():
+            if long_name in self.STANDARD_ATTRIBUTES:
+                continue
+            requirement_type = self.requirement_types[spec_type_identifier]
+            if requirement_type not in existing_definitions:
+                existing_definitions[requirement_type] = dict((definition.getReqIFLongName(), definition) for definition in requirement_type.getOwnedAttributes())
+            definition = existing_definitions[requirement_type].get(long_name)
+            if definition is None:
+                if kind == "ENUMERATION":
+                    definition = create_e_object(self.REQUIREMENTS_NS_URI, "AttributeDefinitionEnumeration")
+                    definition.setDefinitionType(enumerations.get(datatype_identifier))
+                    definition.setMultiValued(multi_valued)
+                else:
+                    definition = create_e_object(self.REQUIREMENTS_NS_URI, "AttributeDefinition")
+                definition.setReqIFLongName(long_name)
+                requirement_type.getOwnedAttributes().add(definition)
+                index_list_change(definition, True)
+                existing_definitions[requirement_type][long_name] = definition
+            self.attribute_definitions[definition_identifier] = definition
+    def create_requirement(self, element):
+        """
+        Creates the requirement or folder of the given SPEC-OBJECT element
+        """
+        identifier = element.get("IDENTIFIER")
+        is_folder = identifier in self.folders
+        requirement = create_e_object(self.REQUIREMENTS_NS_URI, "Folder" if is_folder else "Requirement")
+        requirement.setReqIFIdentifier(identifier)
+        requirement.setReqIFLongName(element.get("LONG-NAME"))
+        requirement.setRequirementType(self.requirement_types.get(ReqIFReader.get_reference(element, "TYPE")))
+        values = ReqIFReader.get_child(element, "VALUES")
+        for value in (values if values is not None else ()):
+            definition_identifier = ReqIFReader.get_reference(value, "DEFINITION")
+            if definition_identifier not in self.definitions:
+                continue
+            long_name, kind = self.definitions[definition_identifier][:2]
+            if kind == "XHTML":
+                the_value = ReqIFReader.get_child(value, "THE-VALUE")
+                text = "".join(the_value.itertext()).strip() if the_value is not None else None
+            else:
+                text = value.get("THE-VALUE")
+            feature = self.STANDARD_ATTRIBUTES.get(long_name)
+            if feature is not None:
+                getattr(requirement, "set" + feature)(text)
+                continue
+            attribute = create_e_object(self.REQUIREMENTS_NS_URI, self.ATTRIBUTE_CLASSES.get(kind, "StringValueAttribute"))
+            attribute.setDefinition(self.attribute_definitions[definition_identifier])
+            if kind == "ENUMERATION":
+                for enum_value_identifier in ReqIFReader.get_references(value, "VALUES"):
+                    enum_value = self.enum_value_objects.get(enum_value_identifier)
+                    if enum_value is not None:
+                        attribute.getValues().add(enum_value)
+            elif text is not None:
+                attribute.setValue(self.KIND_DECODERS.get(kind, lambda value: value)(text))
+            requirement.getOwnedAttributes().add(attribute)
+            self.counts["attributes"] += 1
+        self.counts["folders" if is_folder else "requirements"] += 1
+        parent, position = self.hierarchy.get(identifier, (None, len(self.hierarchy) + self.counts["requirements"] + self.counts["folders"]))
+        self.requirements[identifier] = requirement
+        if parent is None:
+            self.insert(self.module, position, requirement)
+        elif parent in self.requirements:
+            self.insert(self.requirements[parent], position, requirement)
+        else:
+            self.pending.setdefault(parent, []).append((position, requirement))
+        for position, child in self.pending.pop(identifier, ()):
+            self.insert(requirement, position, child)
+    def insert(self, container, position, requirement):
+        """
+        Adds the given requirement to the given container after its existing requirements, at its position in the hierarchy
+        """
+        requirements = container.getOwnedRequirements()
+        if container not in self.positions:
+            self.positions[container] = (requirements.size(), [])
+        size, positions = self.positions[container]
+        index = bisect.bisect_left(positions, position)
+        positions.insert(index, position)
+        requirements.add(size + index, requirement)
+        index_list_change(requirement, True)
@@ -0,0 +1,321 @@
+# this script defines an opt-in profiler for the calls going through the Java bridge
+#
+# usage, after the includes of the simplified API:
+#   include('workspace://Python4Capella/utilities/BridgeProfiler.py')
+#   BridgeProfiler.enable()
+# the report is printed and written as JSON when the script exits (or when BridgeProfiler.report() is called)
+#
+# nothing is instrumented until enable() is called, so the profiler costs nothing when it is not used
+#
+# the commands sent by the Py4J gateway client are timed as the Java round trips, including the calls made directly
+# on Java objects (getName(), ...). The gateway client is found from the first Java object returned by a bridge function,
+# or can be given to enable()
+#
+# the caches and indexes of java_api (query cache, element index, ...) run on the Python side: they are reported in their
+# own category and not as bridge calls
+
+import atexit
+import inspect
+import json
+import sys
+import time
+
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+
+try:
+    timer = time.perf_counter
+except AttributeError:
+    timer = time.time
+
+class BridgeProfiler():
+    # functions provided by the EASE modules loaded in java_api
+    EASE_FUNCTIONS = [
+        "callQuery", "getSBQuery", "getAvailableSBQueries", "getCapellaVersion", "getLabel", "isSystem", "getLibraries",
+        "eAllContents", "getEClassifier", "create", "getEnumLiteral", "eInverse",
+        "iteratorHasNext", "iteratorNext",
+        "getRepresentationDescriptors", "exportImage", "loadSiriusSession", "getEngineering", "getRepresentedElements",
+        "isVisibleInDocumentation", "isVisibleForTraceability", "isSynchronized", "getStatus", "getReview",
+        "getAllDiagrams", "getDiagrams", "getRepresentingDiagrams", "getContextualElementForDiagrams", "getSession",
+        "startTransaction", "commitTransaction", "rollbackTransaction", "createProgressMonitor",
+    ]
+    # functions resolving the classes of wrappers, constructors are also counted as wrapping
+    WRAPPING_FUNCTIONS = [("EObject", "get_class"), ("EClassResolver", "resolve"), ("EClassResolver", "resolve_by_name"), (None, "wrap_java_objects")]
+    # functions called everywhere without reaching Java
+    SKIPPED_METHODS = ["get_java_object"]
+    # classes of java_api calling Java, the other classes of java_api are the caches and indexes kept on the Python side
+    BRIDGE_CLASSES = ["Sirius", "JavaObject", "JavaIterator", "JavaList"]
+    # functions of java_api only reading or updating the caches and indexes kept on the Python side
+    CACHE_FUNCTIONS = ["get_e_object_session", "index_list_change", "notify_list_change", "capella_query_cache_info", "capella_inverse_index_info"]
+    BRIDGE = "bridge"
+    JAVA = "java"
+    WRAPPING = "wrapping"
+    CACHE = "cache"
+    API = "simplified_api"
+
+    enabled = False
+    json_path = None
+    originals = []
+    stack = []
+    functions = {}
+    call_sites = {}
+    api_methods = {}
+    start_time = None
+    gateway_client = None
+
+    @staticmethod
+    def enable(json_path = "bridge_profile.json", gateway_client = None):
+        """
+        instrument the bridge, wrapping and simplified API functions defined in the __main__ namespace,
+        and the given Py4J gateway client if any
+        """
+        if BridgeProfiler.enabled:
+            return
+        BridgeProfiler.enabled = True
+        BridgeProfiler.json_path = json_path
+        BridgeProfiler.start_time = timer()
+        main = sys.modules["__main__"]
+        if gateway_client is None and getattr(main, "gateway", None) is not None:
+            gateway_client = getattr(main.gateway, "_gateway_client", None)
+        if gateway_client is not None:
+            BridgeProfiler.instrument_gateway(gateway_client)
+        wrapping = set()
+        for owner_name, name in BridgeProfiler.WRAPPING_FUNCTIONS:
+            owner = main if owner_name is None else getattr(main, owner_name, None)
+            if owner is not None and name in owner.__dict__:
+                BridgeProfiler._instrument(owner, name, BridgeProfiler.WRAPPING, name if owner_name is None else owner_name + "." + name)
+                wrapping.add((owner, name))
+        for name in BridgeProfiler.EASE_FUNCTIONS:
+            # the headless runtime provides them as builtins
+            owner = main if name in vars(main) else builtins
+            if callable(vars(owner).get(name)):
+                BridgeProfiler._instrument(owner, name, BridgeProfiler.BRIDGE, name)
+        for name, value in list(vars(main).items()):
+            if inspect.isclass(value):
+                if value is not BridgeProfiler:
+                    BridgeProfiler._instrument_class(value, wrapping)
+            elif (main, name) not in wrapping and name not in BridgeProfiler.SKIPPED_METHODS and BridgeProfiler._get_category(value) == BridgeProfiler.BRIDGE:
+                BridgeProfiler._instrument(main, name, BridgeProfiler.CACHE if name in BridgeProfiler.CACHE_FUNCTIONS else BridgeProfiler.BRIDGE, name)
+        atexit.register(BridgeProfiler._report_at_exit)
+
+    @staticmethod
+    def disable():
+        """
+        restore all the instrumented functions
+        """
+        for owner, name, original in reversed(BridgeProfiler.originals):
+            if original is None:
+                # an instance attribute hiding the method of its class
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+        BridgeProfiler.originals = []
+        BridgeProfiler.gateway_client = None
+        BridgeProfiler.enabled = False
+
+    @staticmethod
+    def instrument_gateway(gateway_client):
+        """
+        time each command sent to Java by the given Py4J gateway client, a command is labelled with the called Java method
+        """
+        if BridgeProfiler.gateway_client is not None:
+            return
+        BridgeProfiler.gateway_client = gateway_client
+        send_command = gateway_client.send_command
+        stack = BridgeProfiler.stack
+        def instrumented(command, *args, **kwargs):
+            entry = [BridgeProfiler.JAVA, BridgeProfiler._get_command_label(command), BridgeProfiler._get_call_site(sys._getframe(1)), 0.0]
+            stack.append(entry)
+            start = timer()
+            try:
+                return send_command(command, *args, **kwargs)
+            finally:
+                elapsed = timer() - start
+                stack.pop()
+                if len(stack) > 0:
+                    stack[-1][3] += elapsed
+                BridgeProfiler._record(entry, elapsed)
+        BridgeProfiler.originals.append((gateway_client, "send_command", None))
+        gateway_client.send_command = instrumented
+
+    @staticmethod
+    def reset():
+        """
+        forget all the collected statistics
+        """
+        BridgeProfiler.functions = {}
+        BridgeProfiler.call_sites = {}
+        BridgeProfiler.api_methods = {}
+        BridgeProfiler.start_time = timer()
+
+    @staticmethod
+    def get_report():
+        """
+        return the collected statistics as a dict
+        """
+        wall_time = timer() - BridgeProfiler.start_time
+        split = {BridgeProfiler.JAVA: 0.0, BridgeProfiler.BRIDGE: 0.0, BridgeProfiler.WRAPPING: 0.0, BridgeProfiler.CACHE: 0.0, BridgeProfiler.API: 0.0}
+        functions = []
+        for (category, name), (calls, total, own) in BridgeProfiler.functions.items():
+            split[category] += own
+            functions.append({"category": category, "name": name, "calls": calls, "total_time": total, "self_time": own})
+        split["user"] = max(0.0, wall_time - sum(split.values()))
+        call_sites = []
+        for (name, site), (calls, total) in BridgeProfiler.call_sites.items():
+            call_sites.append({"name": name, "call_site": site, "calls": calls, "total_time": total})
+        api_methods = []
+        for (method, name), (calls, total) in BridgeProfiler.api_methods.items():
+            api_methods.append({"method": method, "name": name, "calls": calls, "total_time": total})
+        return {
+            "wall_time": wall_time,
+            "split": split,
+            "functions": sorted(functions, key=lambda entry: -entry["self_time"]),
+            "call_sites": sorted(call_sites, key=lambda entry: -entry["total_time"]),
+            "api_methods": sorted(api_methods, key=lambda entry: -entry["total_time"]),
+        }
+
+    @staticmethod
+    def report(limit = 20):
+        """
+        print the report and write it as JSON, return the report
+        """
+        report = BridgeProfiler.get_report()
+        lines = ["Bridge profile: %.3fs wall time" % report["wall_time"]]
+        for category in [BridgeProfiler.JAVA, BridgeProfiler.BRIDGE, BridgeProfiler.WRAPPING, BridgeProfiler.CACHE, BridgeProfiler.API, "user"]:
+            lines.append("  %-16s %9.3fs" % (category, report["split"][category]))
+        lines.append("Functions by self time:")
+        for entry in report["functions"][:limit]:
+            lines.append("  %-10s %-50s %9d calls %9.3fs total %9.3fs self" % (entry["category"], entry["name"], entry["calls"], entry["total_time"], entry["self_time"]))
+        lines.append("Bridge calls by call site:")
+        for entry in report["call_sites"][:limit]:
+            lines.append("  %-30s %-60s %9d calls %9.3fs" % (entry["name"], entry["call_site"], entry["calls"], entry["total_time"]))
+        lines.append("Bridge calls by simplified API method:")
+        for entry in report["api_methods"][:limit]:
+            lines.append("  %-50s %-30s %9d calls %9.3fs" % (entry["method"], entry["name"], entry["calls"], entry["total_time"]))
+        print("\n".join(lines))
+        if BridgeProfiler.json_path is not None:
+            with open(BridgeProfiler.json_path, "w") as json_file:
+                json.dump(report, json_file, indent=2)
+        return report
+
+    @staticmethod
+    def _report_at_exit():
+        if BridgeProfiler.enabled:
+            BridgeProfiler.report()
+
+    @staticmethod
+    def _get_command_label(command):
+        """
+        return the label of a Py4J command: the called method for a call command ("c\\n<target id>\\n<method>\\n..."), its type otherwise
+        """
+        lines = command.split("\n", 3)
+        if lines[0] == "c" and len(lines) > 2:
+            return lines[2]
+        return "command " + lines[0]
+
+    @staticmethod
+    def _get_call_site(frame):
+        """
+        return the file:line of the first frame outside of Py4J
+        """
+        while frame.f_back is not None and "py4j" in frame.f_code.co_filename.replace("\\", "/").split("/"):
+            frame = frame.f_back
+        return frame.f_code.co_filename + ":" + str(frame.f_lineno)
+
+    @staticmethod
+    def _find_gateway(value):
+        """
+        instrument the gateway client of the given value if it is a Py4J Java object
+        """
+        if type(value).__module__.startswith("py4j"):
+            gateway_client = getattr(value, "_gateway_client", None)
+            if gateway_client is not None:
+                BridgeProfiler.instrument_gateway(gateway_client)
+
+    @staticmethod
+    def _get_category(function):
+        """
+        return the category of a function from the folder it is defined in, None for functions outside of Python4Capella APIs
+        """
+        code = getattr(function, "__code__", None)
+        if code is None:
+            return None
+        folders = code.co_filename.replace("\\", "/").split("/")
+        if "java_api" in folders:
+            return BridgeProfiler.BRIDGE
+        elif "simplified_api" in folders or "utilities" in folders:
+            return BridgeProfiler.API
+        return None
+
+    @staticmethod
+    def _instrument_class(cls, wrapping):
+        for name, value in list(cls.__dict__.items()):
+            if (cls, name) in wrapping or name in BridgeProfiler.SKIPPED_METHODS or (name.startswith("__") and name != "__init__"):
+                continue
+            function = value.__func__ if isinstance(value, staticmethod) else value
+            category = BridgeProfiler._get_category(function)
+            # generators run after the call returns: their bridge calls are counted for the caller
+            if category is None or inspect.isgeneratorfunction(function):
+                continue
+            if category == BridgeProfiler.BRIDGE and cls.__name__ not in BridgeProfiler.BRIDGE_CLASSES:
+                category = BridgeProfiler.CACHE
+            elif name == "__init__":
+                category = BridgeProfiler.WRAPPING
+            BridgeProfiler._instrument(cls, name, category, cls.__name__ + "." + name)
+
+    @staticmethod
+    def _instrument(owner, name, category, label):
+        original = owner.__dict__[name]
+        is_static = isinstance(original, staticmethod)
+        function = original.__func__ if is_static else original
+        stack = BridgeProfiler.stack
+        def instrumented(*args, **kwargs):
+            caller = sys._getframe(1)
+            entry = [category, label, caller.f_code.co_filename + ":" + str(caller.f_lineno), 0.0]
+            stack.append(entry)
+            start = timer()
+            try:
+                res = function(*args, **kwargs)
+                if category == BridgeProfiler.BRIDGE and BridgeProfiler.gateway_client is None:
+                    BridgeProfiler._find_gateway(res)
+                return res
+            finally:
+                elapsed = timer() - start
+                stack.pop()
+                if len(stack) > 0:
+                    stack[-1][3] += elapsed
+                BridgeProfiler._record(entry, elapsed)
+        instrumented.__name__ = getattr(function, "__name__", name)
+        instrumented.__doc__ = getattr(function, "__doc__", None)
+        BridgeProfiler.originals.append((owner, name, original))
+        setattr(owner, name, staticmethod(instrumented) if is_static else instrumented)
+
+    @staticmethod
+    def _record(entry, elapsed):
+        category, label, site, children = entry
+        key = (category, label)
+        stats = BridgeProfiler.functions.get(key)
+        if stats is None:
+            stats = BridgeProfiler.functions[key] = [0, 0.0, 0.0]
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] += elapsed - children
+        if category != BridgeProfiler.BRIDGE and category != BridgeProfiler.JAVA:
+            return
+        key = (label, site)
+        stats = BridgeProfiler.call_sites.get(key)
+        if stats is None:
+            stats = BridgeProfiler.call_sites[key] = [0, 0.0]
+        stats[0] += 1
+        stats[1] += elapsed
+        for caller in reversed(BridgeProfiler.stack):
+            if caller[0] == BridgeProfiler.API:
+                key = (caller[1], label)
+                stats = BridgeProfiler.api_methods.get(key)
+                if stats is None:
+                    stats = BridgeProfiler.api_methods[key] = [0, 0.0]
+                stats[0] += 1
+                stats[1] += elapsed
+                break
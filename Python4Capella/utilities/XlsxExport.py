@@ -0,0 +1,144 @@
+# this script defines a streaming xlsx export engine based on the write-only mode of openpyxl
+#
+# usage, after the includes of the simplified API:
+#   include('workspace://Python4Capella/utilities/XlsxExport.py')
+#   export = XlsxExport()
+#   export.add_sheet('Components', [XlsxColumn('Name', lambda pc: pc.get_name(), width = 30, **FRAMED)], pcs)
+#   export.save(xlsx_file_name)
+#
+# the rows are written as they are produced by the given iterable (a generator for instance) and are never kept in memory,
+# the style of the cells of a column is declared once with the column instead of being applied to each cell of a filled sheet
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, Side, colors
+from openpyxl.utils import get_column_letter
+
+# the framed look of the sample exporters: medium borders, text wrapped at the top of the cells and blue headers
+MEDIUM_SIDE = Side(border_style = 'medium')
+FRAMED_BORDER = Border(left = MEDIUM_SIDE, top = MEDIUM_SIDE, right = MEDIUM_SIDE, bottom = MEDIUM_SIDE)
+TOP_WRAPPED_ALIGNMENT = Alignment(wrap_text = True, vertical = 'top')
+HEADER_FONT = Font(color = colors.BLUE)
+FRAMED = {'border': FRAMED_BORDER, 'alignment': TOP_WRAPPED_ALIGNMENT, 'header_font': HEADER_FONT}
+
+class XlsxColumn():
+    """
+    a column of a sheet: its header, how to get the value of its cell from a row and the style of its cells
+    """
+    def __init__(self, header, value = None, width = None, font = None, alignment = None, border = None, number_format = None, header_font = None):
+        """
+        value is a function getting the value of the cell from a row, by default a row is a sequence of values and the cell gets
+        the value at the index of the column. The cells are not styled when no style is given, the header is styled as the
+        other cells of the column with its own font if header_font is given
+        """
+        self.header = header
+        self.value = value
+        self.width = width
+        self.font = font
+        self.alignment = alignment
+        self.border = border
+        self.number_format = number_format
+        self.header_font = header_font
+
+class XlsxExport():
+    """
+    an xlsx file written sheet by sheet in the write-only mode of openpyxl
+    """
+    def __init__(self):
+        self.workbook = Workbook(write_only = True)
+        # (font, alignment, border, number format) -> name of the NamedStyle registered in the workbook
+        self.style_names = {}
+
+    def get_style_name(self, font, alignment, border, number_format):
+        """
+        return the name of the named style with the given font, alignment, border and number format (registered on its first use),
+        None if they are all None
+        """
+        key = (font, alignment, border, number_format)
+        if key == (None, None, None, None):
+            return None
+        res = self.style_names.get(key)
+        if res is None:
+            res = 'XlsxExport ' + str(len(self.style_names) + 1)
+            style = NamedStyle(name = res)
+            if font is not None:
+                style.font = font
+            if alignment is not None:
+                style.alignment = alignment
+            if border is not None:
+                style.border = border
+            if number_format is not None:
+                style.number_format = number_format
+            self.workbook.add_named_style(style)
+            self.style_names[key] = res
+        return res
+
+    @staticmethod
+    def get_value_function(column, index):
+        """
+        return the function getting the value of the given column at the given index from a row
+        """
+        if column.value is not None:
+            return column.value
+        return lambda row: row[index] if index < len(row) else None
+
+    @staticmethod
+    def create_cell(worksheet, style_name):
+        """
+        return the cell of a column of the given write-only worksheet with the given named style, None without style.
+        A write-only worksheet writes the cells of a row as soon as it is appended, so the cell is reused for all the rows
+        """
+        if style_name is None:
+            return None
+        res = WriteOnlyCell(worksheet)
+        res.style = style_name
+        return res
+
+    @staticmethod
+    def get_cell_value(cell, value):
+        """
+        return the value to append to a row for the given cell of a column: the value itself without cell, the cell holding the value otherwise
+        """
+        if cell is None:
+            return value
+        cell.value = value
+        return cell
+
+    def add_sheet(self, title, columns, rows, header = True, conditional_formattings = None):
+        """
+        write a sheet with the given XlsxColumns and a row for each element of the given iterable, consumed while the sheet is written.
+        conditional_formattings maps a range of columns like 'C:E' to a rule applied to the cells of the written rows.
+        return the number of written rows, without the header
+        """
+        worksheet = self.workbook.create_sheet(title)
+        # the column dimensions must be set before the first row in write-only mode
+        for index, column in enumerate(columns, start = 1):
+            if column.width is not None:
+                worksheet.column_dimensions[get_column_letter(index)].width = column.width
+        if header:
+            worksheet.append([XlsxExport.get_cell_value(XlsxExport.create_cell(worksheet, self.get_style_name(column.header_font or column.font, column.alignment, column.border, column.number_format)),
+                                                        column.header) for column in columns])
+        cell_columns = [(XlsxExport.get_value_function(column, index), XlsxExport.create_cell(worksheet, self.get_style_name(column.font, column.alignment, column.border, column.number_format)))
+                        for index, column in enumerate(columns)]
+        get_cell_value = XlsxExport.get_cell_value
+        count = 0
+        try:
+            for row in rows:
+                worksheet.append([get_cell_value(cell, value(row)) for value, cell in cell_columns])
+                count += 1
+        except BaseException:
+            # releases the temporary file of the sheet, the workbook can't be saved after an error
+            worksheet.close()
+            raise
+        first_row = 2 if header else 1
+        last_row = max(first_row, first_row + count - 1)
+        for columns_range, rule in (conditional_formattings or {}).items():
+            first_column, _, last_column = columns_range.partition(':')
+            worksheet.conditional_formatting.add(first_column + str(first_row) + ':' + (last_column or first_column) + str(last_row), rule)
+        return count
+
+    def save(self, path):
+        """
+        write the xlsx file, no sheet can be added after
+        """
+        self.workbook.save(path)